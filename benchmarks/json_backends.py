@@ -0,0 +1,61 @@
+"""Compare registered JSON backends on compound documents.
+
+Run from the repository root with ``python -m benchmarks.json_backends``.
+"""
+import datetime
+import decimal
+import timeit
+import uuid
+
+from flask_jsonapi import json_backends
+
+
+def compound_document(size):
+    authors = [
+        {
+            'type': 'author',
+            'id': str(uuid.uuid4()),
+            'attributes': {'name': 'Author {}'.format(index), 'joined': datetime.datetime(2020, 1, 1)},
+        }
+        for index in range(size // 10 or 1)
+    ]
+    articles = [
+        {
+            'type': 'article',
+            'id': str(uuid.uuid4()),
+            'attributes': {
+                'title': 'Article {}'.format(index),
+                'body': 'Lorem ipsum dolor sit amet. ' * 20,
+                'published': datetime.datetime(2020, 1, 1, 12, 30),
+                'rating': decimal.Decimal('4.25'),
+            },
+            'relationships': {
+                'author': {'data': {'type': 'author', 'id': authors[index % len(authors)]['id']}},
+            },
+            'links': {'self': 'http://localhost/articles/{}'.format(index)},
+        }
+        for index in range(size)
+    ]
+    return {
+        'data': articles,
+        'included': authors,
+        'links': {'self': 'http://localhost/articles/?page[size]={}&page[number]=1'.format(size)},
+        'meta': {'count': size},
+        'jsonapi': {'version': '1.0'},
+    }
+
+
+def main():
+    for size in (10, 100, 1000):
+        document = compound_document(size)
+        encoded = json_backends.get_backend('json').dumps(document)
+        number = max(10000 // size, 5)
+        print('{} resources, {} bytes, {} runs'.format(size, len(encoded), number))
+        for name, backend in sorted(json_backends.backends.items()):
+            dumps = timeit.timeit(lambda: backend.dumps(document), number=number) / number
+            loads = timeit.timeit(lambda: backend.loads(encoded), number=number) / number
+            print('  {:<8} dumps {:8.3f} ms   loads {:8.3f} ms'.format(name, dumps * 1000, loads * 1000))
+
+
+if __name__ == '__main__':
+    main()
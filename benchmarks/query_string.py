@@ -0,0 +1,81 @@
+"""Measure parsing of long JSON:API query strings by all query string parsers of a list view.
+
+Run from the repository root with ``python -m benchmarks.query_string``.
+"""
+import timeit
+
+import flask
+import marshmallow_jsonapi
+
+from marshmallow_jsonapi import fields
+
+from flask_jsonapi import filters_schema
+from flask_jsonapi import query_string
+
+FIELD_NAMES = ['field_{}'.format(index) for index in range(20)]
+
+
+class AuthorSchema(marshmallow_jsonapi.Schema):
+    id = fields.Str()
+    name = fields.Str()
+
+    class Meta:
+        type_ = 'author'
+
+
+ArticleSchema = type('ArticleSchema', (marshmallow_jsonapi.Schema,), {
+    'id': fields.Str(),
+    'author': fields.Relationship(schema=AuthorSchema, type_='author'),
+    'Meta': type('Meta', (), {'type_': 'article'}),
+    **{name: fields.Str() for name in FIELD_NAMES},
+})
+
+
+class ArticleFilterSchema(filters_schema.FilterSchema):
+    class Meta:
+        schema = ArticleSchema
+        fields = FIELD_NAMES
+
+
+def make_query_string(filter_count):
+    parameters = ['filter[{}]=value'.format(FIELD_NAMES[index % len(FIELD_NAMES)]) for index in range(filter_count)]
+    parameters += [
+        'fields[article]=id,author,{}'.format(','.join(FIELD_NAMES)),
+        'fields[author]=id,name',
+        'sort=-{},{}'.format(FIELD_NAMES[0], FIELD_NAMES[1]),
+        'include=author',
+        'page[size]=10',
+        'page[number]=2',
+        'utm_source=newsletter',
+    ]
+    return '?' + '&'.join(parameters)
+
+
+def parse_all(app, url, filter_schema, parsers, pagination):
+    with app.test_request_context(url):
+        filter_schema.parse()
+        for parser in parsers:
+            parser.parse()
+        pagination.parse()
+        pagination.parse_count()
+
+
+def main():
+    app = flask.Flask(__name__)
+    filter_schema = ArticleFilterSchema()
+    parsers = [
+        query_string.SparseFieldsParser(ArticleSchema),
+        query_string.SortParser(ArticleSchema),
+        query_string.IncludeParser(ArticleSchema),
+    ]
+    pagination = query_string.SizeNumberPagination()
+    number = 2000
+    for filter_count in (1, 20, 100):
+        url = make_query_string(filter_count)
+        elapsed = timeit.timeit(lambda: parse_all(app, url, filter_schema, parsers, pagination), number=number)
+        print('{:>3} filters, {:>5} characters: {:8.1f} us per request'.format(
+            filter_count, len(url), elapsed / number * 10 ** 6))
+
+
+if __name__ == '__main__':
+    main()
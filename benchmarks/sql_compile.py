@@ -0,0 +1,89 @@
+"""Compare statement building and SQL compilation of the legacy and ``select()``-based query builders.
+
+Run from the repository root with ``python -m benchmarks.sql_compile``.
+"""
+import datetime
+import timeit
+
+import sqlalchemy
+
+from sqlalchemy import orm
+
+from flask_jsonapi.resource_repositories import sqlalchemy_repositories
+from flask_jsonapi.utils import sqlalchemy_django_query
+from flask_jsonapi.utils import sqlalchemy_select_query
+
+Base = orm.declarative_base()
+
+
+class Blog(Base):
+    __tablename__ = 'blogs'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+
+
+class Entry(Base):
+    __tablename__ = 'entries'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    headline = sqlalchemy.Column(sqlalchemy.String)
+    pub_date = sqlalchemy.Column(sqlalchemy.Date)
+    blog_id = sqlalchemy.Column(sqlalchemy.Integer, sqlalchemy.ForeignKey(Blog.id))
+    blog = orm.relationship(Blog, backref='entries')
+
+
+SHAPES = {
+    'simple filter': lambda index: ({'headline': 'Entry {}'.format(index)}, ('id',), {'size': 10, 'number': 1}),
+    'operators': lambda index: (
+        {'headline__istartswith': 'entry', 'pub_date__gte': datetime.date(2020, 1, index % 28 + 1)},
+        ('-pub_date', 'id'),
+        {'size': 25, 'number': index % 5 + 1},
+    ),
+    'related': lambda index: (
+        {'blog__name__in': ['blog {}'.format(index), 'other'], 'pub_date__year': 2020},
+        ('-blog__name', 'id'),
+        {'size': 10, 'number': 2},
+    ),
+}
+
+
+def make_repository(query_class, session):
+    class EntryRepository(sqlalchemy_repositories.SqlAlchemyModelRepository):
+        model = Entry
+        instance_name = 'entry'
+
+    repository = EntryRepository()
+    repository.session = session
+    repository.query_class = query_class
+    return repository
+
+
+def build_statement(repository, shape, index):
+    filters, sorting, pagination = shape(index)
+    query = repository.apply_filters(repository.get_query(), filters)
+    query = repository.apply_sorts(query, sorting)
+    return repository.apply_pagination(query, pagination).statement
+
+
+def main():
+    engine = sqlalchemy.create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    session = orm.scoped_session(orm.sessionmaker(bind=engine))
+    number = 2000
+    print('{} runs per shape, times per request'.format(number))
+    for shape_name, shape in SHAPES.items():
+        print(shape_name)
+        for query_class in (sqlalchemy_django_query.DjangoQuery, sqlalchemy_select_query.DjangoSelectQuery):
+            repository = make_repository(query_class, session)
+            counter = iter(range(10 ** 9))
+            build = timeit.timeit(lambda: build_statement(repository, shape, next(counter)), number=number) / number
+            compile_ = timeit.timeit(
+                lambda: build_statement(repository, shape, next(counter)).compile(engine), number=number) / number
+            execute = timeit.timeit(
+                lambda: session.execute(build_statement(repository, shape, next(counter))).all(), number=number)
+            print('  {:<18} build {:7.1f} us   build+compile {:7.1f} us   build+execute (cached) {:7.1f} us'.format(
+                query_class.__name__, build * 10 ** 6, compile_ * 10 ** 6, execute / number * 10 ** 6))
+            session.rollback()
+
+
+if __name__ == '__main__':
+    main()
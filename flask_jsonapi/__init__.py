@@ -3,13 +3,19 @@ from .api import Api
 from .filters_schema import FilterField
 from .filters_schema import FilterSchema
 from .filters_schema import ListFilterField
+from .resource_repositories.repositories import AsyncResourceRepository
 from .resource_repositories.repositories import ResourceRepository
+from .resource_repository_views import AsyncResourceRepositoryDetailView
+from .resource_repository_views import AsyncResourceRepositoryListView
+from .resource_repository_views import AsyncResourceRepositoryViewSet
 from .resource_repository_views import ResourceRepositoryDetailView
 from .resource_repository_views import ResourceRepositoryListView
 from .resource_repository_views import ResourceRepositoryViewSet
 from .resources import AllowedActionsResourceDetailMixin
 from .resources import AllowedActionsResourceListMixin
 from .resources import AllowedActionsResourceViewSetMixin
+from .resources import AsyncResourceDetail
+from .resources import AsyncResourceList
 from .resources import ResourceDetail
 from .resources import ResourceList
 
@@ -19,6 +25,12 @@ __all__ = [
     AllowedActionsResourceListMixin,
     AllowedActionsResourceViewSetMixin,
     Api,
+    AsyncResourceDetail,
+    AsyncResourceList,
+    AsyncResourceRepository,
+    AsyncResourceRepositoryDetailView,
+    AsyncResourceRepositoryListView,
+    AsyncResourceRepositoryViewSet,
     FilterField,
     FilterSchema,
     ListFilterField,
@@ -0,0 +1,86 @@
+import collections
+import hashlib
+import http
+import threading
+import zlib
+
+import flask
+
+WBITS = {
+    'gzip': 16 + zlib.MAX_WBITS,
+    'deflate': zlib.MAX_WBITS,
+}
+
+
+class Compressor:
+    """Negotiates ``Accept-Encoding`` and compresses response bodies.
+
+    :param int min_size: bodies smaller than this many bytes are sent uncompressed
+    :param int level: zlib compression level
+    :param int cache_size: number of compressed bodies kept, keyed on the body digest, so repeated responses are not
+        compressed again; ``0`` disables the cache
+    """
+    encodings = ('gzip', 'deflate')
+
+    def __init__(self, *, min_size=500, level=6, cache_size=0):
+        self.min_size = min_size
+        self.level = level
+        self.cache_size = cache_size
+        self._cache = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def compress_response(self, response):
+        response.vary.add('Accept-Encoding')
+        if (response.status_code in (http.HTTPStatus.NO_CONTENT, http.HTTPStatus.NOT_MODIFIED)
+                or 'Content-Encoding' in response.headers):
+            return response
+        encoding = self.negotiate()
+        if encoding is None:
+            return response
+        if response.is_streamed:
+            response.response = self.compress_stream(response.response, encoding)
+            response.headers.pop('Content-Length', None)
+        else:
+            data = response.get_data()
+            if len(data) < self.min_size:
+                return response
+            response.set_data(self.compress(data, encoding))
+            if response.headers.get('ETag'):
+                # The body-independent ETag now describes a different representation.
+                etag, _ = response.get_etag()
+                response.set_etag(etag, weak=True)
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+    def negotiate(self):
+        return flask.request.accept_encodings.best_match(self.encodings)
+
+    def compress(self, data, encoding):
+        if not self.cache_size:
+            return self._compress(data, encoding)
+        key = (encoding, hashlib.sha1(data).digest())
+        with self._lock:
+            compressed = self._cache.get(key)
+            if compressed is not None:
+                self._cache.move_to_end(key)
+                return compressed
+        compressed = self._compress(data, encoding)
+        with self._lock:
+            self._cache[key] = compressed
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return compressed
+
+    def compress_stream(self, chunks, encoding):
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, WBITS[encoding])
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    def _compress(self, data, encoding):
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, WBITS[encoding])
+        return compressor.compress(data) + compressor.flush()
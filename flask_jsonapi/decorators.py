@@ -2,21 +2,38 @@ import functools
 
 import flask
 
+from werkzeug import http as werkzeug_http
+
 from flask_jsonapi import response
 
+SUPPORTED_EXTENSIONS = frozenset([response.ATOMIC_EXTENSION])
+
+
+def is_jsonapi_media_type(value, ignored_params=()):
+    """Check a media type is the JSON:API one, with no parameters but ``ext`` naming supported extensions."""
+    mimetype, params = werkzeug_http.parse_options_header(value)
+    params = {key: param for key, param in params.items() if key not in ignored_params}
+    extensions = params.pop('ext', '').split()
+    is_jsonapi = mimetype.lower() == response.JSONAPI_MEDIA_TYPE
+    return is_jsonapi and not params and SUPPORTED_EXTENSIONS.issuperset(extensions)
+
+
+def accepts_jsonapi_media_type(accept):
+    return any(is_jsonapi_media_type(media_range, ignored_params=('q',)) for media_range in accept.split(','))
+
 
 def check_headers(func):
     @functools.wraps(func)
     def wrapped(*args, **kwargs):
         if flask.request.method in ('POST', 'PATCH'):
-            if flask.request.headers.get('Content-Type') != 'application/vnd.api+json':
+            if not is_jsonapi_media_type(flask.request.headers.get('Content-Type', '')):
                 return response.JsonApiErrorResponse({
                     'source': '',
                     'detail': 'Content-Type header must be application/vnd.api+json',
                     'title': 'InvalidRequestHeader',
                     'status': 415
                 }, status=415).make_response()
-        if flask.request.headers.get('Accept', 'application/vnd.api+json') != 'application/vnd.api+json':
+        if not accepts_jsonapi_media_type(flask.request.headers.get('Accept', response.JSONAPI_MEDIA_TYPE)):
             return response.JsonApiErrorResponse({
                 'source': '',
                 'detail': 'Accept header must be application/vnd.api+json',
@@ -83,6 +83,22 @@ class InvalidPage(BadRequest):
         )
 
 
+class InvalidOperation(BadRequest):
+    title = "Invalid atomic operation."
+
+    def __init__(self, detail, pointer='/atomic:operations', **kwargs):
+        super().__init__(
+            source={'pointer': pointer},
+            detail=detail,
+            **kwargs
+        )
+
+
+class UnsupportedMediaType(JsonApiException):
+    title = "Unsupported media type"
+    status = 415
+
+
 class ObjectNotFound(JsonApiException):
     title = "Object not found"
     status = 404
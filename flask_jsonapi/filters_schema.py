@@ -1,15 +1,18 @@
+import functools
 import re
 
-import flask
-
 from marshmallow import exceptions as ma_exceptions
 from marshmallow_jsonapi import fields as ma_fields
 from marshmallow_jsonapi import schema as ma_schema
 from werkzeug import datastructures
 
 from flask_jsonapi import exceptions
+from flask_jsonapi import query_string
+from flask_jsonapi import schema_metadata
 from flask_jsonapi import utils
 
+FILTER_ATTRIBUTE_PATTERN = re.compile(r'\[(.*?)\]')
+
 
 class Operators:
     EQ = 'eq'
@@ -58,9 +61,25 @@ class FilterField(utils.EqualityMixin):
             return {filter_attribute: value}
 
     def parse_value(self, value):
+        return self.deserialize_value(value, self.type_())
+
+    def deserialize_value(self, value, deserializer):
         if value == '':
             raise ValueError("empty filter value provided ")
-        return self.type_().deserialize(value)
+        return deserializer.deserialize(value)
+
+    def get_value_parser(self):
+        # Subclasses customizing parse_value keep it called for every value.
+        if type(self).parse_value is not FilterField.parse_value:
+            return self.parse_value
+        return functools.partial(self.deserialize_value, deserializer=self.type_())
+
+    def can_be_planned(self):
+        # Subclasses customizing parse or the operator extraction are walked field by field instead.
+        return (
+            type(self).parse is FilterField.parse
+            and type(self)._extract_operator_if_present is FilterField._extract_operator_if_present
+        )
 
     def _extract_operator_if_present(self, remaining_filter_attributes):
         try:
@@ -73,8 +92,8 @@ class FilterField(utils.EqualityMixin):
 
 
 class ListFilterField(FilterField):
-    def parse_value(self, value_string):
-        return [self.type_().deserialize(part) for part in value_string.split(',')]
+    def deserialize_value(self, value_string, deserializer):
+        return [deserializer.deserialize(part) for part in value_string.split(',')]
 
 
 class RelationshipFilterField(FilterField):
@@ -92,6 +111,50 @@ class RelationshipFilterField(FilterField):
         current_processed_filter_path = [*processed_filter_path, current_filter_field_name]
         return filter_field.parse(current_processed_filter_path, remaining_filter_attributes, value)
 
+    def can_be_planned(self):
+        return type(self).parse is RelationshipFilterField.parse
+
+
+class FilterPlan:
+    def __init__(self, filter_attribute, parse_value):
+        self.filter_attribute = filter_attribute
+        self.parse_value = parse_value
+
+    def parse(self, value):
+        try:
+            return {self.filter_attribute: self.parse_value(value)}
+        except ma_exceptions.ValidationError as e:
+            raise ValueError from e
+
+
+def get_filter_plans(filters, key_path=(), attribute_path=()):
+    """Resolve every allowed ``filter[a][b][operator]`` shape of plannable fields into a :class:`FilterPlan`."""
+    plans = {}
+    for name, filter_field in filters.items():
+        if not filter_field.can_be_planned():
+            continue
+        current_key_path = (*key_path, name)
+        current_attribute_path = (*attribute_path, filter_field.attribute or name)
+        if isinstance(filter_field, RelationshipFilterField):
+            plans.update(get_filter_plans(filter_field.fields, current_key_path, current_attribute_path))
+            continue
+        parse_value = filter_field.get_value_parser()
+        filter_attribute = '__'.join(current_attribute_path)
+        if filter_field.default_operator in filter_field.operators:
+            plans[current_key_path] = FilterPlan(
+                format_filter_attribute(filter_attribute, filter_field.default_operator), parse_value)
+        for operator in filter_field.operators:
+            if operator is not None:
+                plans[(*current_key_path, operator)] = FilterPlan(
+                    format_filter_attribute(filter_attribute, operator), parse_value)
+    return plans
+
+
+def format_filter_attribute(filter_attribute, operator):
+    if operator is None:
+        return filter_attribute
+    return '{}__{}'.format(filter_attribute, operator)
+
 
 class FilterSchemaOptions:
     def __init__(self, meta=None):
@@ -106,6 +169,7 @@ class FilterSchemaMeta(type):
         new_class = super().__new__(cls, name, bases, attrs)
         new_class._meta = FilterSchemaOptions(getattr(new_class, 'Meta', None))
         new_class.base_filters = new_class.get_filters()
+        new_class.filter_plans = get_filter_plans(new_class.base_filters)
 
         return new_class
 
@@ -137,7 +201,7 @@ class FilterSchemaBase:
             raise ValueError('`fields` and `schema` attributes must be provided.')
         for field_name in fields:
             attribute = cls.get_model_attribute(schema, field_name)
-            field_cls = utils.get_field_class(schema, field_name)
+            field_cls = cls.get_field_class(schema, field_name)
             filters[field_name] = FilterField(attribute=attribute, type_=field_cls)
         filters.update(cls.declared_filters)
         return filters
@@ -157,15 +221,26 @@ class FilterSchemaBase:
 
     @staticmethod
     def get_model_attribute(schema, field):
-        if utils.is_field_mapped(schema, field):
-            return schema._declared_fields[field].attribute
-        if utils.is_relationship(schema, field) and schema._declared_fields[field].id_field is not None:
-            return '{}__{}'.format(field, schema._declared_fields[field].id_field)
+        metadata = schema_metadata.get_metadata(schema)
+        if field not in metadata.field_names:
+            raise ValueError('{} has no attribute {}'.format(schema.__name__, field))
+        if metadata.declared_attributes[field] is not None:
+            return metadata.declared_attributes[field]
+        relationship = metadata.relationships.get(field)
+        if relationship is not None and relationship.id_field is not None:
+            return '{}__{}'.format(field, relationship.id_field)
         return field
 
+    @staticmethod
+    def get_field_class(schema, field, default=ma_fields.Str):
+        metadata = schema_metadata.get_metadata(schema)
+        if field in metadata.relationships:
+            return default
+        return metadata.field_classes.get(field, default)
+
     def parse(self) -> dict:
         result = {}
-        for key, value in self.request_filters.items(multi=True):
+        for key, value in query_string.get_tokens().filters:
             try:
                 parsed_filter = self._process_filter(key, value)
                 result.update(parsed_filter)
@@ -175,24 +250,21 @@ class FilterSchemaBase:
 
     @property
     def request_filters(self) -> datastructures.MultiDict:
-        return datastructures.MultiDict(
-            [(key, value) for key, value
-             in flask.request.args.items(multi=True)
-             if key.startswith('filter')]
-        )
+        return datastructures.MultiDict(query_string.get_tokens().filters)
 
     def _process_filter(self, key, value):
         filter_attributes = self._extract_filter_attributes(key)
+        plan = self.filter_plans.get(filter_attributes)
+        if plan is not None:
+            return plan.parse(value)
+        # Unknown or invalid shapes are walked field by field to report what is wrong with them.
         current_filter_attribute, *remaining_filter_attribute_path = filter_attributes
         filter_field = self.base_filters[current_filter_attribute]
         current_filter_field_name = filter_field.attribute or current_filter_attribute
         return filter_field.parse([current_filter_field_name], remaining_filter_attribute_path, value)
 
     def _extract_filter_attributes(self, filter_args_key):
-        filter_attribute_regex = r'\[(.*?)\]'
-        attributes = re.findall(filter_attribute_regex, filter_args_key)
-        attributes = map(lambda x: x.replace('-', '_'), attributes)
-        return tuple(attributes)
+        return tuple(attribute.replace('-', '_') for attribute in FILTER_ATTRIBUTE_PATTERN.findall(filter_args_key))
 
 
 class FilterSchema(FilterSchemaBase, metaclass=FilterSchemaMeta):
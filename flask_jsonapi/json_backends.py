@@ -0,0 +1,75 @@
+import datetime
+import decimal
+import json
+import uuid
+
+DEFAULT_BACKEND_NAME = 'json'
+
+
+class JsonBackend:
+    def dumps(self, obj) -> str:
+        raise NotImplementedError
+
+    def dumps_bytes(self, obj) -> bytes:
+        return self.dumps(obj).encode()
+
+    def loads(self, data):
+        raise NotImplementedError
+
+
+def default(obj):
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, (uuid.UUID, decimal.Decimal)):
+        return str(obj)
+    raise TypeError('Object of type {} is not JSON serializable'.format(type(obj).__name__))
+
+
+class StdlibJsonBackend(JsonBackend):
+    def dumps(self, obj):
+        return json.dumps(obj, default=default)
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonJsonBackend(JsonBackend):
+    def __init__(self):
+        import orjson
+        self.orjson = orjson
+        self.options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj):
+        return self.dumps_bytes(obj).decode()
+
+    def dumps_bytes(self, obj):
+        return self.orjson.dumps(obj, default=default, option=self.options)
+
+    def loads(self, data):
+        return self.orjson.loads(data)
+
+
+backends = {}
+default_backend_name = DEFAULT_BACKEND_NAME
+
+
+def register_backend(name, backend: JsonBackend):
+    backends[name] = backend
+
+
+def set_default_backend(name):
+    global default_backend_name
+    if name not in backends:
+        raise ValueError('JSON backend {!r} is not available, choose one of: {}.'.format(name, ', '.join(backends)))
+    default_backend_name = name
+
+
+def get_backend(name=None) -> JsonBackend:
+    return backends[name or default_backend_name]
+
+
+register_backend(DEFAULT_BACKEND_NAME, StdlibJsonBackend())
+try:
+    register_backend('orjson', OrjsonJsonBackend())
+except ImportError:
+    pass
@@ -3,6 +3,8 @@ from .actions import DESTROY_ACTION
 from .actions import LIST_ACTION
 from .actions import READ_ACTION
 from .actions import UPDATE_ACTION
+from .cache import MemoryPermissionCache
+from .cache import PermissionCache
 from .checkers import ObjectLevelPermissionChecker
 from .checkers import PermissionChecker
 from .checkers import PermissionException
@@ -17,6 +19,8 @@ __all__ = [
     DESTROY_ACTION,
     LIST_ACTION,
     PermissionChecker,
+    PermissionCache,
+    MemoryPermissionCache,
     ObjectLevelPermissionChecker,
     PermissionException,
     ProtectedDetailView,
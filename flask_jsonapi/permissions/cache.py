@@ -0,0 +1,83 @@
+import collections
+import threading
+import time
+import typing
+
+MISSING = object()
+
+Key = typing.Tuple[typing.Any, typing.Any, str]
+
+
+class PermissionCache:
+    """Interface of caches of permission decisions keyed by ``(principal, object_id, action)``.
+
+    ``get`` returns ``MISSING`` for unknown keys. ``invalidate`` drops the decisions matching all given parts of the
+    key, e.g. ``invalidate(object_id=parent_id)`` after grants of an object change.
+    """
+
+    def get(self, key: Key):
+        return MISSING
+
+    def set(self, key: Key, allowed: bool):
+        pass
+
+    def invalidate(self, *, principal=MISSING, object_id=MISSING, action=MISSING):
+        pass
+
+    def clear(self):
+        pass
+
+
+class MemoryPermissionCache(PermissionCache):
+    """Process local LRU cache of permission decisions.
+
+    :param int max_size: number of decisions kept, least recently used ones are dropped first
+    :param float ttl: seconds an allowed decision is kept
+    :param float negative_ttl: seconds a denied decision is kept, defaults to ``ttl``; ``0`` disables negative caching
+    """
+
+    def __init__(self, *, max_size=10000, ttl=60.0, negative_ttl=None, clock=time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self.clock = clock
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            allowed, expires_at = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return allowed
+
+    def set(self, key, allowed):
+        ttl = self.ttl if allowed else self.negative_ttl
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (allowed, self.clock() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *, principal=MISSING, object_id=MISSING, action=MISSING):
+        with self._lock:
+            for key in [key for key in self._entries if matches(key, principal, object_id, action)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def matches(key: Key, principal=MISSING, object_id=MISSING, action=MISSING) -> bool:
+    return all(part is MISSING or part == key_part for part, key_part in zip((principal, object_id, action), key))
@@ -2,8 +2,11 @@ import abc
 import http
 import typing
 
+import flask
+
 from flask_jsonapi import exceptions
 from flask_jsonapi.permissions import actions
+from flask_jsonapi.permissions import cache
 
 
 class PermissionException(exceptions.JsonApiException):
@@ -43,6 +46,24 @@ class PermissionChecker(abc.ABC):
         """
         pass
 
+    def get_permission_filters(self, *, action: str) -> typing.Optional[dict]:
+        """
+        Override to limit listed resources with repository filters, e.g. ``{'owner_id': current_user.id}``.
+
+        :param action: action to check
+        :return: filters matching resources the action is allowed on, None when they can't be expressed as filters
+        """
+        return None
+
+    def get_permission_criteria(self, *, action: str) -> typing.Optional[list]:
+        """
+        Override to limit listed resources with criteria of repositories supporting them, e.g. SQLAlchemy predicates.
+
+        :param action: action to check
+        :return: criteria matching resources the action is allowed on, None when they can't be expressed as criteria
+        """
+        return None
+
     def check_list_permission(self, *, resources: typing.List[Resource]) -> typing.List[Resource]:
         """
         :param resources: resources list for which we want to check permissions
@@ -64,16 +85,48 @@ class PermissionChecker(abc.ABC):
         """
         pass
 
+    def check_update_many_permission(self, *, filters: dict, data: dict) -> dict:
+        """
+        Bulk updates don't load resources, so they are denied unless a checker allows them.
+
+        :param filters: filters, including the permission filter, of resources to be updated
+        :param data: new data
+        :return: new data if user has permission, exception in other case
+        """
+        raise PermissionException(detail='Updating resources in bulk is not allowed.')
+
+    def check_destroy_many_permission(self, *, filters: dict) -> dict:
+        """
+        Bulk deletes don't load resources, so they are denied unless a checker allows them.
+
+        :param filters: filters, including the permission filter, of resources to be deleted
+        :return: filters if user has permission, exception in other case
+        """
+        raise PermissionException(detail='Deleting resources in bulk is not allowed.')
+
 
 class ObjectLevelPermissionChecker(PermissionChecker):
     class ObjectIdNotFoundInData(Exception):
         pass
 
+    # Decisions shared between requests, e.g. ``cache.MemoryPermissionCache()``. Decisions are cached per principal,
+    # so it is only used when get_principal identifies the user.
+    permission_cache: typing.Optional[cache.PermissionCache] = None
+    # Decisions are remembered until the end of the request, so e.g. both checks of an update share a lookup.
+    memoize_per_request = True
+
     @property
     @abc.abstractmethod
     def object_id_attribute(self) -> str:
         pass
 
+    def get_principal(self):
+        """Return the identity, e.g. user id, permissions are checked for; a part of permission cache keys.
+
+        Decisions of an unidentified (``None``) principal are never stored in ``permission_cache``.
+        """
+        return None
+
     def check_create_permission(self, *, data: dict) -> dict:
         return self._check_data_permission(data=data, action=actions.CREATE_ACTION)
 
@@ -91,6 +144,14 @@ class ObjectLevelPermissionChecker(PermissionChecker):
     def check_destroy_permission(self, *, resource) -> Resource:
         return self._check_resource_permission(resource=resource, action=actions.DESTROY_ACTION)
 
+    def check_list_permission(self, *, resources: typing.List[Resource]) -> typing.List[Resource]:
+        if type(self).check_read_permission is not ObjectLevelPermissionChecker.check_read_permission:
+            # Customized read checks have to be run for every resource.
+            return super().check_list_permission(resources=resources)
+        object_ids = [self.get_object_id_from_resource(resource) for resource in resources]
+        allowed_object_ids = self.get_allowed_object_ids(object_ids, actions.READ_ACTION)
+        return [resource for resource, object_id in zip(resources, object_ids) if object_id in allowed_object_ids]
+
     def _check_resource_permission(self, *, resource: Resource, action: str) -> Resource:
         object_id = self.get_object_id_from_resource(resource)
         self.check_or_raise(object_id=object_id, action=action)
@@ -111,13 +172,83 @@ class ObjectLevelPermissionChecker(PermissionChecker):
             raise self.ObjectIdNotFoundInData
 
     def check_or_raise(self, *, object_id, action: str):
-        has_permission = self.has_permission(
-            object_id=object_id,
-            action=action,
-        )
-        if not has_permission:
+        if not self.is_allowed(object_id=object_id, action=action):
             raise PermissionException
 
+    def is_allowed(self, *, object_id, action: str) -> bool:
+        key = self.get_cache_key(object_id, action)
+        memo = self.get_request_memo()
+        allowed = self._get_decision(key, memo)
+        if allowed is cache.MISSING:
+            allowed = bool(self.has_permission(object_id=object_id, action=action))
+            self._set_decision(key, allowed, memo)
+        return allowed
+
+    def get_allowed_object_ids(self, object_ids: typing.Iterable, action: str) -> typing.Set:
+        """Return ids of objects the action is allowed on, uncached ones are looked up with one ``has_permissions``."""
+        memo = self.get_request_memo()
+        allowed_object_ids = set()
+        missing_object_ids = []
+        for object_id in dict.fromkeys(object_ids):
+            allowed = self._get_decision(self.get_cache_key(object_id, action), memo)
+            if allowed is cache.MISSING:
+                missing_object_ids.append(object_id)
+            elif allowed:
+                allowed_object_ids.add(object_id)
+        if missing_object_ids:
+            found_object_ids = self.has_permissions(missing_object_ids, action)
+            for object_id in missing_object_ids:
+                allowed = object_id in found_object_ids
+                self._set_decision(self.get_cache_key(object_id, action), allowed, memo)
+                if allowed:
+                    allowed_object_ids.add(object_id)
+        return allowed_object_ids
+
+    def invalidate_permissions(self, *, principal=cache.MISSING, object_id=cache.MISSING, action=cache.MISSING):
+        """Forget cached decisions matching all given key parts, call it whenever grants change."""
+        if self.permission_cache is not None:
+            self.permission_cache.invalidate(principal=principal, object_id=object_id, action=action)
+        memo = self.get_request_memo()
+        for key in [key for key in memo if cache.matches(key, principal, object_id, action)]:
+            del memo[key]
+
+    def get_cache_key(self, object_id, action: str) -> cache.Key:
+        return self.get_principal(), object_id, action
+
+    def get_request_memo(self) -> dict:
+        if not self.memoize_per_request or not flask.has_request_context():
+            return {}
+        return flask.g.setdefault('permission_memos', {}).setdefault(id(self), {})
+
+    def get_shared_cache(self, key) -> typing.Optional[cache.PermissionCache]:
+        principal, _, _ = key
+        return None if principal is None else self.permission_cache
+
+    def _get_decision(self, key, memo):
+        allowed = memo.get(key, cache.MISSING)
+        shared_cache = self.get_shared_cache(key)
+        if allowed is cache.MISSING and shared_cache is not None:
+            allowed = shared_cache.get(key)
+            if allowed is not cache.MISSING:
+                memo[key] = allowed
+        return allowed
+
+    def _set_decision(self, key, allowed, memo):
+        memo[key] = allowed
+        shared_cache = self.get_shared_cache(key)
+        if shared_cache is not None:
+            shared_cache.set(key, allowed)
+
     @abc.abstractmethod
     def has_permission(self, object_id, action) -> bool:
         pass
+
+    def has_permissions(self, object_ids: typing.Iterable, action: str) -> typing.Set:
+        """
+        Override to look up permissions of many objects at once, by default every object is checked separately.
+
+        :param object_ids: unique ids of objects for which we want to check permissions
+        :param action: action to check
+        :return: ids of objects the action is allowed on
+        """
+        return {object_id for object_id in object_ids if self.has_permission(object_id=object_id, action=action)}
@@ -2,7 +2,9 @@ import abc
 import logging
 
 from flask_jsonapi import descriptors
+from flask_jsonapi import exceptions
 from flask_jsonapi import resource_repository_views
+from flask_jsonapi.permissions import actions
 from flask_jsonapi.permissions import checkers
 
 logger = logging.getLogger(__name__)
@@ -21,6 +23,10 @@ class ProtectedDetailViewMixin:
     def protected_read(self, id):
         return super().read(id)
 
+    def get_version(self, id):
+        # Answering with 304 based on the version alone would skip the read permission check.
+        return None
+
     def destroy(self, id):
         resource = self.protected_read(id)
         resource = self.permission_checker.check_destroy_permission(resource=resource)
@@ -45,6 +51,10 @@ class ProtectedListViewMixin(abc.ABC):
 
     def read_many(self, filters: dict, **kwargs):
         filters = self._apply_permission_filter(filters)
+        query_filters = self.get_permission_query_filters()
+        if query_filters is not None:
+            # Permissions are already applied by the repository, so pages and counts stay accurate.
+            return self.protected_read_many(self.merge_permission_query_filters(filters, query_filters), **kwargs)
         resources = self.protected_read_many(filters, **kwargs)
         length_before_permission = len(resources)
         resources = self.permission_checker.check_list_permission(resources=resources)
@@ -52,6 +62,44 @@ class ProtectedListViewMixin(abc.ABC):
             logger.warning('No permission for some items!', extra=kwargs)
         return resources
 
+    def get_count(self, filters: dict, limit=None):
+        filters = self.merge_permission_query_filters(
+            self._apply_permission_filter(filters), self.get_permission_query_filters() or {})
+        return super().get_count(filters, limit=limit)
+
+    def get_version(self, filters):
+        return None
+
+    def get_permission_query_filters(self):
+        """Return filters applying read permissions in the repository query, or None if resources are checked in Python.
+
+        ``get_permission_criteria`` of the checker is only used with repositories supporting criteria.
+        """
+        filters = self.permission_checker.get_permission_filters(action=actions.READ_ACTION)
+        if self.get_permission_criteria() is not None:
+            return filters or {}
+        return filters
+
+    @staticmethod
+    def merge_permission_query_filters(filters, query_filters):
+        """Add permission filters to request filters, rejecting request filters a permission filter would replace."""
+        conflicting = sorted(key for key in filters.keys() & query_filters.keys() if filters[key] != query_filters[key])
+        if conflicting:
+            raise exceptions.InvalidFilters('Filters {} conflict with permissions.'.format(', '.join(conflicting)))
+        return {**filters, **query_filters}
+
+    def get_permission_criteria(self):
+        if not getattr(self.repository, 'supports_criteria', False):
+            return None
+        return self.permission_checker.get_permission_criteria(action=actions.READ_ACTION)
+
+    def get_filtering_kwargs(self):
+        kwargs = super().get_filtering_kwargs()
+        criteria = self.get_permission_criteria()
+        if criteria is not None:
+            kwargs['criteria'] = (*kwargs.get('criteria', ()), *criteria)
+        return kwargs
+
     @abc.abstractmethod
     def _apply_permission_filter(self, filters: dict) -> dict:
         pass
@@ -66,6 +114,29 @@ class ProtectedListViewMixin(abc.ABC):
     def protected_create(self, data: dict, **kwargs):
         return super().create(data, **kwargs)
 
+    def create_many(self, data_list: list, **kwargs):
+        data_list = [self.permission_checker.check_create_permission(data=data) for data in data_list]
+        return self.protected_create_many(data_list, **kwargs)
+
+    def protected_create_many(self, data_list: list, **kwargs):
+        return super().create_many(data_list, **kwargs)
+
+    def update_many(self, filters: dict, data: dict, **kwargs):
+        filters = self._apply_permission_filter(filters)
+        data = self.permission_checker.check_update_many_permission(filters=filters, data=data)
+        return self.protected_update_many(filters, data, **kwargs)
+
+    def protected_update_many(self, filters: dict, data: dict, **kwargs):
+        return super().update_many(filters, data, **kwargs)
+
+    def destroy_many(self, filters: dict):
+        filters = self._apply_permission_filter(filters)
+        filters = self.permission_checker.check_destroy_many_permission(filters=filters)
+        return self.protected_destroy_many(filters)
+
+    def protected_destroy_many(self, filters: dict):
+        return super().destroy_many(filters)
+
 
 class ProtectedDetailView(ProtectedDetailViewMixin, resource_repository_views.ResourceRepositoryDetailView):
     pass
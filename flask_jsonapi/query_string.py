@@ -1,14 +1,65 @@
+import base64
+import binascii
+import datetime
+import decimal
 import itertools
+import json
 import math
 import re
 import typing
+import uuid
 
 import flask
 
 from urllib import parse
 
 from flask_jsonapi import exceptions
-from flask_jsonapi import utils
+from flask_jsonapi import schema_metadata
+
+
+PAGE_PARAMETER_PATTERN = re.compile(r'page\[([^\[\]]+)\]')
+FIELDS_RESOURCE_PATTERN = re.compile(r'fields\[([a-zA-Z0-9\-\_\ ]+)\]')
+FIELDS_VALUE_PATTERN = re.compile(r'([a-zA-Z0-9\-\_\ ]+,?)+')
+QUERY_STRING_TOKENS_KEY = 'flask_jsonapi.query_string_tokens'
+
+
+class QueryStringTokens:
+    """Request arguments classified into JSON:API parameter families in a single pass.
+
+    ``filters`` and ``fields`` keep every ``(key, value)`` pair in order, while ``sort``, ``include`` and the
+    ``page`` parameters keep the first value given, like ``request.args.get`` does.
+    """
+
+    def __init__(self, args):
+        self.filters = []
+        self.fields = []
+        self.sort = None
+        self.include = None
+        self.page = {}
+        for key, value in args.items(multi=True):
+            if key.startswith('filter'):
+                self.filters.append((key, value))
+            elif key.startswith('fields'):
+                self.fields.append((key, value))
+            elif key == 'sort':
+                if self.sort is None:
+                    self.sort = value
+            elif key == 'include':
+                if self.include is None:
+                    self.include = value
+            else:
+                match = PAGE_PARAMETER_PATTERN.fullmatch(key)
+                if match is not None:
+                    self.page.setdefault(match.group(1), value)
+
+
+def get_tokens() -> QueryStringTokens:
+    """Return the tokens of the current request, tokenizing its arguments on first use."""
+    environ = flask.request.environ
+    tokens = environ.get(QUERY_STRING_TOKENS_KEY)
+    if tokens is None:
+        tokens = environ[QUERY_STRING_TOKENS_KEY] = QueryStringTokens(flask.request.args)
+    return tokens
 
 
 class QueryStringParser:
@@ -16,15 +67,33 @@ class QueryStringParser:
         raise NotImplementedError
 
 
+class CountPolicy:
+    EXACT = 'exact'
+    NONE = 'none'
+    CAPPED = 'capped'
+
+
 class Pagination(QueryStringParser):
     def get_links(self, *args, **kwargs):
         raise NotImplementedError
 
+    def parse_count(self) -> bool:
+        count = get_tokens().page.get('count')
+        if count is None:
+            return True
+        if count not in ('true', 'false'):
+            raise exceptions.InvalidPage('page[count] parameter must be true or false.')
+        return count == 'true'
+
+    def get_page(self, objects_list, parsed_pagination):
+        return objects_list
+
 
 class SizeNumberPagination(Pagination):
     def parse(self):
-        size = flask.request.args.get('page[size]')
-        number = flask.request.args.get('page[number]')
+        page = get_tokens().page
+        size = page.get('size')
+        number = page.get('number')
         if size is None and number is None:
             return {}
         elif size is None or number is None:
@@ -37,10 +106,19 @@ class SizeNumberPagination(Pagination):
                 raise exceptions.InvalidPage('Page parameters must be integers.')
             return {'size': size, 'number': number}
 
-    def get_links(self, page_size, current_page, total_count):
-        last_page = math.ceil(total_count / page_size)
+    def get_links(self, page_size, current_page, total_count, page_length=None):
+        """Return pagination links.
+
+        When ``total_count`` is ``None`` there is no ``last`` link, and the ``next`` link is only present when the
+        current page, of ``page_length`` resources, is full.
+        """
         previous_page = current_page - 1 if current_page > 1 else None
-        next_page = current_page + 1 if current_page < last_page else None
+        if total_count is None:
+            last_page = None
+            next_page = current_page + 1 if page_length == page_size else None
+        else:
+            last_page = math.ceil(total_count / page_size)
+            next_page = current_page + 1 if current_page < last_page else None
         return self._format_links(current_page, previous_page, next_page, last_page)
 
     def _format_links(self, current_page, previous_page, next_page, last_page):
@@ -48,13 +126,15 @@ class SizeNumberPagination(Pagination):
         request_args.pop('page[number]')
         base_link = self._get_base_url(request_args)
         format_query_string = base_link + '&page[number]={}'
-        return {
+        links = {
             'self': format_query_string.format(current_page),
             'first': format_query_string.format(1),
             'previous': format_query_string.format(previous_page) if previous_page else None,
             'next': format_query_string.format(next_page) if next_page else None,
-            'last': format_query_string.format(last_page),
         }
+        if last_page is not None:
+            links['last'] = format_query_string.format(last_page)
+        return links
 
     @staticmethod
     def _get_base_url(request_args):
@@ -66,16 +146,134 @@ class SizeNumberPagination(Pagination):
         return '{}?{}'.format(endpoint_url, parse.unquote(parse.urlencode(request_args)))
 
 
+class CursorPagination(Pagination):
+    """Keyset pagination with opaque ``page[after]`` and ``page[before]`` cursors.
+
+    A cursor encodes the values of the active sort fields, followed by ``id``, of the resource it points at.
+    Repositories are asked for one resource more than ``size``, so the next and previous links can be generated
+    without counting all resources.
+    """
+
+    def parse(self):
+        page = get_tokens().page
+        size = page.get('size')
+        after = page.get('after')
+        before = page.get('before')
+        if size is None and after is None and before is None:
+            return {}
+        if size is None:
+            raise exceptions.InvalidPage('page[size] parameter must be specified.')
+        if after is not None and before is not None:
+            raise exceptions.InvalidPage('Only one of page[after] and page[before] parameters can be specified.')
+        try:
+            size = int(size)
+        except ValueError:
+            raise exceptions.InvalidPage('Page size must be an integer.')
+        if size < 1:
+            raise exceptions.InvalidPage('Page size must be positive.')
+        return {
+            'size': size,
+            'after': decode_cursor(after) if after is not None else None,
+            'before': decode_cursor(before) if before is not None else None,
+        }
+
+    def get_page(self, objects_list, parsed_pagination):
+        if not parsed_pagination or len(objects_list) <= parsed_pagination['size']:
+            return objects_list
+        if parsed_pagination['before'] is not None:
+            return objects_list[-parsed_pagination['size']:]
+        return objects_list[:parsed_pagination['size']]
+
+    def get_links(self, objects_list, parsed_pagination, sorting):
+        page = self.get_page(objects_list, parsed_pagination)
+        has_more = len(objects_list) > len(page)
+        if parsed_pagination['before'] is not None:
+            previous_object = page[0] if page and has_more else None
+            next_object = page[-1] if page else None
+        else:
+            previous_object = page[0] if page and parsed_pagination['after'] is not None else None
+            next_object = page[-1] if page and has_more else None
+        cursor_fields = [field for field, _ in get_cursor_fields(sorting)]
+        return self._format_links(
+            previous_cursor=self.get_cursor(previous_object, cursor_fields) if previous_object else None,
+            next_cursor=self.get_cursor(next_object, cursor_fields) if next_object else None,
+        )
+
+    def get_cursor(self, obj, cursor_fields):
+        return encode_cursor([getattr(obj, field) for field in cursor_fields])
+
+    def _format_links(self, previous_cursor, next_cursor):
+        request_args = flask.request.args.copy()
+        current_cursors = [
+            '&{}={}'.format(key, request_args.pop(key))
+            for key in ('page[after]', 'page[before]') if key in request_args
+        ]
+        base_link = SizeNumberPagination._get_base_url(request_args)
+        return {
+            'self': base_link + ''.join(current_cursors),
+            'first': base_link,
+            'previous': '{}&page[before]={}'.format(base_link, previous_cursor) if previous_cursor else None,
+            'next': '{}&page[after]={}'.format(base_link, next_cursor) if next_cursor else None,
+        }
+
+
+def get_cursor_fields(sorting) -> typing.List[typing.Tuple[str, bool]]:
+    """Return ``(field, descending)`` pairs a cursor is made of, with ``id`` as the tiebreaker."""
+    cursor_fields = [(field.lstrip('-'), field.startswith('-')) for field in sorting or ()]
+    if 'id' not in {field for field, _ in cursor_fields}:
+        cursor_fields.append(('id', False))
+    return cursor_fields
+
+
+CURSOR_VALUE_TYPES = {
+    'datetime': (datetime.datetime, datetime.datetime.fromisoformat),
+    'date': (datetime.date, datetime.date.fromisoformat),
+    'time': (datetime.time, datetime.time.fromisoformat),
+    'decimal': (decimal.Decimal, decimal.Decimal),
+    'uuid': (uuid.UUID, uuid.UUID),
+}
+
+
+def encode_cursor(values) -> str:
+    encoded_values = []
+    for value in values:
+        for tag, (type_, _) in CURSOR_VALUE_TYPES.items():
+            if isinstance(value, type_):
+                value = {tag: value.isoformat() if hasattr(value, 'isoformat') else str(value)}
+                break
+        encoded_values.append(value)
+    encoded = json.dumps(encoded_values, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(encoded).decode().rstrip('=')
+
+
+def decode_cursor(cursor) -> list:
+    try:
+        encoded_values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        if not isinstance(encoded_values, list):
+            raise ValueError
+        values = []
+        for value in encoded_values:
+            if isinstance(value, dict):
+                (tag, encoded_value), = value.items()
+                value = CURSOR_VALUE_TYPES[tag][1](encoded_value)
+            values.append(value)
+        return values
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise exceptions.InvalidPage('Invalid pagination cursor.')
+
+
 class IncludeParser:
     def __init__(self, schema):
         self.schema = schema
 
     def parse(self):
-        include_parameter = flask.request.args.get('include')
+        include_parameter = get_tokens().include
         if include_parameter:
             include_fields = tuple(include_parameter.replace('-', '_').split(','))
+            metadata = schema_metadata.get_metadata(self.schema)
             try:
-                self.schema().check_relations(include_fields)
+                for include_field in include_fields:
+                    metadata.check_include_path(include_field)
             except ValueError as exc:
                 raise exceptions.InvalidInclude(detail=str(exc))
             return include_fields
@@ -97,19 +295,16 @@ class SparseFieldsParser:
         for key, value in self.get_request_fields():
             resource = self.extract_resource(key)
             fields = self.extract_fields(value)
-            if resource == self.schema.opts.type_:
+            if resource == schema_metadata.get_metadata(self.schema).type_:
                 yield fields
             else:
                 yield self.format_resource_paths(resource, fields)
 
     def get_request_fields(self):
-        for key, value in flask.request.args.items(multi=True):
-            if key.startswith('fields'):
-                yield key, value
+        return get_tokens().fields
 
     def extract_resource(self, key):
-        resource_regex = r'fields\[([a-zA-Z0-9\-\_\ ]+)\]'
-        match = re.fullmatch(resource_regex, key)
+        match = FIELDS_RESOURCE_PATTERN.fullmatch(key)
         if match is None:
             raise exceptions.InvalidField(detail=key)
         resource = match.group(1)
@@ -117,8 +312,7 @@ class SparseFieldsParser:
         return resource
 
     def extract_fields(self, value):
-        fields_regex = r'([a-zA-Z0-9\-\_\ ]+,?)+'
-        match = re.fullmatch(fields_regex, value)
+        match = FIELDS_VALUE_PATTERN.fullmatch(value)
         if match is None:
             raise exceptions.InvalidField(detail=value)
         fields = value.replace('-', '_').split(',')
@@ -133,17 +327,19 @@ class SortParser(QueryStringParser):
         self.schema = schema
 
     def parse(self) -> typing.Tuple[str]:
-        sort_fields = flask.request.args.get('sort')
+        sort_fields = get_tokens().sort
         if not sort_fields:
             return tuple()
         return tuple(self.get_model_sort_field(sort_field) for sort_field in sort_fields.split(','))
 
     def get_model_sort_field(self, sort_field) -> str:
         field_name = sort_field.replace('-', '')
-        if not utils.field_exist(self.schema, field_name):
+        metadata = schema_metadata.get_metadata(self.schema)
+        field = metadata.sort_fields.get(field_name)
+        if field is None:
+            if field_name in metadata.relationships:
+                raise exceptions.InvalidSort(
+                    "You can't sort on {} because it is a relationship field".format(field_name))
             raise exceptions.InvalidSort("{} has no attribute {}".format(self.schema.__name__, field_name))
-        if utils.is_relationship(self.schema, field_name):
-            raise exceptions.InvalidSort("You can't sort on {} because it is a relationship field".format(field_name))
-        field = utils.get_model_field(self.schema, field_name)
         field = '-{}'.format(field) if sort_field.startswith('-') else field
         return field
@@ -0,0 +1,186 @@
+import logging
+
+from sqlalchemy import exc
+from sqlalchemy import func
+from sqlalchemy.orm import exc as orm_exc
+
+from flask_jsonapi.exceptions import ForbiddenError
+from flask_jsonapi.resource_repositories import repositories
+from flask_jsonapi.resource_repositories import sqlalchemy_repositories
+from flask_jsonapi.utils import sqlalchemy_select_query
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSqlAlchemyModelRepository(sqlalchemy_repositories.SqlAlchemyQueryMixin,
+                                     repositories.AsyncResourceRepository):
+    """``SqlAlchemyModelRepository`` on top of an ``async_scoped_session``.
+
+    Queries are built exactly like in the synchronous repository. Lazy loading is not available with ``AsyncSession``,
+    so included relationships are eager loaded by default.
+    """
+    query_class = sqlalchemy_select_query.AsyncDjangoSelectQuery
+    eager_load_includes = True
+
+    async def create(self, data, strategy='commit', **kwargs):
+        obj = self.build(data)
+        self.session.add(obj)
+        try:
+            await self._run_session_strategy(strategy)
+            return obj
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='{} could not be created.'.format(self.instance_name.capitalize()))
+
+    async def create_many(self, data_list, strategy='commit', **kwargs):
+        try:
+            statement = self.get_bulk_insert_statement(data_list)
+            if statement is not None:
+                objects = (await self.session.scalars(statement, data_list)).all()
+            else:
+                objects = [self.build(data) for data in data_list]
+                self.session.add_all(objects)
+                await self.session.flush()
+            await self._run_session_strategy(strategy)
+            return objects
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            await self.session.rollback()
+            raise ForbiddenError(detail='{} list could not be created.'.format(self.instance_name.capitalize()))
+
+    async def get_list(self, filters=None, sorting=None, pagination=None, include=None, fields=None, criteria=None):
+        try:
+            query = self.get_query()
+            query = self.apply_include(query, include)
+            query = self.apply_fields(query, fields)
+            query = self.apply_filters(query, filters)
+            query = self.apply_criteria(query, criteria)
+            if self.is_cursor_pagination(pagination):
+                return await self.get_cursor_page(query, sorting, pagination)
+            query = self.apply_sorts(query, sorting)
+            if self.count_with_window and self.is_page_pagination(pagination):
+                return await self.get_page_with_count(query, pagination)
+            query = self.apply_pagination(query, pagination)
+            return await query.all()
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='Error while getting {} list.'.format(self.instance_name))
+
+    async def get_page_with_count(self, query, pagination):
+        if self.supports_window_functions is None:
+            connection = await self.get_read_session().connection()
+            self.supports_window_functions = self.dialect_supports_window_functions(connection.dialect)
+        if self.supports_window_functions:
+            counted_query = query.add_columns(func.count().over().label('total_count'))
+            rows = await self.apply_pagination(counted_query, pagination).all()
+            if rows:
+                return repositories.CountedList((row[0] for row in rows), total_count=rows[0].total_count)
+            return repositories.CountedList()
+        return await self.apply_pagination(query, pagination).all()
+
+    async def get_cursor_page(self, query, sorting, pagination):
+        before = pagination.get('before')
+        objects = await self.apply_cursor_pagination(query, sorting, pagination).all()
+        if before is not None:
+            objects.reverse()
+        return objects
+
+    async def get_detail(self, id, include=None, fields=None):
+        try:
+            query = self.apply_fields(self.apply_include(self.get_query(), include), fields)
+            return await query.filter(self.model.id == id).one()
+        except orm_exc.NoResultFound:
+            raise self.object_not_found(id)
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='Error while getting {} details.'.format(self.instance_name))
+
+    async def delete(self, id, strategy='commit'):
+        statement = self.get_delete_statement(id)
+        if statement is None:
+            return await self.delete_instance(await self.get_detail(id), strategy=strategy)
+        try:
+            if not (await self.session.execute(statement)).rowcount:
+                raise self.object_not_found(id)
+            await self._run_session_strategy(strategy)
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='Error while deleting {}.'.format(self.instance_name))
+
+    async def delete_instance(self, obj, strategy='commit'):
+        try:
+            await self.session.delete(obj)
+            await self._run_session_strategy(strategy)
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='Error while deleting {}.'.format(self.instance_name))
+
+    async def update(self, data, strategy='commit', **kwargs):
+        statement = self.get_update_statement(data['id'], data)
+        if statement is None:
+            return await self.update_instance(await self.get_detail(data['id']), data, strategy=strategy, **kwargs)
+        try:
+            obj = self.get_updated_object(data['id'], statement, await self.session.execute(statement))
+            await self._run_session_strategy(strategy)
+            return obj
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='Error while updating {}.'.format(self.instance_name))
+
+    async def update_instance(self, obj, data, strategy='commit', **kwargs):
+        for key, value in data.items():
+            self.update_attribute(obj, key, value)
+        try:
+            await self._run_session_strategy(strategy)
+            return obj
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='Error while updating {}.'.format(self.instance_name))
+
+    async def update_many(self, filters, data, strategy='commit', **kwargs):
+        try:
+            count = (await self.session.execute(self.get_update_many_statement(filters, data))).rowcount
+            await self._run_session_strategy(strategy)
+            return count
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='Error while updating {} list.'.format(self.instance_name))
+
+    async def delete_many(self, filters, strategy='commit'):
+        try:
+            count = (await self.session.execute(self.get_delete_many_statement(filters))).rowcount
+            await self._run_session_strategy(strategy)
+            return count
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='Error while deleting {} list.'.format(self.instance_name))
+
+    async def _run_session_strategy(self, strategy):
+        self.session_router.mark_write()
+        if strategy == 'commit':
+            await self.session.commit()
+        if strategy == 'flush':
+            await self.session.flush()
+
+    async def get_detail_version(self, id):
+        if self.version_column is None:
+            return None
+        try:
+            return (await self.get_read_session().execute(self.get_detail_version_statement(id))).scalar()
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='Error while getting {} version.'.format(self.instance_name))
+
+    async def get_list_version(self, filters=None):
+        if self.version_column is None:
+            return None
+        try:
+            result = await self.get_read_session().execute(self.get_list_version_statement(filters))
+            latest_version, count = result.one()
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='Error while getting {} list version.'.format(self.instance_name))
+        return '{}:{}'.format(latest_version, count)
+
+    async def get_count(self, filters=None, limit=None, criteria=None):
+        return (await self.get_read_session().execute(self.get_count_statement(filters, limit, criteria))).scalar()
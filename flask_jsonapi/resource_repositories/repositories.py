@@ -1,27 +1,117 @@
+from contextlib import asynccontextmanager
 from contextlib import contextmanager
 
 from flask_jsonapi import exceptions
 
 
+class CountedList(list):
+    """Page of resources which also carries the total count of resources matching the query."""
+
+    def __init__(self, resources=(), total_count=None):
+        super().__init__(resources)
+        self.total_count = total_count
+
+
 class ResourceRepository:
     def create(self, data, **kwargs):
         raise exceptions.NotImplementedMethod('Creating is not implemented.')
 
-    def get_list(self, filters=None, sorting=None, pagination=None):
+    def create_many(self, data_list, **kwargs):
+        raise exceptions.NotImplementedMethod('Bulk creating is not implemented.')
+
+    # When enabled, views pass model attribute paths of included relationships to get_list and get_detail.
+    eager_load_includes = False
+    # When enabled, views pass sparse fieldsets, grouped by model relationship path, to get_list and get_detail.
+    load_only_sparse_fields = False
+    # When enabled, views may pass criteria (e.g. permission predicates) to get_list and get_count.
+    supports_criteria = False
+    # When enabled, views pass instances already loaded during the request to update_instance and delete_instance.
+    supports_instances = False
+
+    def get_list(self, filters=None, sorting=None, pagination=None, include=None, fields=None, criteria=None):
         raise exceptions.NotImplementedMethod('Getting list is not implemented.')
 
-    def get_detail(self, id):
+    def get_detail(self, id, include=None, fields=None):
         raise exceptions.NotImplementedMethod('Getting object is not implemented.')
 
     def delete(self, id):
         raise exceptions.NotImplementedMethod('Deleting is not implemented')
 
+    def delete_instance(self, instance, **kwargs):
+        return self.delete(instance.id, **kwargs)
+
     def update(self, data, **kwargs):
         raise exceptions.NotImplementedMethod('Updating is not implemented')
 
-    def get_count(self, filters=None):
+    def update_instance(self, instance, data, **kwargs):
+        return self.update(data, **kwargs)
+
+    def update_many(self, filters, data, **kwargs):
+        raise exceptions.NotImplementedMethod('Bulk updating is not implemented')
+
+    def delete_many(self, filters, **kwargs):
+        raise exceptions.NotImplementedMethod('Bulk deleting is not implemented')
+
+    def get_count(self, filters=None, limit=None, criteria=None):
         raise NotImplementedError
 
+    def get_detail_version(self, id):
+        return None
+
+    def get_list_version(self, filters=None):
+        return None
+
     @contextmanager
     def begin_transaction(self):
         yield
+
+
+class AsyncResourceRepository:
+    """Counterpart of ``ResourceRepository`` for async views, every method is a coroutine."""
+    eager_load_includes = False
+    load_only_sparse_fields = False
+    supports_criteria = False
+    supports_instances = False
+
+    async def create(self, data, **kwargs):
+        raise exceptions.NotImplementedMethod('Creating is not implemented.')
+
+    async def create_many(self, data_list, **kwargs):
+        raise exceptions.NotImplementedMethod('Bulk creating is not implemented.')
+
+    async def get_list(self, filters=None, sorting=None, pagination=None, include=None, fields=None, criteria=None):
+        raise exceptions.NotImplementedMethod('Getting list is not implemented.')
+
+    async def get_detail(self, id, include=None, fields=None):
+        raise exceptions.NotImplementedMethod('Getting object is not implemented.')
+
+    async def delete(self, id):
+        raise exceptions.NotImplementedMethod('Deleting is not implemented')
+
+    async def delete_instance(self, instance, **kwargs):
+        return await self.delete(instance.id, **kwargs)
+
+    async def update(self, data, **kwargs):
+        raise exceptions.NotImplementedMethod('Updating is not implemented')
+
+    async def update_instance(self, instance, data, **kwargs):
+        return await self.update(data, **kwargs)
+
+    async def update_many(self, filters, data, **kwargs):
+        raise exceptions.NotImplementedMethod('Bulk updating is not implemented')
+
+    async def delete_many(self, filters, **kwargs):
+        raise exceptions.NotImplementedMethod('Bulk deleting is not implemented')
+
+    async def get_count(self, filters=None, limit=None, criteria=None):
+        raise NotImplementedError
+
+    async def get_detail_version(self, id):
+        return None
+
+    async def get_list_version(self, filters=None):
+        return None
+
+    @asynccontextmanager
+    async def begin_transaction(self):
+        yield
@@ -0,0 +1,61 @@
+import contextlib
+import contextvars
+import functools
+import time
+
+import flask
+
+SAFE_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+forced_primary = contextvars.ContextVar('forced_primary', default=False)
+
+
+@contextlib.contextmanager
+def primary():
+    """Route every read made within the block to the primary database."""
+    token = forced_primary.set(True)
+    try:
+        yield
+    finally:
+        forced_primary.reset(token)
+
+
+def primary_view(view):
+    """Decorate a view, e.g. with ``view_decorators`` of a view set, so all its reads use the primary database."""
+    @functools.wraps(view)
+    def wrapped(*args, **kwargs):
+        with primary():
+            return view(*args, **kwargs)
+    return wrapped
+
+
+class SessionRouter:
+    """Decides whether reads of repositories with a read replica may use it.
+
+    Replicas only serve reads of ``GET``, ``HEAD`` and ``OPTIONS`` requests, so objects loaded for writes always belong
+    to the primary session. A write also sends the following reads of the request to the primary database and, with
+    ``read_your_writes_window`` set, reads of the same client for that many seconds, tracked in the Flask session.
+
+    :param float read_your_writes_window: seconds reads of a client stay on the primary database after its write
+    """
+    session_key = 'jsonapi_primary_until'
+
+    def __init__(self, *, read_your_writes_window=0, clock=time.time):
+        self.read_your_writes_window = read_your_writes_window
+        self.clock = clock
+
+    def use_replica(self) -> bool:
+        if forced_primary.get() or not flask.has_request_context():
+            return False
+        if flask.request.method not in SAFE_METHODS or flask.g.get('jsonapi_written', False):
+            return False
+        if self.read_your_writes_window:
+            return flask.session.get(self.session_key, 0) <= self.clock()
+        return True
+
+    def mark_write(self):
+        if not flask.has_request_context():
+            return
+        flask.g.jsonapi_written = True
+        if self.read_your_writes_window:
+            flask.session[self.session_key] = self.clock() + self.read_your_writes_window
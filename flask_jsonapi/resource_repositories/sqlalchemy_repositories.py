@@ -1,22 +1,325 @@
 import logging
 
+from sqlalchemy import and_
+from sqlalchemy import delete
 from sqlalchemy import exc
+from sqlalchemy import false
 from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import inspect
+from sqlalchemy import literal
+from sqlalchemy import or_
+from sqlalchemy import orm
+from sqlalchemy import select
+from sqlalchemy import tuple_
+from sqlalchemy import update
 from sqlalchemy.orm import exc as orm_exc
 
 from flask_jsonapi import exceptions
+from flask_jsonapi import query_string
 from flask_jsonapi.exceptions import ForbiddenError
 from flask_jsonapi.resource_repositories import repositories
+from flask_jsonapi.resource_repositories import routing
 from flask_jsonapi.utils import sqlalchemy_django_query
 
 logger = logging.getLogger(__name__)
 
 
-class SqlAlchemyModelRepository(repositories.ResourceRepository):
+class SqlAlchemyQueryMixin:
+    """Builds queries and statements for a model, shared by synchronous and asynchronous repositories."""
     model = None
     session = None
+    # Scoped session of a read replica, used for reads session_router allows it for.
+    read_session = None
+    session_router = routing.SessionRouter()
+    query_class = sqlalchemy_django_query.DjangoQuery
     instance_name = 'model instance'
     filter_methods_map = {}
+    version_column = None
+    count_with_window = False
+    # None means it is decided from the dialect and server version on the first windowed query.
+    supports_window_functions = None
+    # Minimal server versions with window functions, other dialects are expected to support them.
+    window_functions_versions = {'sqlite': (3, 25), 'postgresql': (8, 4), 'mysql': (8, 0), 'mariadb': (10, 2)}
+    eager_load_includes = False
+    load_only_sparse_fields = False
+    supports_criteria = True
+    supports_instances = True
+    # Update column attributes with a single UPDATE ... WHERE id statement instead of loading the object first.
+    direct_updates = False
+    # Delete with a single DELETE ... WHERE id statement, ORM cascades don't run so they have to be ON DELETE ones.
+    direct_deletes = False
+    default_loading_strategy = 'selectin'
+    loading_strategies = {}
+
+    def dialect_supports_window_functions(self, dialect):
+        name = 'mariadb' if getattr(dialect, 'is_mariadb', False) else dialect.name
+        minimal_version = self.window_functions_versions.get(name)
+        if minimal_version is None:
+            return True
+        version = dialect.dbapi.sqlite_version_info if name == 'sqlite' else dialect.server_version_info
+        supported = version is not None and tuple(version[:len(minimal_version)]) >= minimal_version
+        if not supported:
+            logger.warning('Window functions are not supported, total count will be queried separately.')
+        return supported
+
+    def get_query(self):
+        return self.query_class(self.model, session=self.get_read_session()())
+
+    def get_read_session(self):
+        if self.read_session is not None and self.session_router.use_replica():
+            return self.read_session
+        return self.session
+
+    def apply_filters(self, query, filters):
+        filters = filters or {}
+        filters = filters.copy()
+        for filter, filter_method in self.filter_methods_map.items():
+            if filter in filters:
+                value = filters.pop(filter)
+                query = query.filter(filter_method(value))
+        query = query.filter_by(**filters)
+        return query
+
+    @staticmethod
+    def apply_criteria(query, criteria):
+        return query.filter(*criteria) if criteria else query
+
+    def apply_include(self, query, include):
+        options = [self.get_loader_option(path) for path in include or ()]
+        options = [option for option in options if option is not None]
+        return query.options(*options) if options else query
+
+    def get_loader_option(self, path):
+        """Build a loader option for a dotted relationship path.
+
+        The loading strategy (``selectin``, ``joined`` or ``subquery``) of every step is looked up by its path in
+        ``loading_strategies``, falling back to ``default_loading_strategy``.
+        """
+        option = None
+        entity = self.model
+        attribute_names = path.split('.')
+        for index, attribute_name in enumerate(attribute_names):
+            attribute = getattr(entity, attribute_name, None)
+            if not isinstance(getattr(attribute, 'property', None), orm.RelationshipProperty):
+                break
+            strategy = self.loading_strategies.get(
+                '.'.join(attribute_names[:index + 1]), self.default_loading_strategy)
+            loader_name = '{}load'.format(strategy)
+            option = getattr(orm, loader_name)(attribute) if option is None else getattr(option, loader_name)(attribute)
+            entity = attribute.property.mapper.class_
+        return option
+
+    def apply_fields(self, query, fields):
+        options = [self.get_load_only_option(path, attribute_names) for path, attribute_names in (fields or {}).items()]
+        options = [option for option in options if option is not None]
+        return query.options(*options) if options else query
+
+    def get_load_only_option(self, path, attribute_names):
+        """Restrict the columns loaded for the entity at a dotted relationship path ('' for the model itself).
+
+        Primary key and foreign key columns are always loaded, so identity and relationship linkage keep working.
+        """
+        option = None
+        entity = self.model
+        for attribute_name in path.split('.') if path else ():
+            attribute = getattr(entity, attribute_name, None)
+            if not isinstance(getattr(attribute, 'property', None), orm.RelationshipProperty):
+                return None
+            option = orm.defaultload(attribute) if option is None else option.defaultload(attribute)
+            entity = attribute.property.mapper.class_
+        mapper = inspect(entity)
+        columns = [
+            getattr(entity, column_property.key) for column_property in mapper.column_attrs
+            if column_property.key in attribute_names
+            or any(column.primary_key or column.foreign_keys for column in column_property.columns)
+        ]
+        return orm.load_only(*columns) if option is None else option.load_only(*columns)
+
+    def apply_pagination(self, query, pagination):
+        pagination = pagination or {}
+        size = pagination.get('size')
+        number = pagination.get('number')
+        if size is not None and number is not None:
+            return query.limit(size).offset(size * (number - 1))
+        else:
+            return query
+
+    @staticmethod
+    def is_page_pagination(pagination):
+        return bool(pagination) and pagination.get('size') is not None and pagination.get('number') is not None
+
+    @staticmethod
+    def is_cursor_pagination(pagination):
+        return bool(pagination) and ('after' in pagination or 'before' in pagination)
+
+    def apply_cursor_pagination(self, query, sorting, pagination):
+        before = pagination.get('before')
+        cursor = before if before is not None else pagination.get('after')
+        keys = [
+            (self.get_cursor_column(field), descending != (before is not None))
+            for field, descending in query_string.get_cursor_fields(sorting)
+        ]
+        if cursor is not None:
+            if len(cursor) != len(keys):
+                raise exceptions.InvalidPage('Pagination cursor does not match the sort fields.')
+            query = query.filter(self.get_seek_predicate(keys, cursor))
+        query = query.order_by(*(
+            ordering for column, descending in keys for ordering in self.get_cursor_ordering(column, descending)
+        ))
+        return query.limit(pagination['size'] + 1)
+
+    def get_cursor_column(self, field):
+        column = getattr(self.model, field, None)
+        if '__' in field or not isinstance(getattr(column, 'property', None), orm.ColumnProperty):
+            raise exceptions.InvalidSort("Can't paginate with a cursor when sorting by {}.".format(field))
+        return column
+
+    @staticmethod
+    def is_nullable_column(column):
+        return getattr(column.expression, 'nullable', True)
+
+    @classmethod
+    def get_cursor_ordering(cls, column, descending):
+        """Order by a cursor column, placing ``NULL`` values after all other values like a largest value."""
+        ordering = [column.desc() if descending else column.asc()]
+        if cls.is_nullable_column(column):
+            ordering.insert(0, column.is_(None).desc() if descending else column.is_(None).asc())
+        return ordering
+
+    @classmethod
+    def get_seek_predicate(cls, keys, cursor):
+        directions = {descending for _, descending in keys}
+        if len(directions) == 1 and not any(cls.is_nullable_column(column) for column, _ in keys):
+            values = [literal(value, column.type) for (column, _), value in zip(keys, cursor)]
+            columns = tuple_(*(column for column, _ in keys))
+            return columns < tuple_(*values) if directions.pop() else columns > tuple_(*values)
+        return or_(*(
+            and_(
+                *(cls.get_cursor_equality(keys[previous][0], cursor[previous]) for previous in range(index)),
+                cls.get_cursor_inequality(column, descending, value),
+            )
+            for index, ((column, descending), value) in enumerate(zip(keys, cursor))
+        ))
+
+    @staticmethod
+    def get_cursor_equality(column, value):
+        return column.is_(None) if value is None else column == literal(value, column.type)
+
+    @staticmethod
+    def get_cursor_inequality(column, descending, value):
+        """Match values of a cursor column after ``value``, with ``NULL`` sorted as the largest value."""
+        if value is None:
+            return column.is_not(None) if descending else false()
+        if descending:
+            return column < literal(value, column.type)
+        return or_(column > literal(value, column.type), column.is_(None))
+
+    def apply_sorts(self, query, sorting):
+        sorting = sorting or []
+        try:
+            query = query.order_by(*sorting)
+        except exc.InvalidRequestError:
+            raise exceptions.InvalidSort("Invalid sort fields for {}".format(self.instance_name))
+        return query
+
+    def build(self, kwargs):
+        return self.model(**kwargs)
+
+    def get_bulk_insert_statement(self, data_list):
+        """Return an ``INSERT ... RETURNING`` statement creating all rows at once, or ``None`` when it can't be used.
+
+        Rows are only inserted in bulk when every key is a column attribute, ``build`` is not customized and the
+        dialect returns rows of an executemany in parameter order, otherwise they are built one by one and flushed by
+        the unit of work.
+        """
+        dialect = self.session.get_bind().dialect
+        if not data_list or not dialect.insert_executemany_returning_sort_by_parameter_order:
+            return None
+        if type(self).build is not SqlAlchemyQueryMixin.build:
+            return None
+        column_keys = inspect(self.model).column_attrs.keys()
+        if any(data.keys() - column_keys for data in data_list):
+            return None
+        return insert(self.model).returning(self.model, sort_by_parameter_order=True)
+
+    def update_attribute(self, obj, key, new_value):
+        setattr(obj, key, new_value)
+
+    def get_bulk_criteria(self, filters):
+        """Return the criteria of rows matching filters, to be used in ``UPDATE`` and ``DELETE`` statements.
+
+        Filters spanning relationships need joins, which ``UPDATE`` and ``DELETE`` can't express portably, so the
+        rows are then matched by their ids selected with a subquery.
+        """
+        statement = self.apply_filters(self.get_query(), filters).statement
+        if statement.get_final_froms() == [self.model.__table__]:
+            return () if statement.whereclause is None else (statement.whereclause,)
+        return (self.model.id.in_(statement.with_only_columns(self.model.id)),)
+
+    def get_update_many_statement(self, filters, data):
+        return update(self.model).where(*self.get_bulk_criteria(filters)).values(**data)
+
+    def get_delete_many_statement(self, filters):
+        return delete(self.model).where(*self.get_bulk_criteria(filters))
+
+    def get_update_statement(self, id, data):
+        """Return an ``UPDATE ... WHERE id`` statement of the changed columns, or ``None`` when it can't be used.
+
+        Objects are updated directly only with ``direct_updates`` enabled, when every key is a column attribute and
+        ``update_attribute`` is not customized. Updated rows are returned when the dialect supports ``RETURNING``.
+        """
+        changes = {key: value for key, value in data.items() if key != 'id'}
+        if not self.direct_updates or not changes:
+            return None
+        if type(self).update_attribute is not SqlAlchemyQueryMixin.update_attribute:
+            return None
+        if changes.keys() - inspect(self.model).column_attrs.keys():
+            return None
+        statement = update(self.model).where(self.model.id == id).values(**changes)
+        if self.session.get_bind().dialect.update_returning:
+            statement = statement.returning(self.model)
+        return statement
+
+    def get_delete_statement(self, id):
+        if not self.direct_deletes:
+            return None
+        return delete(self.model).where(self.model.id == id)
+
+    def get_updated_object(self, id, statement, result):
+        """Return the object returned by a direct update, raise ``ObjectNotFound`` when no row was updated."""
+        if statement.exported_columns:
+            obj = result.scalars().one_or_none()
+            if obj is not None:
+                return obj
+        elif result.rowcount:
+            return None
+        raise self.object_not_found(id)
+
+    def object_not_found(self, id):
+        return exceptions.ObjectNotFound(source={'parameter': 'id'},
+                                         detail='{} {} not found.'.format(self.instance_name.capitalize(), id))
+
+    def get_detail_version_statement(self, id):
+        query = self.get_query().filter(self.model.id == id)
+        return query.statement.with_only_columns(getattr(self.model, self.version_column))
+
+    def get_list_version_statement(self, filters):
+        query = self.apply_filters(self.get_query(), filters)
+        return query.statement.with_only_columns(
+            func.max(getattr(self.model, self.version_column)),
+            func.count(self.model.id),
+        )
+
+    def get_count_statement(self, filters, limit=None, criteria=None):
+        filtered_query = self.apply_criteria(self.apply_filters(self.get_query(), filters), criteria)
+        if limit is not None:
+            limited_query = filtered_query.statement.with_only_columns(self.model.id).limit(limit).subquery()
+            return select(func.count()).select_from(limited_query)
+        return filtered_query.statement.with_only_columns(func.count(self.model.id))
+
+
+class SqlAlchemyModelRepository(SqlAlchemyQueryMixin, repositories.ResourceRepository):
 
     def create(self, data, strategy='commit', **kwargs):
         obj = self.build(data)
@@ -28,29 +331,75 @@ class SqlAlchemyModelRepository(repositories.ResourceRepository):
             logger.exception(error)
             raise ForbiddenError(detail='{} could not be created.'.format(self.instance_name.capitalize()))
 
-    def get_list(self, filters=None, sorting=None, pagination=None):
+    def create_many(self, data_list, strategy='commit', **kwargs):
+        try:
+            statement = self.get_bulk_insert_statement(data_list)
+            if statement is not None:
+                objects = self.session.scalars(statement, data_list).all()
+            else:
+                objects = [self.build(data) for data in data_list]
+                self.session.add_all(objects)
+                self.session.flush()
+            self._run_session_strategy(strategy)
+            return objects
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            self.session.rollback()
+            raise ForbiddenError(detail='{} list could not be created.'.format(self.instance_name.capitalize()))
+
+    def get_list(self, filters=None, sorting=None, pagination=None, include=None, fields=None, criteria=None):
         try:
             query = self.get_query()
+            query = self.apply_include(query, include)
+            query = self.apply_fields(query, fields)
             query = self.apply_filters(query, filters)
+            query = self.apply_criteria(query, criteria)
+            if self.is_cursor_pagination(pagination):
+                return self.get_cursor_page(query, sorting, pagination)
             query = self.apply_sorts(query, sorting)
+            if self.count_with_window and self.is_page_pagination(pagination):
+                return self.get_page_with_count(query, pagination)
             query = self.apply_pagination(query, pagination)
             return query.all()
         except exc.SQLAlchemyError as error:
             logger.exception(error)
             raise ForbiddenError(detail='Error while getting {} list.'.format(self.instance_name))
 
-    def get_detail(self, id):
+    def get_page_with_count(self, query, pagination):
+        if self.supports_window_functions is None:
+            connection = self.get_read_session().connection()
+            self.supports_window_functions = self.dialect_supports_window_functions(connection.dialect)
+        if self.supports_window_functions:
+            counted_query = query.add_columns(func.count().over().label('total_count'))
+            rows = self.apply_pagination(counted_query, pagination).all()
+            if rows:
+                return repositories.CountedList((row[0] for row in rows), total_count=rows[0].total_count)
+            return repositories.CountedList()
+        return self.apply_pagination(query, pagination).all()
+
+    def get_detail(self, id, include=None, fields=None):
         try:
-            return self.get_query().filter(self.model.id == id).one()
+            query = self.apply_fields(self.apply_include(self.get_query(), include), fields)
+            return query.filter(self.model.id == id).one()
         except orm_exc.NoResultFound:
-            raise exceptions.ObjectNotFound(source={'parameter': 'id'},
-                                            detail='{} {} not found.'.format(self.instance_name.capitalize(), id))
+            raise self.object_not_found(id)
         except exc.SQLAlchemyError as error:
             logger.exception(error)
             raise ForbiddenError(detail='Error while getting {} details.'.format(self.instance_name))
 
     def delete(self, id, strategy='commit'):
-        obj = self.get_detail(id)
+        statement = self.get_delete_statement(id)
+        if statement is None:
+            return self.delete_instance(self.get_detail(id), strategy=strategy)
+        try:
+            if not self.session.execute(statement).rowcount:
+                raise self.object_not_found(id)
+            self._run_session_strategy(strategy)
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='Error while deleting {}.'.format(self.instance_name))
+
+    def delete_instance(self, obj, strategy='commit'):
         try:
             self.session.delete(obj)
             self._run_session_strategy(strategy)
@@ -59,8 +408,18 @@ class SqlAlchemyModelRepository(repositories.ResourceRepository):
             raise ForbiddenError(detail='Error while deleting {}.'.format(self.instance_name))
 
     def update(self, data, strategy='commit', **kwargs):
-        id = data['id']
-        obj = self.get_detail(id)
+        statement = self.get_update_statement(data['id'], data)
+        if statement is None:
+            return self.update_instance(self.get_detail(data['id']), data, strategy=strategy, **kwargs)
+        try:
+            obj = self.get_updated_object(data['id'], statement, self.session.execute(statement))
+            self._run_session_strategy(strategy)
+            return obj
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='Error while updating {}.'.format(self.instance_name))
+
+    def update_instance(self, obj, data, strategy='commit', **kwargs):
         for key, value in data.items():
             self.update_attribute(obj, key, value)
         try:
@@ -70,50 +429,56 @@ class SqlAlchemyModelRepository(repositories.ResourceRepository):
             logger.exception(error)
             raise ForbiddenError(detail='Error while updating {}.'.format(self.instance_name))
 
+    def update_many(self, filters, data, strategy='commit', **kwargs):
+        try:
+            count = self.session.execute(self.get_update_many_statement(filters, data)).rowcount
+            self._run_session_strategy(strategy)
+            return count
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='Error while updating {} list.'.format(self.instance_name))
+
+    def delete_many(self, filters, strategy='commit'):
+        try:
+            count = self.session.execute(self.get_delete_many_statement(filters)).rowcount
+            self._run_session_strategy(strategy)
+            return count
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='Error while deleting {} list.'.format(self.instance_name))
+
     def _run_session_strategy(self, strategy):
+        self.session_router.mark_write()
         if strategy == 'commit':
             self.session.commit()
         if strategy == 'flush':
             self.session.flush()
 
-    def get_query(self):
-        return sqlalchemy_django_query.DjangoQuery(self.model, session=self.session())
+    def get_cursor_page(self, query, sorting, pagination):
+        before = pagination.get('before')
+        objects = self.apply_cursor_pagination(query, sorting, pagination).all()
+        if before is not None:
+            objects.reverse()
+        return objects
 
-    def apply_filters(self, query, filters):
-        filters = filters or {}
-        filters = filters.copy()
-        for filter, filter_method in self.filter_methods_map.items():
-            if filter in filters:
-                value = filters.pop(filter)
-                query = query.filter(filter_method(value))
-        query = query.filter_by(**filters)
-        return query
-
-    def apply_pagination(self, query, pagination):
-        pagination = pagination or {}
-        size = pagination.get('size')
-        number = pagination.get('number')
-        if size is not None and number is not None:
-            return query.limit(size).offset(size * (number - 1))
-        else:
-            return query
-
-    def apply_sorts(self, query, sorting):
-        sorting = sorting or []
+    def get_detail_version(self, id):
+        if self.version_column is None:
+            return None
         try:
-            query = query.order_by(*sorting)
-        except exc.InvalidRequestError:
-            raise exceptions.InvalidSort("Invalid sort fields for {}".format(self.instance_name))
-        return query
-
-    def build(self, kwargs):
-        return self.model(**kwargs)
+            return self.get_read_session().execute(self.get_detail_version_statement(id)).scalar()
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='Error while getting {} version.'.format(self.instance_name))
 
-    def update_attribute(self, obj, key, new_value):
-        setattr(obj, key, new_value)
+    def get_list_version(self, filters=None):
+        if self.version_column is None:
+            return None
+        try:
+            latest_version, count = self.get_read_session().execute(self.get_list_version_statement(filters)).one()
+        except exc.SQLAlchemyError as error:
+            logger.exception(error)
+            raise ForbiddenError(detail='Error while getting {} list version.'.format(self.instance_name))
+        return '{}:{}'.format(latest_version, count)
 
-    def get_count(self, filters=None):
-        query = self.get_query()
-        filtered_query = self.apply_filters(query, filters)
-        count_query = filtered_query.statement.with_only_columns(func.count(self.model.id))
-        return self.session.execute(count_query).scalar()
+    def get_count(self, filters=None, limit=None, criteria=None):
+        return self.get_read_session().execute(self.get_count_statement(filters, limit, criteria)).scalar()
@@ -1,39 +1,165 @@
 from flask_jsonapi import descriptors
 from flask_jsonapi import filters_schema
 from flask_jsonapi import resources
+from flask_jsonapi import utils
 from flask_jsonapi.resource_repositories import repositories
+from flask_jsonapi.resource_repositories import routing
 
 
 class ResourceRepositoryViewMixin:
     repository = repositories.ResourceRepository()
+    # Read from the primary database even if the repository has a read replica.
+    force_primary = False
 
-    def __init__(self, *, repository=None, **kwargs):
+    def __init__(self, *, repository=None, force_primary=None, **kwargs):
         super().__init__(**kwargs)
         if repository:
             self.repository = repository
+        if force_primary is not None:
+            self.force_primary = force_primary
+
+    @classmethod
+    def as_view(cls, name, *class_args, **class_kwargs):
+        view = super().as_view(name, *class_args, **class_kwargs)
+        force_primary = class_kwargs.get('force_primary')
+        if cls.force_primary if force_primary is None else force_primary:
+            view = routing.primary_view(view)
+        return view
+
+    def get_loading_kwargs(self):
+        kwargs = {}
+        if getattr(self.repository, 'eager_load_includes', False):
+            include_fields = self.include_parser.parse()
+            if include_fields:
+                kwargs['include'] = tuple(
+                    utils.get_model_relationship_path(self.schema, path) for path in include_fields)
+        if getattr(self.repository, 'load_only_sparse_fields', False):
+            sparse_fields = utils.get_model_sparse_fields(self.schema, self.sparse_fields_parser.parse())
+            if sparse_fields:
+                kwargs['fields'] = sparse_fields
+        return kwargs
+
+    def get_filtering_kwargs(self):
+        """Keyword arguments narrowing down resources listed and counted by the repository, besides filters."""
+        return {}
+
+    def remember_instance(self, id, instance):
+        if self.context is not None and getattr(self.repository, 'supports_instances', False):
+            self.context.instances[str(id)] = instance
+        return instance
+
+    def get_loaded_instance(self, id):
+        """Return the resource already loaded during the request, so the repository doesn't load it again."""
+        if self.context is None:
+            return None
+        return self.context.instances.pop(str(id), None)
 
 
 class ResourceRepositoryDetailView(ResourceRepositoryViewMixin, resources.ResourceDetail):
     def read(self, id):
-        return self.repository.get_detail(id)
+        return self.remember_instance(id, self.repository.get_detail(id, **self.get_loading_kwargs()))
+
+    def get_version(self, id):
+        # Repositories are not required to subclass ResourceRepository, so versions are optional.
+        get_detail_version = getattr(self.repository, 'get_detail_version', None)
+        return get_detail_version(id) if get_detail_version else None
 
     def destroy(self, id):
-        self.repository.delete(id)
+        instance = self.get_loaded_instance(id)
+        if instance is not None:
+            self.repository.delete_instance(instance)
+        else:
+            self.repository.delete(id)
 
     def update(self, id, data, **kwargs):
         data['id'] = id
-        self.repository.update(data, **kwargs)
+        instance = self.get_loaded_instance(id)
+        if instance is not None:
+            self.repository.update_instance(instance, data, **kwargs)
+        else:
+            self.repository.update(data, **kwargs)
 
 
 class ResourceRepositoryListView(ResourceRepositoryViewMixin, resources.ResourceList):
     def read_many(self, filters, sorting, pagination):
-        return self.repository.get_list(filters, sorting, pagination)
+        return self.repository.get_list(
+            filters, sorting, pagination, **self.get_loading_kwargs(), **self.get_filtering_kwargs())
 
     def create(self, data, **kwargs):
         return self.repository.create(data, **kwargs)
 
-    def get_count(self, filters):
-        return self.repository.get_count(filters)
+    def create_many(self, data_list, **kwargs):
+        return self.repository.create_many(data_list, **kwargs)
+
+    def update_many(self, filters, data, **kwargs):
+        return self.repository.update_many(filters, data, **kwargs)
+
+    def destroy_many(self, filters):
+        return self.repository.delete_many(filters)
+
+    def get_count(self, filters, limit=None):
+        if limit is None:
+            return self.repository.get_count(filters, **self.get_filtering_kwargs())
+        return self.repository.get_count(filters, limit=limit, **self.get_filtering_kwargs())
+
+    def get_version(self, filters):
+        get_list_version = getattr(self.repository, 'get_list_version', None)
+        return get_list_version(filters) if get_list_version else None
+
+
+class AsyncResourceRepositoryDetailView(ResourceRepositoryViewMixin, resources.AsyncResourceDetail):
+    repository = repositories.AsyncResourceRepository()
+
+    async def read(self, id):
+        return self.remember_instance(id, await self.repository.get_detail(id, **self.get_loading_kwargs()))
+
+    async def get_version(self, id):
+        get_detail_version = getattr(self.repository, 'get_detail_version', None)
+        return await get_detail_version(id) if get_detail_version else None
+
+    async def destroy(self, id):
+        instance = self.get_loaded_instance(id)
+        if instance is not None:
+            await self.repository.delete_instance(instance)
+        else:
+            await self.repository.delete(id)
+
+    async def update(self, id, data, **kwargs):
+        data['id'] = id
+        instance = self.get_loaded_instance(id)
+        if instance is not None:
+            await self.repository.update_instance(instance, data, **kwargs)
+        else:
+            await self.repository.update(data, **kwargs)
+
+
+class AsyncResourceRepositoryListView(ResourceRepositoryViewMixin, resources.AsyncResourceList):
+    repository = repositories.AsyncResourceRepository()
+
+    async def read_many(self, filters, sorting, pagination):
+        return await self.repository.get_list(
+            filters, sorting, pagination, **self.get_loading_kwargs(), **self.get_filtering_kwargs())
+
+    async def create(self, data, **kwargs):
+        return await self.repository.create(data, **kwargs)
+
+    async def create_many(self, data_list, **kwargs):
+        return await self.repository.create_many(data_list, **kwargs)
+
+    async def update_many(self, filters, data, **kwargs):
+        return await self.repository.update_many(filters, data, **kwargs)
+
+    async def destroy_many(self, filters):
+        return await self.repository.delete_many(filters)
+
+    async def get_count(self, filters, limit=None):
+        if limit is None:
+            return await self.repository.get_count(filters, **self.get_filtering_kwargs())
+        return await self.repository.get_count(filters, limit=limit, **self.get_filtering_kwargs())
+
+    async def get_version(self, filters):
+        get_list_version = getattr(self.repository, 'get_list_version', None)
+        return await get_list_version(filters) if get_list_version else None
 
 
 class ResourceRepositoryViewSet:
@@ -44,9 +170,10 @@ class ResourceRepositoryViewSet:
     list_view_cls = ResourceRepositoryListView
     view_decorators = ()
     view_kwargs = None
+    list_view_kwargs = None
 
     def __init__(self, *, repository=None, schema=None, filter_schema=None, detail_view_cls=None, list_view_cls=None,
-                 view_decorators=None, view_kwargs=None):
+                 view_decorators=None, view_kwargs=None, list_view_kwargs=None):
         if repository:
             self.repository = repository
         if schema:
@@ -61,6 +188,8 @@ class ResourceRepositoryViewSet:
             self.view_decorators = view_decorators
         if view_kwargs:
             self.view_kwargs = view_kwargs
+        if list_view_kwargs:
+            self.list_view_kwargs = list_view_kwargs
 
     def as_detail_view(self, view_name):
         return self.decorate(
@@ -69,7 +198,8 @@ class ResourceRepositoryViewSet:
 
     def as_list_view(self, view_name):
         return self.decorate(
-            self.list_view_cls.as_view(view_name, filter_schema=self.filter_schema, **self.get_views_kwargs())
+            self.list_view_cls.as_view(view_name, filter_schema=self.filter_schema, **self.get_views_kwargs(),
+                                       **(self.list_view_kwargs or {}))
         )
 
     def decorate(self, view):
@@ -83,3 +213,9 @@ class ResourceRepositoryViewSet:
             'repository': self.repository,
             **(self.view_kwargs or {})
         }
+
+
+class AsyncResourceRepositoryViewSet(ResourceRepositoryViewSet):
+    repository = repositories.AsyncResourceRepository()
+    detail_view_cls = AsyncResourceRepositoryDetailView
+    list_view_cls = AsyncResourceRepositoryListView
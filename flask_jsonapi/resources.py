@@ -1,5 +1,9 @@
+import contextlib
+import contextvars
 import functools
+import hashlib
 import http
+import inspect
 import logging
 
 import marshmallow
@@ -8,25 +12,51 @@ from flask import helpers
 from flask import request
 from flask import views
 from marshmallow_jsonapi import exceptions as marshmallow_jsonapi_exceptions
+from werkzeug import http as werkzeug_http
 
 from flask_jsonapi import decorators
 from flask_jsonapi import descriptors
 from flask_jsonapi import exceptions
 from flask_jsonapi import filters_schema
+from flask_jsonapi import json_backends
 from flask_jsonapi import query_string
 from flask_jsonapi import response
+from flask_jsonapi import schema_cache
 
 logger = logging.getLogger(__name__)
 
 
+class ViewContext:
+    """State of the request being dispatched by a view.
+
+    View instances are created once per route and shared between requests and threads, so anything specific to a
+    request belongs here rather than on the view.
+    """
+
+    def __init__(self, args, kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        # Identity cache of resources loaded during the request, keyed by ``str(id)``, so writes don't load them again.
+        self.instances = {}
+
+
+view_context = contextvars.ContextVar('view_context', default=None)
+
+
 class ResourceBase(views.View):
     schema = descriptors.NotImplementedProperty('schema')
-    args = None
-    kwargs = None
+    schema_cache = schema_cache.SchemaCache()
+    use_etags = True
+    compressor = None
+    init_every_request = False
 
-    def __init__(self, *, schema=None):
+    def __init__(self, *, schema=None, use_etags=None, compressor=None):
         if schema:
             self.schema = schema
+        if use_etags is not None:
+            self.use_etags = use_etags
+        if compressor:
+            self.compressor = compressor
         self.sort_parser = query_string.SortParser(schema=self.schema)
         self.include_parser = query_string.IncludeParser(schema=self.schema)
         self.sparse_fields_parser = query_string.SparseFieldsParser(schema=self.schema)
@@ -36,19 +66,89 @@ class ResourceBase(views.View):
         view = super().as_view(name, *class_args, **class_kwargs)
         return decorators.check_headers(view)
 
+    @property
+    def context(self) -> ViewContext:
+        return view_context.get()
+
+    @property
+    def args(self):
+        return self.context.args if self.context else None
+
+    @property
+    def kwargs(self):
+        return self.context.kwargs if self.context else None
+
     def dispatch_request(self, *args, **kwargs):
-        self.args = args
-        self.kwargs = kwargs
+        token = view_context.set(ViewContext(args, kwargs))
+        try:
+            return self.handle_request(*args, **kwargs)
+        finally:
+            view_context.reset(token)
+
+    def handle_request(self, *args, **kwargs):
         handler = getattr(self, request.method.lower(), self._http_method_not_allowed)
         try:
             response_object = handler(request, *args, **kwargs)
         except exceptions.JsonApiException as e:
-            return response.JsonApiErrorResponse(
-                e.to_dict(),
-                status=e.status
-            ).make_response()
+            return self.make_error_response(e)
         else:
-            return response_object.make_response()
+            return self.make_conditional(self.compress_response(response_object.make_response()))
+
+    def make_error_response(self, exception):
+        return self.compress_response(response.JsonApiErrorResponse(
+            exception.to_dict(),
+            status=exception.status
+        ).make_response())
+
+    def compress_response(self, flask_response):
+        if self.compressor is None:
+            return flask_response
+        return self.compressor.compress_response(flask_response)
+
+    def make_conditional(self, flask_response):
+        if (self.use_etags and request.method == 'GET' and flask_response.status_code == http.HTTPStatus.OK
+                and not flask_response.is_streamed):
+            flask_response.add_etag()
+            flask_response.make_conditional(request)
+        return flask_response
+
+    def use_version_etags(self):
+        # Versions only describe the primary resources, so compound documents get the ETag of their body.
+        return self.use_etags and not self.include_parser.parse()
+
+    def make_version_etag(self, version):
+        if version is None:
+            return None
+        return hashlib.sha1('{}:{}'.format(version, request.full_path).encode()).hexdigest()
+
+    @staticmethod
+    def get_etag_headers(etag):
+        if etag is None:
+            return None
+        return {'ETag': werkzeug_http.quote_etag(etag)}
+
+    @staticmethod
+    def is_not_modified(etag):
+        return etag is not None and request.if_none_match.contains_weak(etag)
+
+    @contextlib.contextmanager
+    def handle_dump_errors(self):
+        try:
+            yield
+        except marshmallow.ValidationError as e:
+            raise exceptions.JsonApiException(detail='marshmallow.ValidationError', source=e.messages)
+        except (AttributeError, KeyError, ValueError) as e:
+            logger.error(
+                'Error Processing Request',
+                extra={'status_code': http.HTTPStatus.BAD_REQUEST, 'request': request, 'exception': e}
+            )
+            raise exceptions.JsonApiException(detail=str(e), source={'component': 'schema'})
+
+    def get_request_data(self):
+        try:
+            return json_backends.get_backend().loads(request.get_data())
+        except ValueError:
+            raise exceptions.BadRequest(source={'pointer': ''}, detail='Request body is not a valid JSON document.')
 
     def _http_method_not_allowed(self, request, *args, **kwargs):
         logger.error(
@@ -63,21 +163,20 @@ class ResourceDetail(ResourceBase):
     id_kwarg = 'id'
 
     def get(self, *args, **kwargs):
+        version = self.get_version(self.resource_id) if self.use_version_etags() else None
+        etag = self.make_version_etag(version)
+        if self.is_not_modified(etag):
+            return response.NotModifiedResponse(headers=self.get_etag_headers(etag))
         resource = self.read(self.resource_id)
+        return self.make_detail_response(resource, etag)
+
+    def make_detail_response(self, resource, etag=None):
         include_fields = self.include_parser.parse()
         sparse_fields = self.sparse_fields_parser.parse()
-        try:
-            data = self.schema(include_data=include_fields, only=sparse_fields).dump(resource)
-        except marshmallow.ValidationError as e:
-            raise exceptions.JsonApiException(detail='marshmallow.ValidationError', source=e.messages)
-        except (AttributeError, KeyError, ValueError) as e:
-            logger.error(
-                'Error Processing Request',
-                extra={'status_code': http.HTTPStatus.BAD_REQUEST, 'request': request, 'exception': e}
-            )
-            raise exceptions.JsonApiException(detail=str(e), source={'component': 'schema'})
-        else:
-            return response.JsonApiResponse(data)
+        with self.handle_dump_errors():
+            with self.schema_cache.get(self.schema, include_data=include_fields, only=sparse_fields) as schema:
+                data = schema.dump(resource)
+        return response.JsonApiResponse(data, headers=self.get_etag_headers(etag))
 
     def delete(self, *args, **kwargs):
         self.destroy(self.resource_id)
@@ -86,15 +185,19 @@ class ResourceDetail(ResourceBase):
     def patch(self, *args, **kwargs):
         computed_schema = self.schema(partial=True)
         try:
-            data = computed_schema.load(request.get_json())
+            data = computed_schema.load(self.get_request_data())
         except marshmallow.ValidationError as e:
             return response.JsonApiErrorResponse.from_marshmallow_errors(e.messages)
         else:
             resource = self.update(self.resource_id, data)
-            if resource:
-                return response.JsonApiResponse(computed_schema.dump(resource))
-            else:
-                return response.EmptyResponse()
+            return self.make_update_response(computed_schema, resource)
+
+    @staticmethod
+    def make_update_response(computed_schema, resource):
+        if resource:
+            return response.JsonApiResponse(computed_schema.dump(resource))
+        else:
+            return response.EmptyResponse()
 
     @property
     def resource_id(self):
@@ -103,6 +206,9 @@ class ResourceDetail(ResourceBase):
     def read(self, id):
         raise NotImplementedError
 
+    def get_version(self, id):
+        return None
+
     def update(self, id, data, **kwargs):
         raise NotImplementedError
 
@@ -114,52 +220,148 @@ class ResourceList(ResourceBase):
     methods = ['GET', 'POST']
     filter_schema = filters_schema.FilterSchema()
     pagination = query_string.SizeNumberPagination()
-
-    def __init__(self, *, filter_schema=None, **kwargs):
+    stream = False
+    count_policy = query_string.CountPolicy.EXACT
+    count_cap = 1000
+    atomic_operations = False
+    bulk_operations = False
+
+    def __init__(self, *, filter_schema=None, stream=None, count_policy=None, count_cap=None, atomic_operations=None,
+                 bulk_operations=None, **kwargs):
         super().__init__(**kwargs)
         if filter_schema:
             self.filter_schema = filter_schema
+        if stream is not None:
+            self.stream = stream
+        if count_policy:
+            self.count_policy = count_policy
+        if count_cap is not None:
+            self.count_cap = count_cap
+        if atomic_operations is not None:
+            self.atomic_operations = atomic_operations
+        if bulk_operations is not None:
+            self.bulk_operations = bulk_operations
+
+    @classmethod
+    def as_view(cls, name, *class_args, **class_kwargs):
+        view = super().as_view(name, *class_args, **class_kwargs)
+        bulk_operations = class_kwargs.get('bulk_operations')
+        if cls.bulk_operations if bulk_operations is None else bulk_operations:
+            view.methods = [*view.methods, 'PATCH', 'DELETE']
+        return view
 
     def get(self, *args, **kwargs):
         parsed_filters = self.filter_schema.parse()
         parsed_sorting = self.sort_parser.parse()
         parsed_pagination = self.pagination.parse()
+        count_policy = self.get_count_policy()
+        version = self.get_version(parsed_filters) if self.use_version_etags() else None
+        etag = self.make_version_etag(version)
+        if self.is_not_modified(etag):
+            return response.NotModifiedResponse(headers=self.get_etag_headers(etag))
         objects_list = self.read_many(filters=parsed_filters,
                                       sorting=parsed_sorting,
                                       pagination=parsed_pagination)
+        page = self.pagination.get_page(objects_list, parsed_pagination)
+        objects = self.dump_page(page)
+        pagination_links, pagination_meta = self.get_pagination(
+            parsed_pagination, parsed_filters, objects_list, parsed_sorting, count_policy)
+        return self.make_list_response(objects, page, pagination_links, pagination_meta, etag)
+
+    def dump_page(self, page):
         include_fields = self.include_parser.parse()
         sparse_fields = self.sparse_fields_parser.parse()
-        try:
-            objects = self.schema(
-                many=True, include_data=include_fields, only=sparse_fields).dump(objects_list)
-        except marshmallow.ValidationError as e:
-            raise exceptions.JsonApiException(detail='marshmallow.ValidationError', source=e.messages)
-        except (AttributeError, KeyError, ValueError) as e:
-            logger.error(
-                'Error Processing Request',
-                extra={'status_code': http.HTTPStatus.BAD_REQUEST, 'request': request, 'exception': e}
-            )
-            raise exceptions.JsonApiException(detail=str(e), source={'component': 'schema'})
-        else:
-            pagination_links = self.get_pagination_links(parsed_pagination, parsed_filters)
-            return response.JsonApiListResponse(
+        with self.handle_dump_errors():
+            if self.stream:
+                return self.dump_stream(page, include_fields, sparse_fields)
+            with self.schema_cache.get(
+                    self.schema, many=True, include_data=include_fields, only=sparse_fields) as schema:
+                return schema.dump(page)
+
+    def make_list_response(self, objects, page, pagination_links, pagination_meta, etag=None):
+        if self.stream:
+            return response.JsonApiStreamingListResponse(
                 response_data=objects,
+                count=len(page),
                 links=pagination_links,
+                meta=pagination_meta,
+                headers=self.get_etag_headers(etag),
             )
+        return response.JsonApiListResponse(
+            response_data=objects,
+            links=pagination_links,
+            meta=pagination_meta,
+            headers=self.get_etag_headers(etag),
+        )
+
+    def dump_stream(self, objects_list, include_fields, sparse_fields):
+        # Instantiate the schema up front, so invalid sparse fields are reported before streaming starts.
+        with self.schema_cache.get(self.schema, include_data=include_fields, only=sparse_fields):
+            pass
+        included = {}
+
+        def generate_resource_objects():
+            with self.schema_cache.get(self.schema, include_data=include_fields, only=sparse_fields) as schema:
+                for obj in objects_list:
+                    result = schema.dump(obj)
+                    schema_cache.reset_schema_state(schema)
+                    for item in result.get('included', ()):
+                        included[(item['type'], item['id'])] = item
+                    yield result['data']
+
+        return {'data': generate_resource_objects(), 'included': included.values()}
+
+    def get_pagination(self, parsed_pagination, parsed_filters, objects_list, parsed_sorting, count_policy):
+        """Return pagination links and pagination related ``meta`` members."""
+        if not parsed_pagination:
+            return {}, {}
+        if isinstance(self.pagination, query_string.CursorPagination):
+            return self.pagination.get_links(objects_list, parsed_pagination, parsed_sorting), {}
+        if type(self).get_pagination_links is not ResourceList.get_pagination_links:
+            # Views overriding get_pagination_links keep building their links.
+            return self.get_pagination_links(parsed_pagination, parsed_filters), {}
+        total_count, meta = self.get_total_count(parsed_filters, count_policy, objects_list)
+        return self.get_page_links(parsed_pagination, total_count, objects_list), meta
 
     def get_pagination_links(self, parsed_pagination, parsed_filters):
-        if parsed_pagination:
-            page_size = parsed_pagination['size']
-            current_page = parsed_pagination['number']
-            total_count = self.get_count(filters=parsed_filters)
-            pagination_links = self.pagination.get_links(page_size, current_page, total_count)
-        else:
-            pagination_links = {}
-        return pagination_links
+        if not parsed_pagination:
+            return {}
+        total_count = self.get_count(filters=parsed_filters)
+        return self.pagination.get_links(parsed_pagination['size'], parsed_pagination['number'], total_count)
+
+    def get_page_links(self, parsed_pagination, total_count, objects_list):
+        return self.pagination.get_links(
+            parsed_pagination['size'], parsed_pagination['number'], total_count, page_length=len(objects_list))
+
+    def get_total_count(self, parsed_filters, count_policy, objects_list=None):
+        if count_policy == query_string.CountPolicy.NONE:
+            return None, {}
+        # Repositories may return the total count along with the page, see CountedList.
+        total_count = getattr(objects_list, 'total_count', None)
+        if total_count is None:
+            total_count = self.get_count(**self.get_count_kwargs(parsed_filters, count_policy))
+        return self.limit_total_count(total_count, count_policy)
+
+    def get_count_kwargs(self, parsed_filters, count_policy):
+        if count_policy == query_string.CountPolicy.CAPPED:
+            return {'filters': parsed_filters, 'limit': self.count_cap + 1}
+        return {'filters': parsed_filters}
+
+    def limit_total_count(self, total_count, count_policy):
+        if count_policy == query_string.CountPolicy.CAPPED and total_count > self.count_cap:
+            return None, {'total_count_more_than': self.count_cap}
+        return total_count, {}
+
+    def get_count_policy(self):
+        if self.pagination.parse_count():
+            return self.count_policy
+        return query_string.CountPolicy.NONE
 
     def post(self, *args, **kwargs):
+        if self.is_atomic_request():
+            return self.post_operations()
         try:
-            data = self.schema().load(request.get_json())
+            data = self.schema().load(self.get_request_data())
         except marshmallow_jsonapi_exceptions.IncorrectTypeError as e:
             return response.JsonApiErrorResponse.from_marshmallow_errors(e.messages)
         except marshmallow.ValidationError as e:
@@ -174,15 +376,259 @@ class ResourceList(ResourceBase):
             status=http.HTTPStatus.CREATED,
         )
 
+    @staticmethod
+    def is_atomic_request():
+        return response.ATOMIC_EXTENSION in request.mimetype_params.get('ext', '').split()
+
+    def post_operations(self):
+        """Create all resources of an atomic operations request in a single ``create_many`` call."""
+        schema, data_list, errors = self.load_operations()
+        if errors:
+            return response.JsonApiErrorResponse(*errors, status=http.HTTPStatus.UNPROCESSABLE_ENTITY)
+        return self.make_operations_response(schema, self.create_many(data_list))
+
+    def load_operations(self):
+        if not self.atomic_operations:
+            raise exceptions.UnsupportedMediaType(
+                source={'header': 'Content-Type'}, detail='Atomic operations are not supported by this resource.')
+        document = self.get_request_data()
+        operations = document.get('atomic:operations') if isinstance(document, dict) else None
+        if not isinstance(operations, list) or not operations:
+            raise exceptions.InvalidOperation('Request must contain a non-empty atomic:operations array.')
+        # All resources are validated with one schema instance and all errors are reported at once.
+        schema = self.schema()
+        data_list = []
+        errors = []
+        for index, operation in enumerate(operations):
+            pointer = '/atomic:operations/{}'.format(index)
+            if not isinstance(operation, dict) or operation.get('op') != 'add' or operation.keys() & {'ref', 'href'}:
+                raise exceptions.InvalidOperation('Only "add" operations creating resources are supported.',
+                                                  pointer=pointer)
+            try:
+                data_list.append(schema.load({'data': operation.get('data')}))
+            except marshmallow.ValidationError as e:
+                errors.extend(self.get_operation_errors(e.messages, pointer))
+        return schema, data_list, errors
+
+    @staticmethod
+    def get_operation_errors(messages, pointer):
+        errors = []
+        for error in messages.get('errors', ()):
+            source = error.get('source') or {}
+            if 'pointer' in source:
+                error = dict(error, source=dict(source, pointer=pointer + source['pointer']))
+            errors.append(error)
+        return errors
+
+    def patch(self, *args, **kwargs):
+        parsed_filters = self.parse_bulk_filters()
+        try:
+            data = self.load_bulk_data()
+        except (marshmallow_jsonapi_exceptions.IncorrectTypeError, marshmallow.ValidationError) as e:
+            return response.JsonApiErrorResponse.from_marshmallow_errors(e.messages)
+        else:
+            return self.make_bulk_response(self.update_many(parsed_filters, data))
+
+    def delete(self, *args, **kwargs):
+        return self.make_bulk_response(self.destroy_many(self.parse_bulk_filters()))
+
+    def parse_bulk_filters(self):
+        if not self.bulk_operations:
+            raise exceptions.MethodNotAllowed('Bulk operations are not allowed for this resource.')
+        parsed_filters = self.filter_schema.parse()
+        if not parsed_filters:
+            raise exceptions.InvalidFilters('At least one filter is required to update or delete resources in bulk.')
+        return parsed_filters
+
+    def load_bulk_data(self):
+        data = self.schema(partial=True).load(self.get_request_data())
+        if 'id' in data:
+            raise exceptions.BadRequest(source={'pointer': '/data/id'},
+                                        detail='Resource ids can not be updated in bulk.')
+        return data
+
+    @staticmethod
+    def make_bulk_response(count):
+        return response.JsonApiResponse({'meta': {'count': count}})
+
+    @staticmethod
+    def make_operations_response(schema, objects):
+        return response.JsonApiAtomicResultsResponse([{'data': schema.dump(object)['data']} for object in objects])
+
     def read_many(self, filters, sorting, pagination):
         raise NotImplementedError
 
-    def get_count(self, filters):
+    def get_count(self, filters, limit=None):
         raise NotImplementedError
 
+    def get_version(self, filters):
+        return None
+
     def create(self, data, **kwargs):
         raise NotImplementedError
 
+    def create_many(self, data_list, **kwargs):
+        raise NotImplementedError
+
+    def update_many(self, filters, data, **kwargs):
+        raise NotImplementedError
+
+    def destroy_many(self, filters):
+        raise NotImplementedError
+
+
+class AsyncResourceMixin:
+    """Dispatch requests to ``async def`` handlers.
+
+    Flask runs async views with ``ensure_sync``, which requires the ``flask[async]`` extra.
+    """
+
+    async def dispatch_request(self, *args, **kwargs):
+        token = view_context.set(ViewContext(args, kwargs))
+        try:
+            return await self.handle_request(*args, **kwargs)
+        finally:
+            view_context.reset(token)
+
+    async def handle_request(self, *args, **kwargs):
+        handler = getattr(self, request.method.lower(), self._http_method_not_allowed)
+        try:
+            response_object = handler(request, *args, **kwargs)
+            if inspect.isawaitable(response_object):
+                response_object = await response_object
+        except exceptions.JsonApiException as e:
+            return self.make_error_response(e)
+        else:
+            return self.make_conditional(self.compress_response(response_object.make_response()))
+
+
+class AsyncResourceDetail(AsyncResourceMixin, ResourceDetail):
+    async def get(self, *args, **kwargs):
+        version = await self.get_version(self.resource_id) if self.use_version_etags() else None
+        etag = self.make_version_etag(version)
+        if self.is_not_modified(etag):
+            return response.NotModifiedResponse(headers=self.get_etag_headers(etag))
+        resource = await self.read(self.resource_id)
+        return self.make_detail_response(resource, etag)
+
+    async def delete(self, *args, **kwargs):
+        await self.destroy(self.resource_id)
+        return response.EmptyResponse()
+
+    async def patch(self, *args, **kwargs):
+        computed_schema = self.schema(partial=True)
+        try:
+            data = computed_schema.load(self.get_request_data())
+        except marshmallow.ValidationError as e:
+            return response.JsonApiErrorResponse.from_marshmallow_errors(e.messages)
+        else:
+            resource = await self.update(self.resource_id, data)
+            return self.make_update_response(computed_schema, resource)
+
+    async def read(self, id):
+        raise NotImplementedError
+
+    async def get_version(self, id):
+        return None
+
+    async def update(self, id, data, **kwargs):
+        raise NotImplementedError
+
+    async def destroy(self, id):
+        raise NotImplementedError
+
+
+class AsyncResourceList(AsyncResourceMixin, ResourceList):
+    async def get(self, *args, **kwargs):
+        parsed_filters = self.filter_schema.parse()
+        parsed_sorting = self.sort_parser.parse()
+        parsed_pagination = self.pagination.parse()
+        count_policy = self.get_count_policy()
+        version = await self.get_version(parsed_filters) if self.use_version_etags() else None
+        etag = self.make_version_etag(version)
+        if self.is_not_modified(etag):
+            return response.NotModifiedResponse(headers=self.get_etag_headers(etag))
+        objects_list = await self.read_many(filters=parsed_filters,
+                                            sorting=parsed_sorting,
+                                            pagination=parsed_pagination)
+        page = self.pagination.get_page(objects_list, parsed_pagination)
+        objects = self.dump_page(page)
+        pagination_links, pagination_meta = await self.get_pagination(
+            parsed_pagination, parsed_filters, objects_list, parsed_sorting, count_policy)
+        return self.make_list_response(objects, page, pagination_links, pagination_meta, etag)
+
+    async def get_pagination(self, parsed_pagination, parsed_filters, objects_list, parsed_sorting, count_policy):
+        if not parsed_pagination or isinstance(self.pagination, query_string.CursorPagination):
+            return super().get_pagination(parsed_pagination, parsed_filters, objects_list, parsed_sorting, count_policy)
+        total_count, meta = await self.get_total_count(parsed_filters, count_policy, objects_list)
+        return self.get_page_links(parsed_pagination, total_count, objects_list), meta
+
+    async def get_total_count(self, parsed_filters, count_policy, objects_list=None):
+        if count_policy == query_string.CountPolicy.NONE:
+            return None, {}
+        total_count = getattr(objects_list, 'total_count', None)
+        if total_count is None:
+            total_count = await self.get_count(**self.get_count_kwargs(parsed_filters, count_policy))
+        return self.limit_total_count(total_count, count_policy)
+
+    async def post(self, *args, **kwargs):
+        if self.is_atomic_request():
+            return await self.post_operations()
+        try:
+            data = self.schema().load(self.get_request_data())
+        except marshmallow_jsonapi_exceptions.IncorrectTypeError as e:
+            return response.JsonApiErrorResponse.from_marshmallow_errors(e.messages)
+        except marshmallow.ValidationError as e:
+            return response.JsonApiErrorResponse.from_marshmallow_errors(e.messages)
+        else:
+            return await self.prepare_response(data)
+
+    async def prepare_response(self, data):
+        object = await self.create(data=data)
+        return response.JsonApiResponse(
+            self.schema().dump(object),
+            status=http.HTTPStatus.CREATED,
+        )
+
+    async def read_many(self, filters, sorting, pagination):
+        raise NotImplementedError
+
+    async def get_count(self, filters, limit=None):
+        raise NotImplementedError
+
+    async def get_version(self, filters):
+        return None
+
+    async def post_operations(self):
+        schema, data_list, errors = self.load_operations()
+        if errors:
+            return response.JsonApiErrorResponse(*errors, status=http.HTTPStatus.UNPROCESSABLE_ENTITY)
+        return self.make_operations_response(schema, await self.create_many(data_list))
+
+    async def create(self, data, **kwargs):
+        raise NotImplementedError
+
+    async def patch(self, *args, **kwargs):
+        parsed_filters = self.parse_bulk_filters()
+        try:
+            data = self.load_bulk_data()
+        except (marshmallow_jsonapi_exceptions.IncorrectTypeError, marshmallow.ValidationError) as e:
+            return response.JsonApiErrorResponse.from_marshmallow_errors(e.messages)
+        else:
+            return self.make_bulk_response(await self.update_many(parsed_filters, data))
+
+    async def delete(self, *args, **kwargs):
+        return self.make_bulk_response(await self.destroy_many(self.parse_bulk_filters()))
+
+    async def create_many(self, data_list, **kwargs):
+        raise NotImplementedError
+
+    async def update_many(self, filters, data, **kwargs):
+        raise NotImplementedError
+
+    async def destroy_many(self, filters):
+        raise NotImplementedError
+
 
 class Actions:
     create = 'create'
@@ -190,6 +636,8 @@ class Actions:
     read_many = 'fetch list'
     update = 'update'
     destroy = 'delete'
+    update_many = 'update list'
+    destroy_many = 'delete list'
 
 
 def check_allowed_action(action: str):
@@ -235,6 +683,14 @@ class AllowedActionsResourceListMixin(AllowedActionsResourceMixin):
     def get(self, *args, **kwargs):
         return super().get(*args, **kwargs)
 
+    @check_allowed_action(Actions.update_many)
+    def patch(self, *args, **kwargs):
+        return super().patch(*args, **kwargs)
+
+    @check_allowed_action(Actions.destroy_many)
+    def delete(self, *args, **kwargs):
+        return super().delete(*args, **kwargs)
+
 
 class AllowedActionsResourceViewSetMixin:
     detail_view_cls: AllowedActionsResourceMixin
@@ -1,7 +1,13 @@
 import http
-import json
 
 from flask import helpers
+from flask import stream_with_context
+
+from flask_jsonapi import json_backends
+
+JSONAPI_MEDIA_TYPE = 'application/vnd.api+json'
+ATOMIC_EXTENSION = 'https://jsonapi.org/ext/atomic'
+ATOMIC_MEDIA_TYPE = '{}; ext="{}"'.format(JSONAPI_MEDIA_TYPE, ATOMIC_EXTENSION)
 
 
 class BaseResponse:
@@ -29,8 +35,14 @@ class EmptyResponse(BaseResponse):
         return ''
 
 
+class NotModifiedResponse(EmptyResponse):
+    def __init__(self, headers=None):
+        super().__init__(headers, status=http.HTTPStatus.NOT_MODIFIED)
+
+
 class BaseJsonApiResponse(BaseResponse):
-    base_header = {'Content-Type': 'application/vnd.api+json'}
+    base_header = {'Content-Type': JSONAPI_MEDIA_TYPE}
+    jsonapi_object = {'version': '1.0'}
 
     def make_response(self):
         response = super().make_response()
@@ -38,8 +50,8 @@ class BaseJsonApiResponse(BaseResponse):
         return response
 
     def get_content(self):
-        data = dict(self.get_response_data(), **{'jsonapi': {'version': '1.0'}})
-        return json.dumps(data)
+        data = dict(self.get_response_data(), **{'jsonapi': self.jsonapi_object})
+        return json_backends.get_backend().dumps_bytes(data)
 
     def get_response_data(self):
         raise NotImplementedError
@@ -66,9 +78,61 @@ class JsonApiResponse(BaseJsonApiResponse):
 
 
 class JsonApiListResponse(JsonApiResponse):
+    def __init__(self, response_data, links=None, headers=None, status=None, meta=None):
+        super().__init__(response_data, links=links, headers=headers, status=status)
+        self.meta = meta or {}
+
     def get_response_data(self):
         response_data = super().get_response_data()
-        return dict(**response_data, **{'meta': {'count': len(self.response_data['data'])}})
+        return dict(**response_data, **{'meta': self.get_meta()})
+
+    def get_meta(self):
+        return {'count': len(self.response_data['data']), **self.meta}
+
+
+class JsonApiStreamingListResponse(JsonApiListResponse):
+    """List response encoded lazily, one resource object at a time.
+
+    ``response_data['data']`` may be any iterable of resource objects. ``response_data['included']`` is only read
+    once all resource objects have been written, so it can be filled in while the data is being consumed.
+    """
+
+    def __init__(self, response_data, count, links=None, headers=None, status=None, meta=None):
+        super().__init__(response_data, links=links, headers=headers, status=status, meta=meta)
+        self.count = count
+
+    def get_meta(self):
+        return {'count': self.count, **self.meta}
+
+    def get_content(self):
+        return stream_with_context(self.generate_content())
+
+    def generate_content(self):
+        dumps = json_backends.get_backend().dumps_bytes
+        yield b'{"data": ['
+        for index, resource_object in enumerate(self.response_data['data']):
+            yield (b', ' if index else b'') + dumps(resource_object)
+        yield b']'
+        included = list(self.response_data.get('included', ()))
+        if included:
+            yield b', "included": ' + dumps(included)
+        for key, value in self.get_links().items():
+            yield b', ' + dumps(key) + b': ' + dumps(value)
+        yield b', "meta": ' + dumps(self.get_meta())
+        yield b', "jsonapi": ' + dumps(self.jsonapi_object) + b'}'
+
+
+class JsonApiAtomicResultsResponse(BaseJsonApiResponse):
+    """Response to a request of the atomic operations extension, with one result per operation."""
+    base_header = {'Content-Type': ATOMIC_MEDIA_TYPE}
+    jsonapi_object = {'version': '1.1', 'ext': [ATOMIC_EXTENSION]}
+
+    def __init__(self, results, headers=None, status=None):
+        self.results = results
+        super().__init__(headers, status)
+
+    def get_response_data(self):
+        return {'atomic:results': self.results}
 
 
 class JsonApiErrorResponse(BaseJsonApiResponse):
@@ -0,0 +1,82 @@
+import collections
+import contextlib
+import threading
+
+from marshmallow_jsonapi import fields
+from marshmallow_jsonapi import schema as ma_schema
+
+
+class SchemaCache:
+    """Bounded LRU pool of ready-to-use schema instances.
+
+    Instances are keyed on the schema class and the normalized ``many``, ``include_data`` and ``only`` arguments.
+    marshmallow-jsonapi schemas keep per-dump state (``included_data``, ``document_meta``), so an instance is
+    checked out for the duration of a single dump and returned to the pool afterwards, which keeps the cache
+    safe to share between threads.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._pool = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def get(self, schema, *, many=False, include_data=(), only=None):
+        key = self.make_key(schema, many, include_data, only)
+        instance = self._acquire(key)
+        if instance is None:
+            _, many, include_data, only = key
+            instance = schema(many=many, include_data=include_data, only=only)
+        yield instance
+        self._release(key, instance)
+
+    @staticmethod
+    def make_key(schema, many, include_data, only):
+        include_data = tuple(sorted(set(include_data or ())))
+        if only is not None:
+            only = tuple(sorted(set(only)))
+        return schema, bool(many), include_data, only
+
+    def clear(self):
+        with self._lock:
+            self._pool.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _acquire(self, key):
+        with self._lock:
+            idle = self._pool.get(key)
+            if idle:
+                self._pool.move_to_end(key)
+                self.hits += 1
+                return idle.pop()
+            self.misses += 1
+            return None
+
+    def _release(self, key, instance):
+        reset_schema_state(instance)
+        with self._lock:
+            self._pool.setdefault(key, []).append(instance)
+            self._pool.move_to_end(key)
+            while len(self._pool) > self.maxsize:
+                self._pool.popitem(last=False)
+
+
+def reset_schema_state(schema, visited=None):
+    """Clear per-dump state of a schema and of the nested schemas its relationships already instantiated.
+
+    The ``schema`` property of relationships builds nested schemas on access, and a new one on every access for
+    ``'self'`` relationships, so only the instances stored in its slot are visited.
+    """
+    visited = set() if visited is None else visited
+    if id(schema) in visited:
+        return
+    visited.add(id(schema))
+    schema.included_data = {}
+    schema.document_meta = {}
+    for field in schema.fields.values():
+        nested_schema = getattr(field, '_Relationship__schema', None)
+        if isinstance(field, fields.BaseRelationship) and isinstance(nested_schema, ma_schema.Schema):
+            reset_schema_state(nested_schema, visited)
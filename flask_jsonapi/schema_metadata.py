@@ -0,0 +1,85 @@
+import copy
+import threading
+import types
+import weakref
+
+from marshmallow_jsonapi import fields
+
+
+class SchemaMetadata:
+    """Read-only description of a schema class used to validate query string parameters.
+
+    It is built once per schema class by :func:`get_metadata`, so parsers validate request parameters with set and
+    dictionary lookups instead of inspecting or instantiating the schema.
+    """
+
+    def __init__(self, schema):
+        declared_fields = schema._declared_fields
+        self.schema = schema
+        self.type_ = schema.opts.type_
+        self.field_names = frozenset(declared_fields)
+        self.excluded_field_names = frozenset(schema.opts.exclude)
+        self.declared_attributes = types.MappingProxyType(
+            {name: field.attribute for name, field in declared_fields.items()})
+        self.model_attributes = types.MappingProxyType(
+            {name: field.attribute or name for name, field in declared_fields.items()})
+        self.field_classes = types.MappingProxyType({name: type(field) for name, field in declared_fields.items()})
+        self.relationships = types.MappingProxyType({
+            name: field for name, field in declared_fields.items() if isinstance(field, fields.BaseRelationship)
+        })
+        self.sort_fields = types.MappingProxyType({
+            name: attribute for name, attribute in self.model_attributes.items() if name not in self.relationships
+        })
+        self.related_schemas = {}
+
+    def get_related_schema(self, field_name):
+        """Return the schema class of a relationship, or ``None`` when the relationship has no schema.
+
+        The class is resolved once per relationship through ``Relationship.schema`` of a copy of the field, bound to a
+        throwaway schema instance so ``'self'`` resolves to this schema.
+        """
+        field = self.relationships[field_name]
+        try:
+            return self.related_schemas[field_name]
+        except KeyError:
+            pass
+        bound_field = copy.copy(field)
+        bound_field.parent = self.schema()
+        try:
+            related_schema = type(bound_field.schema)
+        except ValueError:
+            related_schema = None
+        self.related_schemas[field_name] = related_schema
+        return related_schema
+
+    def check_include_path(self, include_path):
+        """Validate a dotted include path, raising ``ValueError`` like ``Schema.check_relations`` does."""
+        if not include_path:
+            return
+        field_name, _, remaining_path = include_path.partition('.')
+        if field_name not in self.field_names or field_name in self.excluded_field_names:
+            raise ValueError('Unknown field "{}"'.format(field_name))
+        if field_name not in self.relationships:
+            raise ValueError('Can only include relationships. "{}" is a "{}"'.format(
+                field_name, self.field_classes[field_name].__name__))
+        if remaining_path:
+            related_schema = self.get_related_schema(field_name)
+            if related_schema is None:
+                raise ValueError('A Schema is required to serialize a nested relationship with include_data')
+            get_metadata(related_schema).check_include_path(remaining_path)
+
+
+_registry = weakref.WeakKeyDictionary()
+_registry_lock = threading.Lock()
+
+
+def get_metadata(schema) -> SchemaMetadata:
+    """Return the metadata of a schema class or instance, building it on first use."""
+    if not isinstance(schema, type):
+        schema = type(schema)
+    metadata = _registry.get(schema)
+    if metadata is None:
+        metadata = SchemaMetadata(schema)
+        with _registry_lock:
+            metadata = _registry.setdefault(schema, metadata)
+    return metadata
@@ -2,6 +2,8 @@ from .common import EqualityMixin
 from .common import field_exist
 from .common import get_field_class
 from .common import get_model_field
+from .common import get_model_relationship_path
+from .common import get_model_sparse_fields
 from .common import is_field_mapped
 from .common import is_relationship
 
@@ -11,5 +13,7 @@ __all__ = [
     is_field_mapped,
     is_relationship,
     get_model_field,
+    get_model_relationship_path,
+    get_model_sparse_fields,
     get_field_class,
 ]
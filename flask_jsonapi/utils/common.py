@@ -1,5 +1,9 @@
+import collections
+
 from marshmallow_jsonapi import fields
 
+from flask_jsonapi import schema_metadata
+
 
 class EqualityMixin:
     def __eq__(self, other):
@@ -38,3 +42,35 @@ def get_field_class(schema, field, default=fields.Str):
     if schema._declared_fields.get(field) is None:
         return default
     return type(schema._declared_fields[field])
+
+
+def get_model_relationship_path(schema, include_path):
+    """Translate a dotted path of schema relationship fields into a dotted path of model attributes."""
+    attributes = []
+    field_names = include_path.split('.')
+    for index, field_name in enumerate(field_names):
+        metadata = schema_metadata.get_metadata(schema)
+        attributes.append(metadata.model_attributes[field_name])
+        if index + 1 < len(field_names):
+            schema = metadata.get_related_schema(field_name)
+    return '.'.join(attributes)
+
+
+def get_model_sparse_fields(schema, sparse_fields):
+    """Group sparse fields by model relationship path ('' for the schema itself) as model attribute names.
+
+    Fields unknown to the schema are skipped, leaving their validation to the serialization step.
+    """
+    model_fields = collections.defaultdict(list)
+    for sparse_field in sparse_fields or ():
+        *path, field_name = sparse_field.split('.')
+        try:
+            nested_schema = schema
+            for name in path:
+                nested_schema = schema_metadata.get_metadata(nested_schema).get_related_schema(name)
+            attribute = schema_metadata.get_metadata(nested_schema).model_attributes[field_name]
+        except (AttributeError, KeyError, TypeError, ValueError):
+            continue
+        relationship_path = get_model_relationship_path(schema, '.'.join(path)) if path else ''
+        model_fields[relationship_path].append(attribute)
+    return {path: tuple(attributes) for path, attributes in model_fields.items()}
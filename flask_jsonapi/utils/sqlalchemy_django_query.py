@@ -19,7 +19,9 @@
     :copyright: 2011 by Armin Ronacher, Mike Bayer.
     license: BSD, see LICENSE for more details.
 """
+from sqlalchemy import event
 from sqlalchemy import exc
+from sqlalchemy.orm import Mapper
 from sqlalchemy.orm import joinedload
 from sqlalchemy.orm.base import _entity_descriptor
 from sqlalchemy.orm.query import Query
@@ -32,6 +34,27 @@ from sqlalchemy_utils.functions import orm
 from flask_jsonapi import exceptions
 
 
+JOIN = 'join'
+FILTER = 'filter'
+SORT = 'sort'
+
+# Resolved filter and sort paths, keyed by (query class, kind, entity, path, preceding joins).
+resolution_cache = {}
+
+
+def clear_resolution_cache(*args):
+    """Drop resolved paths, e.g. after mappers have been reconfigured."""
+    resolution_cache.clear()
+
+
+event.listen(Mapper, 'after_configured', clear_resolution_cache)
+
+
+def get_joins_key(joins):
+    # Instrumented attributes overload ``==``, so they are keyed on their parent entity and attribute name.
+    return tuple((join.parent, join.key) for join in joins)
+
+
 def joinedload_all(column):
     elements = column.split('.')
     joined = joinedload(elements.pop(0))
@@ -104,7 +127,6 @@ class DjangoQueryMixin(object):
         args = list(args)
         joins_needed = []
         for idx, arg in enumerate(args):
-            q = self
             if not isinstance(arg, str):
                 continue
             if arg[0] in '+-':
@@ -112,16 +134,8 @@ class DjangoQueryMixin(object):
                 arg = arg[1:]
             else:
                 desc = False
-            column = None
-            for token in arg.split('__'):
-                column = get_column(self._filter_by_zero(), token, joins_needed)
-                if column and column.impl.uses_objects:
-                    q = q.join(column)
-                    joins_needed.append(column)
-                    column = None
-            if column is None:
-                raise exceptions.InvalidSort(
-                    "You can't sort on {}, {}".format(token, str(arg)))
+            joins, column = self._resolve_sort_path(arg, joins_needed)
+            joins_needed.extend(joins)
             if desc:
                 column = column.desc()
             args[idx] = column
@@ -134,39 +148,78 @@ class DjangoQueryMixin(object):
     def _filter_or_exclude(self, negate, kwargs):
         q = self
         negate_if = lambda expr: expr if not negate else ~expr
-        column = None
-        filter_applied = False
         joins_needed = []
         for arg, value in kwargs.items():
-            for token in arg.split('__'):
-                if column is None:
-                    column = get_column(self._filter_by_zero(), token, joins_needed)
-                    if column and column.impl.uses_objects:
-                        q = q.join(column)
-                        joins_needed.append(column)
-                        column = None
-                elif token in self._underscore_operators:
-                    op = self._underscore_operators[token]
-                    q = q.filter(negate_if(op(column, *to_list(value))))
-                    filter_applied = True
-                    column = None
-                elif token in self._underscore_list_operators:
-                    op = self._underscore_list_operators[token]
+            for step in self._resolve_filter_path(arg, joins_needed):
+                if step[0] == JOIN:
+                    q = q.join(step[1])
+                    joins_needed.append(step[1])
+                    continue
+                _, column, op, list_op = step
+                if op is None:
+                    q = q.filter(negate_if(column == value))
+                elif list_op:
                     q = q.filter(negate_if(op(column, to_list(value))))
-                    filter_applied = True
-                    column = None
                 else:
-                    raise ValueError('No idea what to do with %r' % token)
-            if column is not None:
-                q = q.filter(negate_if(column == value))
-                filter_applied = True
-                column = None
-            if filter_applied is False:
-                raise ValueError('Could not find column for filter "{}"'.format(arg))
-            filter_applied = False
+                    q = q.filter(negate_if(op(column, *to_list(value))))
             q = q.reset_joinpoint()
         return q
 
+    def _resolve_sort_path(self, arg, joins_needed):
+        key = (type(self), SORT, self._filter_by_zero(), arg, get_joins_key(joins_needed))
+        try:
+            return resolution_cache[key]
+        except KeyError:
+            pass
+        joins = []
+        column = None
+        for token in arg.split('__'):
+            column = get_column(self._filter_by_zero(), token, joins_needed + joins)
+            if column and column.impl.uses_objects:
+                joins.append(column)
+                column = None
+        if column is None:
+            raise exceptions.InvalidSort(
+                "You can't sort on {}, {}".format(token, str(arg)))
+        resolution = resolution_cache[key] = tuple(joins), column
+        return resolution
+
+    def _resolve_filter_path(self, arg, joins_needed):
+        """Resolve a ``__``-separated filter argument into the joins and filters it needs.
+
+        Returns a tuple of ``(JOIN, relationship)`` and ``(FILTER, column, operator, is_list_operator)`` steps,
+        cached per query class, entity, argument and the joins made by preceding arguments.
+        """
+        key = (type(self), FILTER, self._filter_by_zero(), arg, get_joins_key(joins_needed))
+        try:
+            return resolution_cache[key]
+        except KeyError:
+            pass
+        steps = []
+        joins = list(joins_needed)
+        column = None
+        for token in arg.split('__'):
+            if column is None:
+                column = get_column(self._filter_by_zero(), token, joins)
+                if column and column.impl.uses_objects:
+                    steps.append((JOIN, column))
+                    joins.append(column)
+                    column = None
+            elif token in self._underscore_operators:
+                steps.append((FILTER, column, self._underscore_operators[token], False))
+                column = None
+            elif token in self._underscore_list_operators:
+                steps.append((FILTER, column, self._underscore_list_operators[token], True))
+                column = None
+            else:
+                raise ValueError('No idea what to do with %r' % token)
+        if column is not None:
+            steps.append((FILTER, column, None, False))
+        if not any(step[0] == FILTER for step in steps):
+            raise ValueError('Could not find column for filter "{}"'.format(arg))
+        resolution = resolution_cache[key] = tuple(steps)
+        return resolution
+
 
 class DjangoQuery(DjangoQueryMixin, Query):
     pass
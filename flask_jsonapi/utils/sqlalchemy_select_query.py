@@ -0,0 +1,84 @@
+"""A ``select()``-based alternative to the legacy ``Query`` used by ``DjangoQuery``.
+
+Statements are built with SQLAlchemy 2.0 constructs only and values are always carried by bound parameters, so
+statements of the same filter/sort/include shape share a cache key and hit the engine's compiled cache.
+"""
+from sqlalchemy import inspect
+from sqlalchemy import select
+
+from flask_jsonapi.utils import sqlalchemy_django_query
+
+
+class StatementQuery:
+    """Generative wrapper around a ``Select`` exposing the subset of the ``Query`` API used by repositories."""
+
+    def __init__(self, entity, session=None, statement=None, joined=()):
+        self.entity = entity
+        self.session = session
+        self.statement = select(entity) if statement is None else statement
+        self.joined = joined
+
+    def _clone(self, statement, joined=None):
+        return type(self)(self.entity, self.session, statement, self.joined if joined is None else joined)
+
+    def _filter_by_zero(self):
+        return inspect(self.entity)
+
+    def filter(self, *criteria):
+        return self._clone(self.statement.where(*criteria))
+
+    def join(self, target):
+        # Paths through the same relationship share a single join, like repeated Django lookups do.
+        key = sqlalchemy_django_query.get_joins_key([target])
+        if key[0] in self.joined:
+            return self
+        return self._clone(self.statement.join(target), self.joined + key)
+
+    def reset_joinpoint(self):
+        return self
+
+    def order_by(self, *clauses):
+        return self._clone(self.statement.order_by(*clauses))
+
+    def options(self, *options):
+        return self._clone(self.statement.options(*options))
+
+    def add_columns(self, *columns):
+        return self._clone(self.statement.add_columns(*columns))
+
+    def limit(self, limit):
+        return self._clone(self.statement.limit(limit))
+
+    def offset(self, offset):
+        return self._clone(self.statement.offset(offset))
+
+    def all(self):
+        return self.get_rows(self.session.execute(self.statement))
+
+    def one(self):
+        return self.session.execute(self.statement).unique().scalar_one()
+
+    def get_rows(self, result):
+        # Like the legacy Query, rows of a single entity are returned as deduplicated entities.
+        result = result.unique()
+        if len(self.statement.column_descriptions) == 1:
+            return result.scalars().all()
+        return result.all()
+
+
+class AsyncStatementQuery(StatementQuery):
+    """``StatementQuery`` executed by an ``AsyncSession``, so ``all()`` and ``one()`` have to be awaited."""
+
+    async def all(self):
+        return self.get_rows(await self.session.execute(self.statement))
+
+    async def one(self):
+        return (await self.session.execute(self.statement)).unique().scalar_one()
+
+
+class DjangoSelectQuery(sqlalchemy_django_query.DjangoQueryMixin, StatementQuery):
+    pass
+
+
+class AsyncDjangoSelectQuery(sqlalchemy_django_query.DjangoQueryMixin, AsyncStatementQuery):
+    pass
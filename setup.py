@@ -21,10 +21,12 @@ setup(
     author='Social WiFi',
     author_email='it@socialwifi.com',
     url='https://github.com/socialwifi/flask-jsonapi',
-    packages=find_packages(exclude=['tests']),
+    packages=find_packages(exclude=['tests', 'benchmarks']),
     install_requires=parse_requirements('base_requirements.txt'),
     extras_require={
-        'sqlalchemy': ['sqlalchemy>=2.0', 'sqlalchemy_utils']
+        'sqlalchemy': ['sqlalchemy>=2.0', 'sqlalchemy_utils'],
+        'orjson': ['orjson'],
+        'async': ['flask[async]', 'sqlalchemy[asyncio]>=2.0'],
     },
     license='BSD',
     classifiers=[
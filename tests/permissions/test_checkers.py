@@ -151,3 +151,189 @@ class TestObjectLevelPermissionChecker:
         result = checker.check_list_permission(resources=[resource0, resource1, resource2, resource3, resource4])
 
         assert result == [resource0, resource4]
+
+    def test_check_list_permission_looks_up_permissions_in_batch(self):
+        checker = PermissionCheckerForTests()
+        resources = [ResourceForTests(uuid.uuid4()) for _ in range(3)]
+        resources.append(ResourceForTests(resources[0].object_id))
+        checker.has_permission = mock.MagicMock()
+        checker.has_permissions = mock.MagicMock(return_value={resources[0].object_id, resources[2].object_id})
+
+        result = checker.check_list_permission(resources=resources)
+
+        assert result == [resources[0], resources[2], resources[3]]
+        checker.has_permissions.assert_called_once_with(
+            [resource.object_id for resource in resources[:3]], permissions.READ_ACTION)
+        checker.has_permission.assert_not_called()
+
+    def test_check_list_permission_of_empty_list(self):
+        checker = PermissionCheckerForTests()
+        checker.has_permissions = mock.MagicMock()
+
+        assert checker.check_list_permission(resources=[]) == []
+        checker.has_permissions.assert_not_called()
+
+    def test_check_list_permission_uses_customized_read_permission(self):
+        class CustomReadPermissionChecker(PermissionCheckerForTests):
+            def check_read_permission(self, *, resource):
+                if resource.object_id.int % 2:
+                    raise permissions.PermissionException
+                return resource
+
+        checker = CustomReadPermissionChecker()
+        resources = [ResourceForTests(uuid.UUID(int=index)) for index in range(4)]
+
+        assert checker.check_list_permission(resources=resources) == [resources[0], resources[2]]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMemoryPermissionCache:
+    def test_expires_decisions(self):
+        clock = Clock()
+        cache = permissions.MemoryPermissionCache(ttl=10, negative_ttl=1, clock=clock)
+        cache.set(('user', 1, permissions.READ_ACTION), True)
+        cache.set(('user', 2, permissions.READ_ACTION), False)
+
+        clock.now = 5
+        assert cache.get(('user', 1, permissions.READ_ACTION)) is True
+        assert cache.get(('user', 2, permissions.READ_ACTION)) is permissions.cache.MISSING
+
+    def test_negative_caching_can_be_disabled(self):
+        cache = permissions.MemoryPermissionCache(negative_ttl=0)
+        cache.set(('user', 1, permissions.READ_ACTION), False)
+        assert cache.get(('user', 1, permissions.READ_ACTION)) is permissions.cache.MISSING
+
+    def test_drops_least_recently_used_decisions(self):
+        cache = permissions.MemoryPermissionCache(max_size=2)
+        cache.set(('user', 1, permissions.READ_ACTION), True)
+        cache.set(('user', 2, permissions.READ_ACTION), True)
+        cache.get(('user', 1, permissions.READ_ACTION))
+        cache.set(('user', 3, permissions.READ_ACTION), True)
+
+        assert cache.get(('user', 1, permissions.READ_ACTION)) is True
+        assert cache.get(('user', 2, permissions.READ_ACTION)) is permissions.cache.MISSING
+        assert len(cache) == 2
+
+    def test_invalidate(self):
+        cache = permissions.MemoryPermissionCache()
+        cache.set(('alice', 1, permissions.READ_ACTION), True)
+        cache.set(('alice', 1, permissions.UPDATE_ACTION), True)
+        cache.set(('bob', 1, permissions.READ_ACTION), True)
+        cache.set(('bob', 2, permissions.READ_ACTION), True)
+
+        cache.invalidate(object_id=1, action=permissions.READ_ACTION)
+
+        assert cache.get(('alice', 1, permissions.READ_ACTION)) is permissions.cache.MISSING
+        assert cache.get(('bob', 1, permissions.READ_ACTION)) is permissions.cache.MISSING
+        assert cache.get(('alice', 1, permissions.UPDATE_ACTION)) is True
+        assert cache.get(('bob', 2, permissions.READ_ACTION)) is True
+
+
+class TestCachedPermissions:
+    @pytest.fixture
+    def checker(self):
+        checker = PermissionCheckerForTests()
+        checker.permission_cache = permissions.MemoryPermissionCache()
+        checker.get_principal = lambda: 'alice'
+        checker.has_permission = mock.MagicMock(return_value=True)
+        return checker
+
+    def test_decisions_are_shared_between_checks(self, checker):
+        resource = ResourceForTests(uuid.uuid4())
+
+        checker.check_read_permission(resource=resource)
+        checker.check_read_permission(resource=resource)
+
+        checker.has_permission.assert_called_once_with(object_id=resource.object_id, action=permissions.READ_ACTION)
+
+    def test_denied_decisions_are_cached(self, checker):
+        checker.has_permission.return_value = False
+        resource = ResourceForTests(uuid.uuid4())
+
+        for _ in range(2):
+            with pytest.raises(permissions.PermissionException):
+                checker.check_destroy_permission(resource=resource)
+
+        assert checker.has_permission.call_count == 1
+
+    def test_decisions_are_cached_per_principal(self, checker):
+        resource = ResourceForTests(uuid.uuid4())
+
+        for principal in ('alice', 'bob', 'alice'):
+            checker.get_principal = lambda: principal
+            checker.check_read_permission(resource=resource)
+
+        assert checker.has_permission.call_count == 2
+
+    def test_principals_get_their_own_decisions(self, checker):
+        resource = ResourceForTests(uuid.uuid4())
+        principal = 'alice'
+        checker.get_principal = lambda: principal
+        checker.has_permission = lambda object_id, action: principal == 'alice'
+
+        checker.check_read_permission(resource=resource)
+        principal = 'bob'
+        with pytest.raises(permissions.PermissionException):
+            checker.check_read_permission(resource=resource)
+        principal = 'alice'
+        checker.check_read_permission(resource=resource)
+
+    def test_decisions_of_unidentified_principal_are_not_shared(self, checker):
+        checker.get_principal = lambda: None
+        resource = ResourceForTests(uuid.uuid4())
+
+        checker.check_read_permission(resource=resource)
+        checker.check_read_permission(resource=resource)
+
+        assert checker.has_permission.call_count == 2
+        assert len(checker.permission_cache) == 0
+
+    def test_list_looks_up_only_uncached_objects(self, checker):
+        resources = [ResourceForTests(uuid.uuid4()) for _ in range(3)]
+        checker.check_read_permission(resource=resources[0])
+        checker.has_permissions = mock.MagicMock(return_value={resources[1].object_id})
+
+        result = checker.check_list_permission(resources=resources)
+
+        assert result == resources[:2]
+        checker.has_permissions.assert_called_once_with(
+            [resources[1].object_id, resources[2].object_id], permissions.READ_ACTION)
+
+    def test_invalidate_permissions(self, checker):
+        resource = ResourceForTests(uuid.uuid4())
+        checker.check_read_permission(resource=resource)
+
+        checker.invalidate_permissions(object_id=resource.object_id)
+        checker.check_read_permission(resource=resource)
+
+        assert checker.has_permission.call_count == 2
+
+
+class TestRequestMemo:
+    def test_update_checks_share_a_lookup(self, app):
+        checker = PermissionCheckerForTests()
+        checker.has_permission = mock.MagicMock(return_value=True)
+        resource = ResourceForTests(uuid.uuid4())
+
+        with app.test_request_context():
+            checker.check_update_permission(resource=resource, data={'object_id': resource.object_id})
+
+        checker.has_permission.assert_called_once_with(object_id=resource.object_id, action=permissions.UPDATE_ACTION)
+
+    def test_memo_is_not_shared_between_requests(self, app):
+        checker = PermissionCheckerForTests()
+        checker.has_permission = mock.MagicMock(return_value=True)
+        resource = ResourceForTests(uuid.uuid4())
+
+        for _ in range(2):
+            with app.test_request_context():
+                checker.check_read_permission(resource=resource)
+
+        assert checker.has_permission.call_count == 2
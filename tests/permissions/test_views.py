@@ -8,12 +8,18 @@ import pytest
 from marshmallow_jsonapi import fields
 
 from flask_jsonapi import exceptions
+from flask_jsonapi import filters_schema
 from flask_jsonapi import permissions
+from flask_jsonapi import response as jsonapi_response
 
 ALLOWED_PARENT_ID = '11111111-1111-1111-1111-111111111111'
 NOT_ALLOWED_PARENT_ID = '22222222-2222-2222-2222-222222222222'
 
 
+class ExampleFilterSchema(filters_schema.FilterSchema):
+    content = filters_schema.FilterField()
+
+
 def viewset_factory(repository_mock):
     class ExampleResourceSchema(marshmallow_jsonapi.Schema):
         id = fields.UUID(required=True)
@@ -46,6 +52,7 @@ def viewset_factory(repository_mock):
         permission_checker = ExamplePermissionChecker()
         repository = repository_mock
         schema = ExampleResourceSchema
+        list_view_kwargs = {'atomic_operations': True}
 
     return ExampleViewSet()
 
@@ -131,7 +138,7 @@ class TestProtectedViewSet:
         repository.get_detail.assert_called_with('33333333-3333-3333-3333-333333333333')
 
     def test_update(self, jsonapi_client, repository):
-        repository.get_detail.return_value = resource_factory(
+        repository.get_detail.return_value = resource = resource_factory(
             id='33333333-3333-3333-3333-333333333333',
             parent_id=ALLOWED_PARENT_ID,
             content='Initial content.',
@@ -151,8 +158,8 @@ class TestProtectedViewSet:
         )
 
         assert response.status_code == 204
-        repository.get_detail.assert_called_with('33333333-3333-3333-3333-333333333333')
-        repository.update.assert_called_with({
+        repository.get_detail.assert_called_once_with('33333333-3333-3333-3333-333333333333')
+        repository.update_instance.assert_called_with(resource, {
             'id': '33333333-3333-3333-3333-333333333333',
             'content': 'Changed content.'
         })
@@ -180,9 +187,10 @@ class TestProtectedViewSet:
         assert response.status_code == 403
         repository.get_detail.assert_called_with('33333333-3333-3333-3333-333333333333')
         repository.update.assert_not_called()
+        repository.update_instance.assert_not_called()
 
     def test_delete(self, jsonapi_client, repository):
-        repository.get_detail.return_value = resource_factory(
+        repository.get_detail.return_value = resource = resource_factory(
             id='33333333-3333-3333-3333-333333333333',
             parent_id=ALLOWED_PARENT_ID,
         )
@@ -190,8 +198,8 @@ class TestProtectedViewSet:
         response = jsonapi_client.delete('/examples/33333333-3333-3333-3333-333333333333')
 
         assert response.status_code == 204
-        repository.get_detail.assert_called_with('33333333-3333-3333-3333-333333333333')
-        repository.delete.assert_called_with('33333333-3333-3333-3333-333333333333')
+        repository.get_detail.assert_called_once_with('33333333-3333-3333-3333-333333333333')
+        repository.delete_instance.assert_called_with(resource)
 
     def test_delete_if_no_permissions(self, jsonapi_client, repository):
         repository.get_detail.return_value = resource_factory(
@@ -204,6 +212,7 @@ class TestProtectedViewSet:
         assert response.status_code == 403
         repository.get_detail.assert_called_with('33333333-3333-3333-3333-333333333333')
         repository.delete.assert_not_called()
+        repository.delete_instance.assert_not_called()
 
     def test_create(self, jsonapi_client, repository):
         response = jsonapi_client.post(
@@ -244,3 +253,144 @@ class TestProtectedViewSet:
 
         assert response.status_code == 403
         repository.create.assert_not_called()
+
+    def test_create_many_if_no_permissions(self, jsonapi_client, repository):
+        response = jsonapi_client.post(
+            '/examples',
+            headers={'Content-Type': jsonapi_response.ATOMIC_MEDIA_TYPE},
+            json={
+                'atomic:operations': [
+                    {
+                        'op': 'add',
+                        'data': {
+                            'type': 'example',
+                            'id': '33333333-3333-3333-3333-333333333333',
+                            'attributes': {'parent_id': ALLOWED_PARENT_ID},
+                        },
+                    },
+                    {
+                        'op': 'add',
+                        'data': {
+                            'type': 'example',
+                            'id': '44444444-4444-4444-4444-444444444444',
+                            'attributes': {'parent_id': NOT_ALLOWED_PARENT_ID},
+                        },
+                    },
+                ],
+            },
+        )
+
+        assert response.status_code == 403
+        repository.create_many.assert_not_called()
+
+    def test_create_many(self, jsonapi_client, repository):
+        repository.create_many.side_effect = lambda data_list: [resource_factory(**data) for data in data_list]
+
+        response = jsonapi_client.post(
+            '/examples',
+            headers={'Content-Type': jsonapi_response.ATOMIC_MEDIA_TYPE},
+            json={
+                'atomic:operations': [{
+                    'op': 'add',
+                    'data': {
+                        'type': 'example',
+                        'id': '33333333-3333-3333-3333-333333333333',
+                        'attributes': {'parent_id': ALLOWED_PARENT_ID},
+                    },
+                }],
+            },
+        )
+
+        assert response.status_code == 200
+        repository.create_many.assert_called_once_with([{
+            'id': uuid.UUID('33333333-3333-3333-3333-333333333333'),
+            'parent_id': uuid.UUID('11111111-1111-1111-1111-111111111111'),
+        }])
+
+
+class TestProtectedBulkOperations:
+    @pytest.fixture
+    def configured_api(self, api, repository):
+        view_set = viewset_factory(repository)
+        view_set.list_view_kwargs = {'bulk_operations': True}
+        view_set.filter_schema = ExampleFilterSchema()
+        api.repository(view_set, 'example', '/examples')
+        return view_set
+
+    def test_bulk_delete_is_denied_by_default(self, configured_api, jsonapi_client, repository):
+        response = jsonapi_client.delete('/examples?filter[content]=old')
+
+        assert response.status_code == 403
+        repository.delete_many.assert_not_called()
+
+    def test_bulk_update_is_limited_by_permission_filter(self, configured_api, jsonapi_client, repository):
+        configured_api.permission_checker.check_update_many_permission = lambda filters, data: data
+        repository.update_many.return_value = 2
+
+        response = jsonapi_client.patch('/examples?filter[content]=old', json={
+            'data': {'type': 'example', 'attributes': {'content': 'new'}},
+        })
+
+        assert response.status_code == 200
+        repository.update_many.assert_called_once_with(
+            {'content': 'old', 'parent_id': ALLOWED_PARENT_ID}, {'content': 'new'})
+
+
+class TestPermissionsInQuery:
+    @pytest.fixture
+    def configured_api(self, api, repository):
+        repository.supports_criteria = True
+        view_set = viewset_factory(repository)
+        view_set.permission_checker.get_permission_criteria = lambda action: ['parent_id = :allowed']
+        api.repository(view_set, 'example', '/examples')
+        return view_set
+
+    def test_list_is_not_filtered_after_query(self, configured_api, jsonapi_client, repository):
+        repository.get_list.return_value = [resource_factory(parent_id=NOT_ALLOWED_PARENT_ID)]
+
+        response = jsonapi_client.get('/examples')
+
+        assert response.status_code == 200
+        assert len(response.get_json(force=True)['data']) == 1
+        repository.get_list.assert_called_with(
+            {'parent_id': ALLOWED_PARENT_ID}, (), {}, criteria=('parent_id = :allowed',))
+
+    def test_count_is_protected(self, configured_api, jsonapi_client, repository):
+        repository.get_list.return_value = [resource_factory(parent_id=ALLOWED_PARENT_ID)]
+        repository.get_count.return_value = 1
+
+        response = jsonapi_client.get('/examples?page[size]=1&page[number]=1')
+
+        assert response.status_code == 200
+        repository.get_count.assert_called_with({'parent_id': ALLOWED_PARENT_ID}, criteria=('parent_id = :allowed',))
+
+    def test_permission_filters(self, configured_api, jsonapi_client, repository):
+        configured_api.permission_checker.get_permission_criteria = lambda action: None
+        configured_api.permission_checker.get_permission_filters = lambda action: {'owner': 'me'}
+        repository.get_list.return_value = [resource_factory(parent_id=NOT_ALLOWED_PARENT_ID)]
+
+        response = jsonapi_client.get('/examples')
+
+        assert len(response.get_json(force=True)['data']) == 1
+        repository.get_list.assert_called_with({'parent_id': ALLOWED_PARENT_ID, 'owner': 'me'}, (), {})
+
+    @pytest.fixture
+    def filtered_api(self, api, repository):
+        view_set = viewset_factory(repository)
+        view_set.filter_schema = ExampleFilterSchema()
+        view_set.permission_checker.get_permission_filters = lambda action: {'content': 'mine'}
+        api.repository(view_set, 'example', '/examples')
+        repository.get_list.return_value = []
+        return view_set
+
+    def test_request_filter_matching_permission_filter(self, filtered_api, jsonapi_client, repository):
+        response = jsonapi_client.get('/examples?filter[content]=mine')
+
+        assert response.status_code == 200
+        repository.get_list.assert_called_with({'content': 'mine', 'parent_id': ALLOWED_PARENT_ID}, (), {})
+
+    def test_request_filter_conflicting_with_permission_filter(self, filtered_api, jsonapi_client, repository):
+        response = jsonapi_client.get('/examples?filter[content]=theirs')
+
+        assert response.status_code == 400
+        repository.get_list.assert_not_called()
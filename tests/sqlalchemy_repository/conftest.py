@@ -37,3 +37,18 @@ def setup_db_schema(request, db_engine, db_session):
     model_base.metadata.create_all(db_engine)
     yield
     model_base.metadata.drop_all(db_engine)
+
+
+@pytest.fixture
+def statements(request, db_engine):
+    """SQL statements executed by the test, only those starting with the indirect parameter when given."""
+    prefix = getattr(request, 'param', None)
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if prefix is None or statement.startswith(prefix):
+            statements.append(statement)
+
+    sqlalchemy.event.listen(db_engine, 'before_cursor_execute', before_cursor_execute)
+    yield statements
+    sqlalchemy.event.remove(db_engine, 'before_cursor_execute', before_cursor_execute)
@@ -0,0 +1,238 @@
+import asyncio
+import datetime
+import json
+
+import flask
+import marshmallow_jsonapi
+import pytest
+import sqlalchemy
+
+from marshmallow_jsonapi import fields
+from sqlalchemy.ext import asyncio as sqlalchemy_asyncio
+
+from flask_jsonapi import exceptions
+from flask_jsonapi import filters_schema
+from flask_jsonapi import resource_repository_views
+from flask_jsonapi.resource_repositories import async_sqlalchemy_repositories
+
+Base = sqlalchemy.orm.declarative_base()
+
+
+class Blog(Base):
+    __tablename__ = 'blogs'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+
+
+class Entry(Base):
+    __tablename__ = 'entries'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    headline = sqlalchemy.Column(sqlalchemy.String)
+    pub_date = sqlalchemy.Column(sqlalchemy.Date)
+    blog_id = sqlalchemy.Column(sqlalchemy.Integer, sqlalchemy.ForeignKey(Blog.id))
+    blog = sqlalchemy.orm.relationship(Blog, backref='entries')
+
+
+class AsyncEntrySchema(marshmallow_jsonapi.Schema):
+    id = fields.Str()
+    headline = fields.Str()
+
+    class Meta:
+        type_ = 'entry'
+        strict = True
+
+
+def get_session_scope():
+    # Flask runs async views in their own task, so sessions of views are scoped to the request instead.
+    if flask.has_request_context():
+        return id(flask.request._get_current_object())
+    return asyncio.current_task()
+
+
+class AsyncEntryFilterSchema(filters_schema.FilterSchema):
+    headline = filters_schema.FilterField()
+
+
+@pytest.fixture
+def async_session(tmp_path):
+    # A file database and no connection pooling, Flask runs every async view in a new event loop.
+    engine = sqlalchemy_asyncio.create_async_engine(
+        'sqlite+aiosqlite:///{}'.format(tmp_path / 'test.db'), poolclass=sqlalchemy.pool.NullPool)
+    session = sqlalchemy_asyncio.async_scoped_session(
+        sqlalchemy_asyncio.async_sessionmaker(engine, expire_on_commit=False), scopefunc=get_session_scope)
+
+    async def setup():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with session() as setup_session:
+            first = Blog(id=1, name='first')
+            second = Blog(id=2, name='second')
+            setup_session.add_all([
+                Entry(id=1, headline='Spring', pub_date=datetime.date(2020, 3, 1), blog=first),
+                Entry(id=2, headline='Summer', pub_date=datetime.date(2020, 6, 1), blog=second),
+                Entry(id=3, headline='Autumn', pub_date=datetime.date(2021, 9, 1), blog=first),
+            ])
+            await setup_session.commit()
+
+    asyncio.run(setup())
+    yield session
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def entry_repository(async_session):
+    class EntryRepository(async_sqlalchemy_repositories.AsyncSqlAlchemyModelRepository):
+        model = Entry
+        instance_name = 'entry'
+        session = async_session
+
+    return EntryRepository()
+
+
+def run(repository, coroutine_function, *args, **kwargs):
+    async def run_and_remove_session():
+        try:
+            return await coroutine_function(*args, **kwargs)
+        finally:
+            await repository.session.remove()
+
+    return asyncio.run(run_and_remove_session())
+
+
+def ids(objects):
+    return [obj.id for obj in objects]
+
+
+class TestAsyncSqlAlchemyModelRepository:
+    def test_filter_and_sort(self, entry_repository):
+        result = run(entry_repository, entry_repository.get_list,
+                     filters={'blog__name': 'first'}, sorting=('-pub_date',))
+        assert ids(result) == [3, 1]
+
+    def test_invalid_sort(self, entry_repository):
+        with pytest.raises(exceptions.InvalidSort):
+            run(entry_repository, entry_repository.get_list, sorting=('unknown',))
+
+    def test_page_pagination(self, entry_repository):
+        result = run(entry_repository, entry_repository.get_list,
+                     sorting=('id',), pagination={'size': 2, 'number': 2})
+        assert ids(result) == [3]
+
+    def test_page_with_window_count(self, entry_repository):
+        entry_repository.count_with_window = True
+        result = run(entry_repository, entry_repository.get_list,
+                     sorting=('id',), pagination={'size': 2, 'number': 1})
+        assert ids(result) == [1, 2]
+        assert result.total_count == 3
+
+    def test_cursor_pagination(self, entry_repository):
+        result = run(entry_repository, entry_repository.get_list,
+                     sorting=('id',), pagination={'size': 1, 'after': (1,)})
+        assert ids(result) == [2, 3]
+
+    def test_include(self, entry_repository):
+        async def get_blog_names():
+            entries = await entry_repository.get_list(sorting=('id',), include=('blog',))
+            return [entry.blog.name for entry in entries]
+
+        assert run(entry_repository, get_blog_names) == ['first', 'second', 'first']
+
+    def test_count(self, entry_repository):
+        assert run(entry_repository, entry_repository.get_count, filters={'pub_date__year': 2020}) == 2
+        assert run(entry_repository, entry_repository.get_count, limit=1) == 1
+
+    def test_criteria(self, entry_repository):
+        criteria = [Entry.headline.in_(['Spring', 'Summer'])]
+        assert ids(run(entry_repository, entry_repository.get_list, sorting=('id',), criteria=criteria)) == [1, 2]
+        assert run(entry_repository, entry_repository.get_count, criteria=criteria) == 2
+
+    def test_get_detail(self, entry_repository):
+        assert run(entry_repository, entry_repository.get_detail, 2).headline == 'Summer'
+
+    def test_get_detail_not_found(self, entry_repository):
+        with pytest.raises(exceptions.ObjectNotFound):
+            run(entry_repository, entry_repository.get_detail, 4)
+
+    def test_create_update_and_delete(self, entry_repository):
+        run(entry_repository, entry_repository.create, {'id': 4, 'headline': 'Winter'})
+        run(entry_repository, entry_repository.update, {'id': 4, 'headline': 'Late winter'})
+        assert run(entry_repository, entry_repository.get_detail, 4).headline == 'Late winter'
+        run(entry_repository, entry_repository.delete, 4)
+        assert run(entry_repository, entry_repository.get_count) == 3
+
+    def test_direct_update_and_delete(self, entry_repository):
+        entry_repository.direct_updates = True
+        entry_repository.direct_deletes = True
+        entry = run(entry_repository, entry_repository.update, {'id': 1, 'headline': 'Early spring'})
+        assert (entry.headline, entry.pub_date) == ('Early spring', datetime.date(2020, 3, 1))
+        with pytest.raises(exceptions.ObjectNotFound):
+            run(entry_repository, entry_repository.update, {'id': 4, 'headline': 'Winter'})
+        run(entry_repository, entry_repository.delete, 1)
+        with pytest.raises(exceptions.ObjectNotFound):
+            run(entry_repository, entry_repository.delete, 1)
+        assert run(entry_repository, entry_repository.get_count) == 2
+
+    def test_create_many(self, entry_repository):
+        entries = run(entry_repository, entry_repository.create_many,
+                      [{'headline': 'Winter'}, {'id': 10, 'headline': 'Late winter'}])
+        assert [entry.headline for entry in entries] == ['Winter', 'Late winter']
+        assert run(entry_repository, entry_repository.get_count) == 5
+
+    def test_update_and_delete_many(self, entry_repository):
+        assert run(entry_repository, entry_repository.update_many, {'pub_date__year': 2020}, {'headline': 'Old'}) == 2
+        assert run(entry_repository, entry_repository.get_count, filters={'headline': 'Old'}) == 2
+        assert run(entry_repository, entry_repository.delete_many, {'blog__name': 'first'}) == 2
+        assert ids(run(entry_repository, entry_repository.get_list)) == [2]
+
+
+@pytest.fixture
+def entry_views(app, api, entry_repository):
+    view_kwargs = {'repository': entry_repository, 'schema': AsyncEntrySchema}
+    api.route(resource_repository_views.AsyncResourceRepositoryListView, 'entry_list', '/entries/',
+              view_kwargs={'filter_schema': AsyncEntryFilterSchema(), **view_kwargs})
+    api.route(resource_repository_views.AsyncResourceRepositoryDetailView, 'entry_detail', '/entries/<int:id>/',
+              view_kwargs=view_kwargs)
+
+    @app.teardown_request
+    async def remove_session(exception=None):
+        await entry_repository.session.remove()
+
+
+@pytest.mark.usefixtures('entry_views')
+class TestAsyncViews:
+    def test_list(self, jsonapi_client):
+        response = jsonapi_client.get('/entries/?filter[headline]=Summer')
+        assert response.status_code == 200
+        assert [entry['id'] for entry in json.loads(response.data)['data']] == ['2']
+
+    def test_list_with_pagination_and_sort(self, jsonapi_client):
+        response = jsonapi_client.get('/entries/?sort=-id&page[size]=2&page[number]=1')
+        assert response.status_code == 200
+        result = json.loads(response.data)
+        assert [entry['id'] for entry in result['data']] == ['3', '2']
+        assert result['links']['last'] == 'http://localhost/entries/?sort=-id&page[size]=2&page[number]=2'
+
+    def test_detail(self, jsonapi_client):
+        response = jsonapi_client.get('/entries/1/')
+        assert response.status_code == 200
+        assert json.loads(response.data)['data']['attributes'] == {'headline': 'Spring'}
+
+    def test_detail_not_found(self, jsonapi_client):
+        response = jsonapi_client.get('/entries/4/')
+        assert response.status_code == 404
+
+    def test_create(self, jsonapi_client):
+        response = jsonapi_client.post('/entries/', data=json.dumps({
+            'data': {'type': 'entry', 'id': '4', 'attributes': {'headline': 'Winter'}},
+        }))
+        assert response.status_code == 201
+        assert json.loads(response.data)['data']['attributes'] == {'headline': 'Winter'}
+
+    def test_update_and_delete(self, jsonapi_client):
+        response = jsonapi_client.patch('/entries/1/', data=json.dumps({
+            'data': {'type': 'entry', 'id': '1', 'attributes': {'headline': 'Early spring'}},
+        }))
+        assert response.status_code == 204
+        assert json.loads(jsonapi_client.get('/entries/1/').data)['data']['attributes'] == {'headline': 'Early spring'}
+        assert jsonapi_client.delete('/entries/1/').status_code == 204
+        assert jsonapi_client.get('/entries/1/').status_code == 404
@@ -54,3 +54,11 @@ class TestBasic:
         assert user.name == 'Mr. Bean'
         user = user_repository.update({'id': 123, 'name': 'Darth Vader'})
         assert user.name == 'Darth Vader'
+
+    def test_get_list_and_count_with_criteria(self, user_repository):
+        user_repository.create({'name': 'Mr. Bean'})
+        user_repository.create({'name': 'Darth Vader'})
+        criteria = [User.name.startswith('Mr')]
+        users = user_repository.get_list(criteria=criteria)
+        assert [user.name for user in users] == ['Mr. Bean']
+        assert user_repository.get_count(criteria=criteria) == 1
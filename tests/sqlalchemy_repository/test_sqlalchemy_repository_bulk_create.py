@@ -0,0 +1,64 @@
+import pytest
+import sqlalchemy
+
+from flask_jsonapi import exceptions
+from flask_jsonapi.resource_repositories import sqlalchemy_repositories
+
+Base = sqlalchemy.orm.declarative_base()
+
+
+class Team(Base):
+    __tablename__ = 'teams'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+
+
+class Player(Base):
+    __tablename__ = 'players'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String, nullable=False, unique=True)
+    team_id = sqlalchemy.Column(sqlalchemy.Integer, sqlalchemy.ForeignKey(Team.id))
+    team = sqlalchemy.orm.relationship(Team)
+
+
+@pytest.fixture
+def player_repository(db_session):
+    class PlayerRepository(sqlalchemy_repositories.SqlAlchemyModelRepository):
+        model = Player
+        instance_name = 'player'
+        session = db_session
+
+    return PlayerRepository()
+
+
+@pytest.mark.parametrize(argnames='setup_db_schema', argvalues=[Base], indirect=True)
+@pytest.mark.usefixtures('setup_db_schema')
+class TestCreateMany:
+    def test_objects_are_returned_in_order(self, player_repository):
+        players = player_repository.create_many([{'name': 'Zoe'}, {'id': 10, 'name': 'Adam'}, {'name': 'Mia'}])
+        assert [player.name for player in players] == ['Zoe', 'Adam', 'Mia']
+        assert players[1].id == 10
+        assert player_repository.get_count() == 3
+
+    @pytest.mark.parametrize('statements', ['INSERT'], indirect=True)
+    def test_rows_are_inserted_with_a_single_insert_statement(self, player_repository, statements):
+        player_repository.create_many([{'name': 'Zoe'}, {'name': 'Adam'}])
+        assert set(statements) == {'INSERT INTO players (name) VALUES (?) RETURNING id, name, team_id'}
+
+    def test_relationships_fall_back_to_building_objects(self, player_repository):
+        team = Team(id=1, name='Reds')
+        players = player_repository.create_many([{'name': 'Zoe', 'team': team}, {'name': 'Adam', 'team_id': 1}])
+        assert [player.team.name for player in players] == ['Reds', 'Reds']
+
+    def test_customized_build_is_used(self, player_repository):
+        class UpperCasePlayerRepository(type(player_repository)):
+            def build(self, kwargs):
+                return super().build(dict(kwargs, name=kwargs['name'].upper()))
+
+        players = UpperCasePlayerRepository().create_many([{'name': 'Zoe'}, {'name': 'Adam'}])
+        assert [player.name for player in players] == ['ZOE', 'ADAM']
+
+    def test_nothing_is_created_when_a_row_fails(self, player_repository):
+        with pytest.raises(exceptions.ForbiddenError):
+            player_repository.create_many([{'name': 'Zoe'}, {'name': 'Adam'}, {'name': 'Zoe'}])
+        assert player_repository.get_count() == 0
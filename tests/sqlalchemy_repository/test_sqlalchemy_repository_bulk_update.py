@@ -0,0 +1,80 @@
+import pytest
+import sqlalchemy
+
+from flask_jsonapi.resource_repositories import sqlalchemy_repositories
+from flask_jsonapi.utils import sqlalchemy_select_query
+
+Base = sqlalchemy.orm.declarative_base()
+
+
+class Team(Base):
+    __tablename__ = 'teams'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    label = sqlalchemy.Column(sqlalchemy.String)
+
+
+class Player(Base):
+    __tablename__ = 'players'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+    active = sqlalchemy.Column(sqlalchemy.Boolean, default=True)
+    team_id = sqlalchemy.Column(sqlalchemy.Integer, sqlalchemy.ForeignKey(Team.id))
+    team = sqlalchemy.orm.relationship(Team)
+
+
+@pytest.fixture(params=[None, sqlalchemy_select_query.DjangoSelectQuery])
+def player_repository(request, db_session):
+    class PlayerRepository(sqlalchemy_repositories.SqlAlchemyModelRepository):
+        model = Player
+        instance_name = 'player'
+        session = db_session
+
+    if request.param:
+        PlayerRepository.query_class = request.param
+    return PlayerRepository()
+
+
+@pytest.fixture
+def players(db_session):
+    reds = Team(id=1, label='Reds')
+    blues = Team(id=2, label='Blues')
+    db_session.add_all([
+        Player(id=1, name='Zoe', team=reds),
+        Player(id=2, name='Adam', team=blues),
+        Player(id=3, name='Mia', team=reds),
+    ])
+    db_session.commit()
+
+
+def active_names(player_repository):
+    return sorted(player.name for player in player_repository.get_list(filters={'active': True}))
+
+
+@pytest.mark.parametrize(argnames='setup_db_schema', argvalues=[Base], indirect=True)
+@pytest.mark.usefixtures('setup_db_schema', 'players')
+class TestBulkUpdateAndDelete:
+    def test_update_many(self, player_repository, statements):
+        assert player_repository.update_many({'name__in': ['Zoe', 'Adam']}, {'active': False}) == 2
+        assert [statement for statement in statements if statement.startswith('UPDATE')] == [
+            'UPDATE players SET active=? WHERE players.name IN (?, ?)',
+        ]
+        assert active_names(player_repository) == ['Mia']
+
+    def test_update_many_through_relationship(self, player_repository):
+        assert player_repository.update_many({'team__label': 'Reds'}, {'active': False}) == 2
+        assert active_names(player_repository) == ['Adam']
+
+    def test_delete_many(self, player_repository, statements):
+        assert player_repository.delete_many({'name': 'Zoe'}) == 1
+        assert [statement for statement in statements if statement.startswith('DELETE')] == [
+            'DELETE FROM players WHERE players.name = ?',
+        ]
+        assert player_repository.get_count() == 2
+
+    def test_delete_many_through_relationship(self, player_repository):
+        assert player_repository.delete_many({'team__label': 'Blues'}) == 1
+        assert active_names(player_repository) == ['Mia', 'Zoe']
+
+    def test_no_rows_matched(self, player_repository):
+        assert player_repository.update_many({'name': 'Nobody'}, {'active': False}) == 0
+        assert player_repository.delete_many({'name': 'Nobody'}) == 0
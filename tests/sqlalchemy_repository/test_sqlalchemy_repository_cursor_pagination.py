@@ -0,0 +1,143 @@
+import datetime
+
+import marshmallow_jsonapi
+import pytest
+import sqlalchemy
+
+from marshmallow_jsonapi import fields
+
+from flask_jsonapi import api
+from flask_jsonapi import exceptions
+from flask_jsonapi import query_string
+from flask_jsonapi import resource_repository_views
+from flask_jsonapi.resource_repositories import sqlalchemy_repositories
+
+Base = sqlalchemy.orm.declarative_base()
+
+
+class User(Base):
+    __tablename__ = 'users'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+    joined = sqlalchemy.Column(sqlalchemy.DateTime)
+
+
+@pytest.fixture
+def user_repository(db_session):
+    class UserRepository(sqlalchemy_repositories.SqlAlchemyModelRepository):
+        model = User
+        instance_name = 'user'
+        session = db_session
+
+    return UserRepository()
+
+
+@pytest.fixture
+def users(user_repository):
+    return [
+        user_repository.create({'id': 1, 'name': 'Kate', 'joined': datetime.datetime(2020, 1, 3)}),
+        user_repository.create({'id': 2, 'name': 'Betty', 'joined': datetime.datetime(2020, 1, 1)}),
+        user_repository.create({'id': 3, 'name': 'Kate', 'joined': datetime.datetime(2020, 1, 2)}),
+        user_repository.create({'id': 4, 'name': 'Mary', 'joined': datetime.datetime(2020, 1, 2)}),
+        user_repository.create({'id': 5, 'name': 'Anna', 'joined': datetime.datetime(2020, 1, 4)}),
+    ]
+
+
+def cursor_for(user, fields):
+    return query_string.decode_cursor(query_string.encode_cursor([getattr(user, field) for field in fields]))
+
+
+@pytest.mark.parametrize(argnames='setup_db_schema', argvalues=[Base], indirect=True)
+@pytest.mark.usefixtures('setup_db_schema')
+class TestCursorPagination:
+    def test_first_page_fetches_one_extra_row(self, user_repository, users):
+        result = user_repository.get_list(pagination={'size': 2, 'after': None, 'before': None})
+        assert result == users[:3]
+
+    def test_after(self, user_repository, users):
+        result = user_repository.get_list(
+            pagination={'size': 2, 'after': cursor_for(users[1], ['id']), 'before': None})
+        assert result == users[2:5]
+
+    def test_before(self, user_repository, users):
+        result = user_repository.get_list(
+            pagination={'size': 2, 'after': None, 'before': cursor_for(users[3], ['id'])})
+        assert result == users[0:3]
+
+    def test_after_with_mixed_sort_directions(self, user_repository, users):
+        kate_1, betty, kate_3, mary, anna = users
+        result = user_repository.get_list(
+            sorting=('name', '-joined'),
+            pagination={'size': 10, 'after': cursor_for(kate_1, ['name', 'joined', 'id']), 'before': None},
+        )
+        assert result == [kate_3, mary]
+
+    def test_before_with_descending_sort(self, user_repository, users):
+        kate_1, betty, kate_3, mary, anna = users
+        result = user_repository.get_list(
+            sorting=('-joined',),
+            pagination={'size': 10, 'after': None, 'before': cursor_for(kate_3, ['joined', 'id'])},
+        )
+        assert result == [anna, kate_1]
+
+    @pytest.mark.parametrize('sort, expected_ids', [
+        ('name', [5, 2, 1, 3, 4, 6, 7]),
+        ('-name', [6, 7, 4, 1, 3, 2, 5]),
+    ])
+    def test_null_sort_values(self, user_repository, users, sort, expected_ids):
+        user_repository.create({'id': 6, 'name': None})
+        user_repository.create({'id': 7, 'name': None})
+        fields = [field for field, _ in query_string.get_cursor_fields([sort])]
+
+        ids, cursor = [], None
+        while True:
+            result = user_repository.get_list(sorting=(sort,), pagination={'size': 2, 'after': cursor, 'before': None})
+            ids.extend(user.id for user in result[:2])
+            if len(result) <= 2:
+                break
+            cursor = cursor_for(result[1], fields)
+        last = user_repository.get_detail(expected_ids[-1])
+        before_last = user_repository.get_list(
+            sorting=(sort,), pagination={'size': 10, 'after': None, 'before': cursor_for(last, fields)})
+
+        assert ids == expected_ids
+        assert [user.id for user in before_last] == expected_ids[:-1]
+
+    def test_cursor_not_matching_sort(self, user_repository, users):
+        with pytest.raises(exceptions.InvalidPage):
+            user_repository.get_list(
+                sorting=('name',),
+                pagination={'size': 2, 'after': cursor_for(users[0], ['id']), 'before': None},
+            )
+
+    def test_sorting_by_related_field(self, user_repository, users):
+        with pytest.raises(exceptions.InvalidSort):
+            user_repository.get_list(sorting=('group__name',), pagination={'size': 2, 'after': None, 'before': None})
+
+    def test_walking_pages_through_view(self, app, user_repository, users):
+        class UserSchema(marshmallow_jsonapi.Schema):
+            id = fields.Int()
+            name = fields.Str()
+
+            class Meta:
+                type_ = 'user'
+
+        class UserListView(resource_repository_views.ResourceRepositoryListView):
+            schema = UserSchema
+            repository = user_repository
+            pagination = query_string.CursorPagination()
+
+        api.Api(app).route(UserListView, 'user_list', '/users/')
+        client = app.test_client()
+        headers = {'Accept': 'application/vnd.api+json'}
+
+        next_link = '/users/?sort=-name&page[size]=2'
+        pages = []
+        while next_link:
+            result = client.get(next_link, headers=headers).get_json(force=True)
+            pages.append([int(item['id']) for item in result['data']])
+            next_link = result['links']['next']
+        previous_result = client.get(result['links']['previous'], headers=headers).get_json(force=True)
+
+        assert pages == [[4, 1], [3, 2], [5]]
+        assert [int(item['id']) for item in previous_result['data']] == [3, 2]
@@ -0,0 +1,73 @@
+import pytest
+import sqlalchemy
+
+from flask_jsonapi import exceptions
+from flask_jsonapi.resource_repositories import sqlalchemy_repositories
+
+Base = sqlalchemy.orm.declarative_base()
+
+
+class Team(Base):
+    __tablename__ = 'teams'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    label = sqlalchemy.Column(sqlalchemy.String)
+
+
+class Player(Base):
+    __tablename__ = 'players'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+    score = sqlalchemy.Column(sqlalchemy.Integer, default=0)
+    team_id = sqlalchemy.Column(sqlalchemy.Integer, sqlalchemy.ForeignKey(Team.id))
+    team = sqlalchemy.orm.relationship(Team)
+
+
+@pytest.fixture
+def player_repository(db_session):
+    class PlayerRepository(sqlalchemy_repositories.SqlAlchemyModelRepository):
+        model = Player
+        instance_name = 'player'
+        session = db_session
+        direct_updates = True
+        direct_deletes = True
+
+    db_session.add(Player(id=1, name='Zoe', score=3))
+    db_session.commit()
+    return PlayerRepository()
+
+
+@pytest.mark.parametrize(argnames='setup_db_schema', argvalues=[Base], indirect=True)
+@pytest.mark.usefixtures('setup_db_schema')
+class TestDirectWrites:
+    def test_update(self, player_repository, statements):
+        player = player_repository.update({'id': 1, 'name': 'Mia'})
+
+        assert len(statements) == 1
+        assert statements[0].startswith('UPDATE players SET name=? WHERE players.id = ? RETURNING')
+        assert player.name == 'Mia'
+        assert player.score == 3
+
+    def test_update_not_found(self, player_repository):
+        with pytest.raises(exceptions.ObjectNotFound):
+            player_repository.update({'id': 2, 'name': 'Mia'})
+
+    def test_update_of_relationship_loads_object(self, player_repository, statements):
+        team = Team(id=1, label='Reds')
+        player_repository.session.add(team)
+        player_repository.session.flush()
+        statements.clear()
+
+        player = player_repository.update({'id': 1, 'team': team})
+
+        assert player.team_id == 1
+        assert statements[0].startswith('SELECT')
+
+    def test_delete(self, player_repository, statements):
+        player_repository.delete(1)
+
+        assert statements == ['DELETE FROM players WHERE players.id = ?']
+        assert player_repository.get_count() == 0
+
+    def test_delete_not_found(self, player_repository):
+        with pytest.raises(exceptions.ObjectNotFound):
+            player_repository.delete(2)
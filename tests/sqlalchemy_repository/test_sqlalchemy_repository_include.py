@@ -0,0 +1,138 @@
+import marshmallow_jsonapi
+import pytest
+import sqlalchemy
+
+from marshmallow_jsonapi import fields
+
+from flask_jsonapi import api
+from flask_jsonapi import resource_repository_views
+from flask_jsonapi.resource_repositories import sqlalchemy_repositories
+
+Base = sqlalchemy.orm.declarative_base()
+
+
+class Company(Base):
+    __tablename__ = 'companies'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+
+
+class Author(Base):
+    __tablename__ = 'authors'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+    company_id = sqlalchemy.Column(sqlalchemy.Integer, sqlalchemy.ForeignKey(Company.id))
+    company = sqlalchemy.orm.relationship(Company)
+
+
+class Article(Base):
+    __tablename__ = 'articles'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    title = sqlalchemy.Column(sqlalchemy.String)
+    writer_id = sqlalchemy.Column(sqlalchemy.Integer, sqlalchemy.ForeignKey(Author.id))
+    writer = sqlalchemy.orm.relationship(Author, backref='articles')
+
+
+class CompanySchema(marshmallow_jsonapi.Schema):
+    id = fields.Int()
+    name = fields.Str()
+
+    class Meta:
+        type_ = 'company'
+
+
+class AuthorSchema(marshmallow_jsonapi.Schema):
+    id = fields.Int()
+    name = fields.Str()
+    company = fields.Relationship(schema=CompanySchema, type_='company', id_field='id')
+
+    class Meta:
+        type_ = 'author'
+
+
+class ArticleSchema(marshmallow_jsonapi.Schema):
+    id = fields.Int()
+    title = fields.Str()
+    author = fields.Relationship(schema=AuthorSchema, type_='author', attribute='writer', id_field='id')
+
+    class Meta:
+        type_ = 'article'
+
+
+@pytest.fixture
+def article_repository(db_session):
+    class ArticleRepository(sqlalchemy_repositories.SqlAlchemyModelRepository):
+        model = Article
+        instance_name = 'article'
+        session = db_session
+        eager_load_includes = True
+
+    return ArticleRepository()
+
+
+@pytest.fixture
+def articles(db_session):
+    acme = Company(id=1, name='ACME')
+    initech = Company(id=2, name='Initech')
+    anna = Author(id=1, name='Anna', company=acme)
+    bob = Author(id=2, name='Bob', company=initech)
+    articles = [
+        Article(id=1, title='First', writer=anna),
+        Article(id=2, title='Second', writer=bob),
+        Article(id=3, title='Third', writer=anna),
+    ]
+    db_session.add_all(articles)
+    db_session.commit()
+    db_session.expunge_all()
+    return articles
+
+
+@pytest.mark.parametrize(argnames='setup_db_schema', argvalues=[Base], indirect=True)
+@pytest.mark.usefixtures('setup_db_schema')
+class TestEagerLoading:
+    def test_get_list_loads_nested_relationships(self, article_repository, articles, statements):
+        result = article_repository.get_list(include=('writer.company',))
+        companies = [article.writer.company.name for article in result]
+        assert companies == ['ACME', 'Initech', 'ACME']
+        assert len(statements) == 3
+
+    def test_get_detail_loads_relationship(self, article_repository, articles, statements):
+        result = article_repository.get_detail(1, include=('writer',))
+        assert result.writer.name == 'Anna'
+        assert len(statements) == 2
+
+    def test_loading_strategy_per_relationship(self, article_repository, articles, statements):
+        article_repository.loading_strategies = {'writer': 'joined', 'writer.company': 'joined'}
+        result = article_repository.get_list(include=('writer.company',))
+        companies = [article.writer.company.name for article in result]
+        assert companies == ['ACME', 'Initech', 'ACME']
+        assert len(statements) == 1
+
+    def test_collection_with_pagination(self, db_engine, article_repository, articles, db_session):
+        class AuthorRepository(sqlalchemy_repositories.SqlAlchemyModelRepository):
+            model = Author
+            instance_name = 'author'
+            session = db_session
+            loading_strategies = {'articles': 'joined'}
+
+        result = AuthorRepository().get_list(pagination={'size': 1, 'number': 1}, include=('articles',))
+        assert [len(author.articles) for author in result] == [2]
+
+    def test_attribute_that_is_not_a_relationship_is_skipped(self, article_repository, articles):
+        result = article_repository.get_list(include=('title',))
+        assert len(result) == 3
+
+    def test_include_through_view(self, app, article_repository, articles, statements):
+        class ArticleListView(resource_repository_views.ResourceRepositoryListView):
+            schema = ArticleSchema
+            repository = article_repository
+
+        api.Api(app).route(ArticleListView, 'article_list', '/articles/')
+        response = app.test_client().get(
+            '/articles/?include=author.company', headers={'Accept': 'application/vnd.api+json'})
+        result = response.get_json(force=True)
+        assert response.status_code == 200
+        assert sorted((item['type'], item['id']) for item in result['included']) == [
+            ('author', 1), ('author', 2), ('company', 1), ('company', 2),
+        ]
+        assert len(statements) == 3
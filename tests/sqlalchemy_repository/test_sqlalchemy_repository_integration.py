@@ -1,6 +1,12 @@
+import json
+
+import marshmallow_jsonapi
 import pytest
 import sqlalchemy
 
+from marshmallow_jsonapi import fields
+
+from flask_jsonapi import permissions
 from flask_jsonapi.resource_repositories import sqlalchemy_repositories
 
 Base = sqlalchemy.orm.declarative_base()
@@ -13,6 +19,22 @@ class User(Base):
     age = sqlalchemy.Column(sqlalchemy.Integer)
 
 
+class UserSchema(marshmallow_jsonapi.Schema):
+    id = fields.Int()
+    name = fields.Str()
+
+    class Meta:
+        type_ = 'user'
+        strict = True
+
+
+class UserPermissionChecker(permissions.ObjectLevelPermissionChecker):
+    object_id_attribute = 'id'
+
+    def has_permission(self, object_id, action):
+        return True
+
+
 @pytest.fixture
 def user_repository(db_session):
     class UserRepository(sqlalchemy_repositories.SqlAlchemyModelRepository):
@@ -32,3 +54,40 @@ class TestIntegration:
         mary = user_repository.create({'id': 3, 'name': 'Mary'})
         users = user_repository.get_list(pagination={'size': 2, 'number': 1}, sorting=['-name'])
         assert users == [mary, kate]
+
+
+@pytest.fixture
+def protected_users(api, user_repository):
+    class UserListView(permissions.ProtectedListView):
+        def _apply_permission_filter(self, filters):
+            return filters
+
+    class UserViewSet(permissions.ProtectedViewSet):
+        list_view_cls = UserListView
+        permission_checker = UserPermissionChecker()
+        repository = user_repository
+        schema = UserSchema
+
+    api.repository(UserViewSet(), 'user', '/users')
+    user_repository.create({'id': 1, 'name': 'Betty'})
+
+
+@pytest.mark.parametrize(argnames='setup_db_schema', argvalues=[Base], indirect=True)
+@pytest.mark.usefixtures('setup_db_schema', 'protected_users')
+@pytest.mark.parametrize('statements', ['SELECT'], indirect=True)
+class TestProtectedWrites:
+    def test_update_loads_resource_once(self, jsonapi_client, user_repository, statements):
+        response = jsonapi_client.patch('/users/1', data=json.dumps({
+            'data': {'type': 'user', 'id': '1', 'attributes': {'name': 'Kate'}},
+        }))
+
+        assert response.status_code == 204
+        assert len(statements) == 1
+        assert user_repository.get_detail(1).name == 'Kate'
+
+    def test_delete_loads_resource_once(self, jsonapi_client, user_repository, statements):
+        response = jsonapi_client.delete('/users/1')
+
+        assert response.status_code == 204
+        assert len(statements) == 1
+        assert user_repository.get_count() == 0
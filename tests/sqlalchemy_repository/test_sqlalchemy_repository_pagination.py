@@ -1,6 +1,9 @@
+from unittest import mock
+
 import pytest
 import sqlalchemy
 
+from flask_jsonapi import exceptions
 from flask_jsonapi.resource_repositories import sqlalchemy_repositories
 
 Base = sqlalchemy.orm.declarative_base()
@@ -57,3 +60,73 @@ class TestPagination:
         user_repository.create({'id': 2, 'name': 'Darth Vader'})
         count = user_repository.get_count()
         assert count == 2
+
+    def test_get_count_with_limit(self, user_repository):
+        user_repository.create({'id': 1, 'name': 'Mr. Bean'})
+        user_repository.create({'id': 2, 'name': 'Darth Vader'})
+        user_repository.create({'id': 3, 'name': 'Dexter'})
+        assert user_repository.get_count(limit=2) == 2
+        assert user_repository.get_count({'name': 'Dexter'}, limit=2) == 1
+
+
+@pytest.mark.parametrize(argnames='setup_db_schema', argvalues=[Base], indirect=True)
+@pytest.mark.usefixtures('setup_db_schema')
+class TestPaginationWithWindowCount:
+    @pytest.fixture
+    def user_repository(self, user_repository):
+        user_repository.count_with_window = True
+        user_repository.create({'id': 1, 'name': 'Mr. Bean'})
+        user_repository.create({'id': 2, 'name': 'Darth Vader'})
+        user_repository.create({'id': 3, 'name': 'Dexter'})
+        return user_repository
+
+    def test_page_with_total_count(self, user_repository):
+        users = user_repository.get_list(pagination={'size': 2, 'number': 2})
+        assert [user.id for user in users] == [3]
+        assert users.total_count == 3
+        assert user_repository.supports_window_functions is True
+
+    def test_total_count_with_filters(self, user_repository):
+        users = user_repository.get_list(filters={'name__startswith': 'D'}, pagination={'size': 1, 'number': 1})
+        assert [user.id for user in users] == [2]
+        assert users.total_count == 2
+
+    def test_empty_page(self, user_repository):
+        users = user_repository.get_list(pagination={'size': 2, 'number': 3})
+        assert users == []
+        assert users.total_count is None
+
+    def test_not_paginated(self, user_repository):
+        users = user_repository.get_list()
+        assert len(users) == 3
+        assert not hasattr(users, 'total_count')
+
+    def test_window_functions_not_supported(self, user_repository):
+        user_repository.window_functions_versions = {'sqlite': (99, 0)}
+
+        users = user_repository.get_list(pagination={'size': 2, 'number': 1})
+
+        assert [user.id for user in users] == [1, 2]
+        assert not hasattr(users, 'total_count')
+        assert user_repository.supports_window_functions is False
+
+    def test_query_errors_are_not_taken_for_missing_window_functions(self, user_repository, monkeypatch):
+        failing_func = mock.Mock()
+        failing_func.count.return_value.over.return_value = sqlalchemy.literal_column('failing_window()')
+        monkeypatch.setattr(sqlalchemy_repositories, 'func', failing_func)
+
+        with pytest.raises(exceptions.ForbiddenError):
+            user_repository.get_list(pagination={'size': 2, 'number': 1})
+        assert user_repository.supports_window_functions is True
+
+    @pytest.mark.parametrize('dialect_name, server_version, supported', [
+        ('postgresql', (8, 3), False),
+        ('postgresql', (16, 2), True),
+        ('mysql', (5, 7, 44), False),
+        ('mysql', (8, 0, 36), True),
+        ('oracle', None, True),
+    ])
+    def test_window_functions_support_of_dialect(self, user_repository, dialect_name, server_version, supported):
+        dialect = mock.Mock(is_mariadb=False, server_version_info=server_version)
+        dialect.name = dialect_name
+        assert user_repository.dialect_supports_window_functions(dialect) is supported
@@ -0,0 +1,129 @@
+import json
+
+import marshmallow_jsonapi
+import pytest
+import sqlalchemy
+
+from marshmallow_jsonapi import fields
+from sqlalchemy import orm
+
+from flask_jsonapi import resource_repository_views
+from flask_jsonapi.resource_repositories import routing
+from flask_jsonapi.resource_repositories import sqlalchemy_repositories
+
+Base = orm.declarative_base()
+
+
+class User(Base):
+    __tablename__ = 'users'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+
+
+class UserSchema(marshmallow_jsonapi.Schema):
+    id = fields.Int()
+    name = fields.Str()
+
+    class Meta:
+        type_ = 'user'
+        strict = True
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def replica_session():
+    engine = sqlalchemy.create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    session = orm.scoped_session(orm.sessionmaker(bind=engine))
+    session.add(User(id=1, name='replica'))
+    session.commit()
+    yield session
+    session.remove()
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def user_repository(app, db_session, replica_session, clock):
+    # The read-your-writes window is tracked in the Flask session.
+    app.secret_key = 'secret'
+
+    class UserRepository(sqlalchemy_repositories.SqlAlchemyModelRepository):
+        model = User
+        instance_name = 'user'
+        session = db_session
+        read_session = replica_session
+        session_router = routing.SessionRouter(read_your_writes_window=5, clock=clock)
+
+    db_session.add(User(id=1, name='primary'))
+    db_session.commit()
+    return UserRepository()
+
+
+@pytest.fixture
+def user_views(api, user_repository):
+    api.repository(resource_repository_views.ResourceRepositoryViewSet(repository=user_repository, schema=UserSchema),
+                   'user', '/users')
+    api.route(resource_repository_views.ResourceRepositoryDetailView, 'primary_user_detail', '/primary-users/<id>',
+              view_kwargs={'repository': user_repository, 'schema': UserSchema, 'force_primary': True})
+
+
+def get_name(client, url='/users/1'):
+    return json.loads(client.get(url).data)['data']['attributes']['name']
+
+
+@pytest.mark.parametrize(argnames='setup_db_schema', argvalues=[Base], indirect=True)
+@pytest.mark.usefixtures('setup_db_schema')
+class TestReadReplicaRouting:
+    def test_reads_outside_requests_use_primary(self, user_repository):
+        assert user_repository.get_detail(1).name == 'primary'
+
+    def test_safe_requests_read_from_replica(self, app, user_repository):
+        with app.test_request_context(method='GET'):
+            assert user_repository.get_detail(1).name == 'replica'
+            assert [user.name for user in user_repository.get_list()] == ['replica']
+            assert user_repository.get_count() == 1
+
+    def test_writing_requests_read_from_primary(self, app, user_repository):
+        with app.test_request_context(method='PATCH'):
+            assert user_repository.get_detail(1).name == 'primary'
+
+    def test_reads_after_write_in_request_use_primary(self, app, user_repository):
+        with app.test_request_context(method='GET'):
+            user_repository.create({'id': 2, 'name': 'new'})
+            assert user_repository.get_count() == 2
+
+    def test_primary_block(self, app, user_repository):
+        with app.test_request_context(method='GET'), routing.primary():
+            assert user_repository.get_detail(1).name == 'primary'
+
+
+@pytest.mark.parametrize(argnames='setup_db_schema', argvalues=[Base], indirect=True)
+@pytest.mark.usefixtures('setup_db_schema', 'user_views')
+class TestReadReplicaViews:
+    def test_get_reads_from_replica(self, jsonapi_client):
+        assert get_name(jsonapi_client) == 'replica'
+
+    def test_read_your_writes_window(self, app, jsonapi_client, clock):
+        response = jsonapi_client.patch('/users/1', data=json.dumps({
+            'data': {'type': 'user', 'id': '1', 'attributes': {'name': 'changed'}},
+        }))
+        assert response.status_code == 204
+
+        assert get_name(jsonapi_client) == 'changed'
+        assert get_name(app.test_client()) == 'replica'
+        clock.now += 10
+        assert get_name(jsonapi_client) == 'replica'
+
+    def test_force_primary(self, jsonapi_client):
+        assert get_name(jsonapi_client, '/primary-users/1') == 'primary'
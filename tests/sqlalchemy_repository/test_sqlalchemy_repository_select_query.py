@@ -0,0 +1,108 @@
+import datetime
+
+import pytest
+import sqlalchemy
+
+from flask_jsonapi import exceptions
+from flask_jsonapi.resource_repositories import sqlalchemy_repositories
+from flask_jsonapi.utils import sqlalchemy_select_query
+
+Base = sqlalchemy.orm.declarative_base()
+
+
+class Blog(Base):
+    __tablename__ = 'blogs'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+
+
+class Entry(Base):
+    __tablename__ = 'entries'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    headline = sqlalchemy.Column(sqlalchemy.String)
+    pub_date = sqlalchemy.Column(sqlalchemy.Date)
+    blog_id = sqlalchemy.Column(sqlalchemy.Integer, sqlalchemy.ForeignKey(Blog.id))
+    blog = sqlalchemy.orm.relationship(Blog, backref='entries')
+
+
+@pytest.fixture
+def entry_repository(db_session):
+    class EntryRepository(sqlalchemy_repositories.SqlAlchemyModelRepository):
+        model = Entry
+        instance_name = 'entry'
+        session = db_session
+        query_class = sqlalchemy_select_query.DjangoSelectQuery
+
+    return EntryRepository()
+
+
+@pytest.fixture
+def entries(db_session):
+    first = Blog(id=1, name='first')
+    second = Blog(id=2, name='second')
+    entries = [
+        Entry(id=1, headline='Spring', pub_date=datetime.date(2020, 3, 1), blog=first),
+        Entry(id=2, headline='Summer', pub_date=datetime.date(2020, 6, 1), blog=second),
+        Entry(id=3, headline='Autumn', pub_date=datetime.date(2021, 9, 1), blog=first),
+    ]
+    db_session.add_all(entries)
+    db_session.commit()
+    return entries
+
+
+def ids(objects):
+    return [obj.id for obj in objects]
+
+
+@pytest.mark.parametrize(argnames='setup_db_schema', argvalues=[Base], indirect=True)
+@pytest.mark.usefixtures('setup_db_schema', 'entries')
+class TestDjangoSelectQuery:
+    def test_filter_through_relationship(self, entry_repository):
+        result = entry_repository.get_list(filters={'blog__name': 'first', 'pub_date__year': 2020})
+        assert ids(result) == [1]
+
+    def test_filters_through_the_same_relationship_share_a_join(self, entry_repository):
+        result = entry_repository.get_list(filters={'blog__name__startswith': 'f', 'blog__name__ne': 'second'})
+        assert ids(result) == [1, 3]
+
+    def test_sort_by_related_field(self, entry_repository):
+        result = entry_repository.get_list(sorting=('-blog__name', 'headline'))
+        assert ids(result) == [2, 3, 1]
+
+    def test_invalid_sort(self, entry_repository):
+        with pytest.raises(exceptions.InvalidSort):
+            entry_repository.get_list(sorting=('unknown',))
+
+    def test_page_with_window_count(self, entry_repository):
+        entry_repository.count_with_window = True
+        result = entry_repository.get_list(sorting=('id',), pagination={'size': 2, 'number': 2})
+        assert ids(result) == [3]
+        assert result.total_count == 3
+
+    def test_joined_collection_is_deduplicated(self, db_session):
+        class BlogRepository(sqlalchemy_repositories.SqlAlchemyModelRepository):
+            model = Blog
+            session = db_session
+            query_class = sqlalchemy_select_query.DjangoSelectQuery
+            loading_strategies = {'entries': 'joined'}
+
+        result = BlogRepository().get_list(sorting=('id',), include=('entries',))
+        assert [sorted(ids(blog.entries)) for blog in result] == [[1, 3], [2]]
+
+    def test_get_detail_not_found(self, entry_repository):
+        with pytest.raises(exceptions.ObjectNotFound):
+            entry_repository.get_detail(4)
+
+    def test_get_count(self, entry_repository):
+        assert entry_repository.get_count({'blog__name': 'first'}) == 2
+
+    def test_statements_differing_in_values_share_a_cache_key(self, entry_repository):
+        def statement(name, year, size, number):
+            query = entry_repository.apply_filters(
+                entry_repository.get_query(), {'blog__name__startswith': name, 'pub_date__year': year})
+            query = entry_repository.apply_sorts(query, ('-blog__name',))
+            return entry_repository.apply_pagination(query, {'size': size, 'number': number}).statement
+
+        first = statement('f', 2020, 10, 1)
+        second = statement('s', 2021, 20, 3)
+        assert first._generate_cache_key() == second._generate_cache_key()
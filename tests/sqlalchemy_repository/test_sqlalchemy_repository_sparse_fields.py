@@ -0,0 +1,111 @@
+import marshmallow_jsonapi
+import pytest
+import sqlalchemy
+
+from marshmallow_jsonapi import fields
+
+from flask_jsonapi import api
+from flask_jsonapi import resource_repository_views
+from flask_jsonapi.resource_repositories import sqlalchemy_repositories
+
+Base = sqlalchemy.orm.declarative_base()
+
+
+class Author(Base):
+    __tablename__ = 'authors'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+    biography = sqlalchemy.Column(sqlalchemy.Text)
+
+
+class Article(Base):
+    __tablename__ = 'articles'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    title = sqlalchemy.Column(sqlalchemy.String)
+    content = sqlalchemy.Column(sqlalchemy.Text)
+    writer_id = sqlalchemy.Column(sqlalchemy.Integer, sqlalchemy.ForeignKey(Author.id))
+    writer = sqlalchemy.orm.relationship(Author)
+
+
+class AuthorSchema(marshmallow_jsonapi.Schema):
+    id = fields.Int()
+    name = fields.Str()
+    biography = fields.Str()
+
+    class Meta:
+        type_ = 'author'
+
+
+class ArticleSchema(marshmallow_jsonapi.Schema):
+    id = fields.Int()
+    title = fields.Str()
+    body = fields.Str(attribute='content')
+    author = fields.Relationship(schema=AuthorSchema, type_='author', attribute='writer', id_field='id')
+
+    class Meta:
+        type_ = 'article'
+
+
+@pytest.fixture
+def article_repository(db_session):
+    class ArticleRepository(sqlalchemy_repositories.SqlAlchemyModelRepository):
+        model = Article
+        instance_name = 'article'
+        session = db_session
+        eager_load_includes = True
+        load_only_sparse_fields = True
+
+    return ArticleRepository()
+
+
+@pytest.fixture
+def articles(db_session):
+    anna = Author(id=1, name='Anna', biography='Long story.')
+    db_session.add_all([
+        Article(id=1, title='First', content='Lorem ipsum.', writer=anna),
+        Article(id=2, title='Second', content='Dolor sit amet.', writer=anna),
+    ])
+    db_session.commit()
+    db_session.expunge_all()
+
+
+def loaded_attributes(instance):
+    state = sqlalchemy.inspect(instance)
+    return set(state.attrs.keys()) - state.unloaded
+
+
+@pytest.mark.parametrize(argnames='setup_db_schema', argvalues=[Base], indirect=True)
+@pytest.mark.usefixtures('setup_db_schema', 'articles')
+class TestLoadOnlySparseFields:
+    def test_get_list_keeps_primary_and_foreign_keys(self, article_repository):
+        result = article_repository.get_list(fields={'': ('title',)})
+        assert [loaded_attributes(article) for article in result] == [{'id', 'title', 'writer_id'}] * 2
+
+    def test_get_detail(self, article_repository):
+        result = article_repository.get_detail(1, fields={'': ('content',)})
+        assert loaded_attributes(result) == {'id', 'content', 'writer_id'}
+
+    def test_included_relationship(self, article_repository):
+        result = article_repository.get_detail(1, include=('writer',), fields={'writer': ('name',)})
+        assert loaded_attributes(result) == {'id', 'title', 'content', 'writer_id', 'writer'}
+        assert loaded_attributes(result.writer) == {'id', 'name'}
+
+    def test_unknown_relationship_path_is_skipped(self, article_repository):
+        result = article_repository.get_detail(1, fields={'title': ('name',)})
+        assert loaded_attributes(result) == {'id', 'title', 'content', 'writer_id'}
+
+    def test_sparse_fields_through_view(self, app, article_repository, statements):
+        class ArticleDetailView(resource_repository_views.ResourceRepositoryDetailView):
+            schema = ArticleSchema
+            repository = article_repository
+
+        api.Api(app).route(ArticleDetailView, 'article_detail', '/articles/<int:id>/')
+        response = app.test_client().get(
+            '/articles/1/?include=author&fields[article]=id,title,author&fields[author]=id,name',
+            headers={'Accept': 'application/vnd.api+json'},
+        )
+        result = response.get_json(force=True)
+        assert response.status_code == 200
+        assert result['data']['attributes'] == {'title': 'First'}
+        assert result['included'][0]['attributes'] == {'name': 'Anna'}
+        assert not any('content' in statement or 'biography' in statement for statement in statements)
@@ -0,0 +1,129 @@
+import datetime
+import json
+
+import marshmallow_jsonapi
+import pytest
+import sqlalchemy
+
+from marshmallow_jsonapi import fields
+
+from flask_jsonapi import resource_repository_views
+from flask_jsonapi.resource_repositories import sqlalchemy_repositories
+
+Base = sqlalchemy.orm.declarative_base()
+
+
+class User(Base):
+    __tablename__ = 'users'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+    updated_at = sqlalchemy.Column(sqlalchemy.DateTime)
+
+
+class Post(Base):
+    __tablename__ = 'posts'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    updated_at = sqlalchemy.Column(sqlalchemy.DateTime)
+    user_id = sqlalchemy.Column(sqlalchemy.Integer, sqlalchemy.ForeignKey(User.id))
+    user = sqlalchemy.orm.relationship(User)
+
+
+class UserSchema(marshmallow_jsonapi.Schema):
+    id = fields.Int()
+    name = fields.Str()
+
+    class Meta:
+        type_ = 'user'
+
+
+class PostSchema(marshmallow_jsonapi.Schema):
+    id = fields.Int()
+    user = fields.Relationship(schema=UserSchema, type_='user', id_field='id')
+
+    class Meta:
+        type_ = 'post'
+
+
+@pytest.fixture
+def user_repository(db_session):
+    class UserRepository(sqlalchemy_repositories.SqlAlchemyModelRepository):
+        model = User
+        instance_name = 'user'
+        session = db_session
+        version_column = 'updated_at'
+
+    return UserRepository()
+
+
+@pytest.mark.parametrize(argnames='setup_db_schema', argvalues=[Base], indirect=True)
+@pytest.mark.usefixtures('setup_db_schema')
+class TestVersion:
+    def test_get_detail_version(self, user_repository):
+        user_repository.create({'id': 1, 'name': 'Mr. Bean', 'updated_at': datetime.datetime(2020, 1, 1)})
+        assert user_repository.get_detail_version(1) == datetime.datetime(2020, 1, 1)
+
+    def test_get_detail_version_when_object_does_not_exist(self, user_repository):
+        assert user_repository.get_detail_version(1) is None
+
+    def test_get_list_version_changes_on_update(self, user_repository):
+        user_repository.create({'id': 1, 'name': 'Mr. Bean', 'updated_at': datetime.datetime(2020, 1, 1)})
+        user_repository.create({'id': 2, 'name': 'Dexter', 'updated_at': datetime.datetime(2020, 1, 2)})
+        version = user_repository.get_list_version()
+        user_repository.update({'id': 1, 'updated_at': datetime.datetime(2020, 1, 3)})
+        assert user_repository.get_list_version() != version
+
+    def test_get_list_version_changes_on_delete(self, user_repository):
+        user_repository.create({'id': 1, 'name': 'Mr. Bean', 'updated_at': datetime.datetime(2020, 1, 1)})
+        user_repository.create({'id': 2, 'name': 'Dexter', 'updated_at': datetime.datetime(2020, 1, 2)})
+        version = user_repository.get_list_version()
+        user_repository.delete(1)
+        assert user_repository.get_list_version() != version
+
+    def test_get_list_version_with_filters(self, user_repository):
+        user_repository.create({'id': 1, 'name': 'Mr. Bean', 'updated_at': datetime.datetime(2020, 1, 1)})
+        user_repository.create({'id': 2, 'name': 'Dexter', 'updated_at': datetime.datetime(2020, 1, 2)})
+        version = user_repository.get_list_version({'name': 'Dexter'})
+        user_repository.update({'id': 1, 'updated_at': datetime.datetime(2020, 1, 3)})
+        assert user_repository.get_list_version({'name': 'Dexter'}) == version
+
+    def test_no_version_column(self, user_repository):
+        user_repository.version_column = None
+        assert user_repository.get_list_version() is None
+
+
+@pytest.fixture
+def post_views(api, db_session):
+    class PostRepository(sqlalchemy_repositories.SqlAlchemyModelRepository):
+        model = Post
+        instance_name = 'post'
+        session = db_session
+        version_column = 'updated_at'
+
+    api.repository(resource_repository_views.ResourceRepositoryViewSet(repository=PostRepository(), schema=PostSchema),
+                   'post', '/posts')
+    db_session.add(Post(id=1, updated_at=datetime.datetime(2020, 1, 1),
+                        user=User(id=1, name='Mr. Bean', updated_at=datetime.datetime(2020, 1, 1))))
+    db_session.commit()
+
+
+@pytest.mark.parametrize(argnames='setup_db_schema', argvalues=[Base], indirect=True)
+@pytest.mark.usefixtures('setup_db_schema', 'post_views')
+class TestVersionEtags:
+    @pytest.mark.parametrize('url', ['/posts/1?include=user', '/posts?include=user'])
+    def test_change_of_included_resource_is_modified(self, jsonapi_client, db_session, url):
+        response = jsonapi_client.get(url)
+        db_session.get(User, 1).name = 'Dexter'
+        db_session.commit()
+
+        modified_response = jsonapi_client.get(url, headers={'If-None-Match': response.headers['ETag']})
+
+        assert modified_response.status_code == 200
+        assert json.loads(modified_response.data)['included'][0]['attributes']['name'] == 'Dexter'
+
+    def test_unchanged_compound_document_is_not_modified(self, jsonapi_client):
+        response = jsonapi_client.get('/posts/1?include=user')
+
+        not_modified_response = jsonapi_client.get(
+            '/posts/1?include=user', headers={'If-None-Match': response.headers['ETag']})
+
+        assert not_modified_response.status_code == 304
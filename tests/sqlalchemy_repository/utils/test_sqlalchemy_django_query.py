@@ -1,6 +1,8 @@
 import datetime
 import unittest
 
+from unittest import mock
+
 from sqlalchemy import Column
 from sqlalchemy import Date
 from sqlalchemy import ForeignKey
@@ -9,9 +11,11 @@ from sqlalchemy import String
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import Session
+from sqlalchemy.orm import configure_mappers
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import relationship
 
+from flask_jsonapi.utils import sqlalchemy_django_query
 from flask_jsonapi.utils.sqlalchemy_django_query import DjangoQuery
 
 
@@ -84,6 +88,32 @@ class BasicTestCase(unittest.TestCase):
         assert eq.order_by('-blog__name', 'id').all() == \
             self.b2.entries + self.b1.entries
 
+    def test_resolved_paths_are_cached(self):
+        eq = self.session.query(self.Entry)
+        eq.filter_by(blog__name__exact='blog1').order_by('-blog__name').all()
+        with mock.patch.object(sqlalchemy_django_query, 'get_column') as get_column:
+            assert eq.filter_by(blog__name__exact='blog2').order_by('-blog__name').all() == self.b2.entries
+            assert eq.exclude_by(blog__name__exact='blog1').all() == self.b2.entries
+        get_column.assert_not_called()
+
+    def test_unresolvable_paths_are_not_cached(self):
+        eq = self.session.query(self.Entry)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                eq.filter_by(blog__name__unknown='blog1')
+        assert not any('blog__name__unknown' in key for key in sqlalchemy_django_query.resolution_cache)
+
+    def test_cache_is_cleared_when_mappers_are_configured(self):
+        self.session.query(self.Entry).filter_by(blog__name='blog1').all()
+        assert sqlalchemy_django_query.resolution_cache
+
+        class Comment(self.Base):
+            entry_id = Column(Integer, ForeignKey('entry.id'))
+            entry = relationship(self.Entry)
+
+        configure_mappers()
+        assert not sqlalchemy_django_query.resolution_cache
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,65 @@
+import gzip
+import zlib
+
+import flask
+import pytest
+
+from flask_jsonapi import compression
+
+BODY = b'{"data": []}' * 100
+
+
+@pytest.fixture
+def compressor():
+    return compression.Compressor(min_size=100)
+
+
+class TestCompressor:
+    def test_gzip(self, app, compressor):
+        with app.test_request_context(headers={'Accept-Encoding': 'gzip, deflate'}):
+            response = compressor.compress_response(flask.make_response(BODY))
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['Vary'] == 'Accept-Encoding'
+        assert int(response.headers['Content-Length']) == len(response.get_data())
+        assert gzip.decompress(response.get_data()) == BODY
+
+    def test_deflate(self, app, compressor):
+        with app.test_request_context(headers={'Accept-Encoding': 'deflate'}):
+            response = compressor.compress_response(flask.make_response(BODY))
+        assert response.headers['Content-Encoding'] == 'deflate'
+        assert zlib.decompress(response.get_data()) == BODY
+
+    def test_encoding_not_accepted(self, app, compressor):
+        with app.test_request_context(headers={'Accept-Encoding': 'br, gzip;q=0'}):
+            response = compressor.compress_response(flask.make_response(BODY))
+        assert 'Content-Encoding' not in response.headers
+        assert response.headers['Vary'] == 'Accept-Encoding'
+        assert response.get_data() == BODY
+
+    def test_body_below_min_size(self, app):
+        compressor = compression.Compressor(min_size=len(BODY) + 1)
+        with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+            response = compressor.compress_response(flask.make_response(BODY))
+        assert 'Content-Encoding' not in response.headers
+        assert response.get_data() == BODY
+
+    def test_streamed_response(self, app, compressor):
+        with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+            response = compressor.compress_response(flask.Response(iter(['{"data": [', ']}'])))
+            assert response.headers['Content-Encoding'] == 'gzip'
+            assert gzip.decompress(response.get_data()) == b'{"data": []}'
+
+    def test_version_etag_becomes_weak(self, app, compressor):
+        with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+            response = flask.make_response(BODY)
+            response.set_etag('version')
+            response = compressor.compress_response(response)
+        assert response.get_etag() == ('version', True)
+
+    def test_compressed_bodies_are_cached(self):
+        compressor = compression.Compressor(min_size=100, cache_size=1)
+        first = compressor.compress(BODY, 'gzip')
+        second = compressor.compress(BODY, 'gzip')
+        assert first is second
+        assert compressor.compress(BODY, 'deflate') is not first
+        assert compressor.compress(BODY, 'gzip') is not first
@@ -1,5 +1,7 @@
 import uuid
 
+from unittest import mock
+
 import marshmallow_jsonapi
 import pytest
 
@@ -195,3 +197,79 @@ class TestFiltersSchemaRelationship:
                 'relationship__renamed_relationship__id': '123',
                 'relationship__attribute': 'text',
             }
+
+
+class TestFilterPlans:
+    def test_plans_cover_allowed_shapes(self):
+        class FirstFiltersSchema(filters_schema.FilterSchema):
+            id = filters_schema.ListFilterField(operators=[None, filters_schema.Operators.IN])
+
+        class SecondFiltersSchema(filters_schema.FilterSchema):
+            title = filters_schema.FilterField(attribute='name', operators=[filters_schema.Operators.NE])
+            relationship = filters_schema.RelationshipFilterField(FirstFiltersSchema, attribute='renamed')
+
+        plans = {key: plan.filter_attribute for key, plan in SecondFiltersSchema.filter_plans.items()}
+        assert plans == {
+            ('title', 'ne'): 'name__ne',
+            ('relationship', 'id'): 'renamed__id',
+            ('relationship', 'id', 'in'): 'renamed__id__in',
+        }
+
+    def test_deserializer_is_created_once(self, app):
+        type_ = mock.Mock(return_value=fields.Int())
+
+        class ExampleFiltersSchema(filters_schema.FilterSchema):
+            ids = filters_schema.ListFilterField(type_=type_, operators=[filters_schema.Operators.IN])
+
+        for query in ('?filter[ids][in]=1,2,3', '?filter[ids][in]=4'):
+            with app.test_request_context(query):
+                parsed_filters = ExampleFiltersSchema().parse()
+        assert parsed_filters == {'ids__in': [4]}
+        type_.assert_called_once_with()
+
+    def test_unknown_shape_error(self, app):
+        class ExampleFiltersSchema(filters_schema.FilterSchema):
+            basic = filters_schema.FilterField()
+
+        with app.test_request_context('?filter[basic][eq][extra]=text'):
+            with pytest.raises(flask_jsonapi.exceptions.InvalidFilters) as error:
+                ExampleFiltersSchema().parse()
+        assert 'attribute field must be specified as the last field in filter' in error.value.detail
+
+    def test_custom_parse_value(self, app):
+        class UpperFilterField(filters_schema.FilterField):
+            def parse_value(self, value):
+                return value.upper()
+
+        class ExampleFiltersSchema(filters_schema.FilterSchema):
+            basic = UpperFilterField()
+
+        with app.test_request_context('?filter[basic]=text'):
+            assert ExampleFiltersSchema().parse() == {'basic': 'TEXT'}
+
+    def test_custom_parse(self, app):
+        class CustomFilterField(filters_schema.FilterField):
+            def parse(self, processed_filter_path, remaining_filter_attributes, value):
+                return {'custom_{}'.format('__'.join(processed_filter_path)): value}
+
+        class FirstFiltersSchema(filters_schema.FilterSchema):
+            name = CustomFilterField()
+
+        class SecondFiltersSchema(filters_schema.FilterSchema):
+            name = CustomFilterField()
+            relationship = filters_schema.RelationshipFilterField(FirstFiltersSchema)
+
+        with app.test_request_context('?filter[name]=x&filter[relationship][name]=y'):
+            assert SecondFiltersSchema().parse() == {'custom_name': 'x', 'custom_relationship__name': 'y'}
+        assert SecondFiltersSchema.filter_plans == {}
+
+    def test_custom_operator_extraction(self, app):
+        class PrefixedOperatorFilterField(filters_schema.FilterField):
+            def _extract_operator_if_present(self, remaining_filter_attributes):
+                return 'i' + super()._extract_operator_if_present(remaining_filter_attributes)
+
+        class ExampleFiltersSchema(filters_schema.FilterSchema):
+            name = PrefixedOperatorFilterField(operators=['exact'])
+
+        with app.test_request_context('?filter[name][exact]=x'):
+            assert ExampleFiltersSchema().parse() == {'name__iexact': 'x'}
@@ -0,0 +1,76 @@
+import datetime
+import decimal
+import uuid
+
+import pytest
+
+from flask_jsonapi import json_backends
+
+DOCUMENT = {
+    'data': {
+        'type': 'example',
+        'id': uuid.UUID('f60717a3-7dc2-4f1a-bdf4-f2804c3127a4'),
+        'attributes': {
+            'created': datetime.datetime(2020, 1, 2, 3, 4, 5),
+            'day': datetime.date(2020, 1, 2),
+            'price': decimal.Decimal('10.50'),
+        },
+    },
+}
+
+ENCODED_DOCUMENT = {
+    'data': {
+        'type': 'example',
+        'id': 'f60717a3-7dc2-4f1a-bdf4-f2804c3127a4',
+        'attributes': {
+            'created': '2020-01-02T03:04:05',
+            'day': '2020-01-02',
+            'price': '10.50',
+        },
+    },
+}
+
+
+class TestJsonBackends:
+    def test_stdlib_backend(self):
+        backend = json_backends.StdlibJsonBackend()
+
+        assert backend.loads(backend.dumps(DOCUMENT)) == ENCODED_DOCUMENT
+
+    def test_orjson_backend(self):
+        pytest.importorskip('orjson')
+        backend = json_backends.OrjsonJsonBackend()
+
+        assert backend.loads(backend.dumps(DOCUMENT)) == ENCODED_DOCUMENT
+
+    def test_unserializable_object(self):
+        with pytest.raises(TypeError):
+            json_backends.StdlibJsonBackend().dumps({'value': object()})
+
+    def test_get_default_backend(self):
+        assert isinstance(json_backends.get_backend(), json_backends.StdlibJsonBackend)
+
+    @pytest.mark.parametrize('backend_class', [json_backends.StdlibJsonBackend, json_backends.OrjsonJsonBackend])
+    def test_dumps_bytes(self, backend_class):
+        if backend_class is json_backends.OrjsonJsonBackend:
+            pytest.importorskip('orjson')
+        backend = backend_class()
+
+        encoded = backend.dumps_bytes(DOCUMENT)
+
+        assert isinstance(encoded, bytes)
+        assert backend.loads(encoded) == ENCODED_DOCUMENT
+
+    def test_set_unavailable_default_backend(self):
+        with pytest.raises(ValueError):
+            json_backends.set_default_backend('unavailable')
+
+        assert json_backends.default_backend_name == json_backends.DEFAULT_BACKEND_NAME
+
+    def test_set_default_backend(self, monkeypatch):
+        backend = json_backends.StdlibJsonBackend()
+        monkeypatch.setitem(json_backends.backends, 'custom', backend)
+        monkeypatch.setattr(json_backends, 'default_backend_name', json_backends.default_backend_name)
+        json_backends.set_default_backend('custom')
+
+        assert json_backends.get_backend() is backend
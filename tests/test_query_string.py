@@ -1,3 +1,6 @@
+import collections
+import datetime
+
 import pytest
 
 from marshmallow_jsonapi import Schema
@@ -6,6 +9,8 @@ from marshmallow_jsonapi import fields
 from flask_jsonapi import exceptions
 from flask_jsonapi import query_string
 
+Resource = collections.namedtuple('Resource', 'id name')
+
 
 @pytest.fixture
 def user_schema():
@@ -104,6 +109,38 @@ class TestSizeNumberPagination:
                 'last': 'http://localhost/prefix/examples/?page[size]=10&page[number]=5'
             }
 
+    def test_links_without_total_count(self, app):
+        with app.test_request_context('/examples/?page[size]=10&page[number]=1'):
+            links = query_string.SizeNumberPagination().get_links(
+                page_size=10, current_page=3, total_count=None, page_length=10)
+            assert links == {
+                'self': 'http://localhost/examples/?page[size]=10&page[number]=3',
+                'first': 'http://localhost/examples/?page[size]=10&page[number]=1',
+                'previous': 'http://localhost/examples/?page[size]=10&page[number]=2',
+                'next': 'http://localhost/examples/?page[size]=10&page[number]=4',
+            }
+
+    def test_links_without_total_count_on_partial_page(self, app):
+        with app.test_request_context('/examples/?page[size]=10&page[number]=1'):
+            links = query_string.SizeNumberPagination().get_links(
+                page_size=10, current_page=1, total_count=None, page_length=3)
+            assert links['next'] is None
+            assert 'last' not in links
+
+    @pytest.mark.parametrize('query, expected', [
+        ('', True),
+        ('?page[count]=true', True),
+        ('?page[count]=false', False),
+    ])
+    def test_parse_count(self, app, query, expected):
+        with app.test_request_context('/examples/{}'.format(query)):
+            assert query_string.SizeNumberPagination().parse_count() is expected
+
+    def test_parse_count_invalid(self, app):
+        with app.test_request_context('/examples/?page[count]=maybe'):
+            with pytest.raises(exceptions.InvalidPage):
+                query_string.SizeNumberPagination().parse_count()
+
 
 class TestSortParser:
     def test_sorting(self, app, sort_parser):
@@ -125,3 +162,101 @@ class TestSortParser:
         with pytest.raises(exceptions.InvalidSort):
             with app.test_request_context('/examples/?sort=role'):
                 sort_parser.parse()
+
+
+class TestCursorPagination:
+    def test_pagination_not_provided(self, app):
+        with app.test_request_context('/examples/'):
+            assert query_string.CursorPagination().parse() == {}
+
+    def test_first_page(self, app):
+        with app.test_request_context('/examples/?page[size]=10'):
+            parsed_pagination = query_string.CursorPagination().parse()
+        assert parsed_pagination == {'size': 10, 'after': None, 'before': None}
+
+    def test_after(self, app):
+        cursor = query_string.encode_cursor(['Kate', datetime.datetime(2020, 1, 2, 3, 4), 5])
+        with app.test_request_context('/examples/?page[size]=10&page[after]={}'.format(cursor)):
+            parsed_pagination = query_string.CursorPagination().parse()
+        assert parsed_pagination == {
+            'size': 10,
+            'after': ['Kate', datetime.datetime(2020, 1, 2, 3, 4), 5],
+            'before': None,
+        }
+
+    @pytest.mark.parametrize('query', [
+        'page[after]=WzFd',
+        'page[size]=x',
+        'page[size]=0',
+        'page[size]=10&page[after]=WzFd&page[before]=WzFd',
+        'page[size]=10&page[after]=invalid',
+        'page[size]=10&page[after]=eyJhIjogMX0',
+    ])
+    def test_invalid(self, app, query):
+        with app.test_request_context('/examples/?{}'.format(query)):
+            with pytest.raises(exceptions.InvalidPage):
+                query_string.CursorPagination().parse()
+
+    def test_links_first_page(self, app):
+        objects = [Resource(id=1, name='a'), Resource(id=2, name='b'), Resource(id=3, name='c')]
+        with app.test_request_context('/examples/?sort=name&page[size]=2'):
+            pagination = query_string.CursorPagination()
+            parsed_pagination = pagination.parse()
+            page = pagination.get_page(objects, parsed_pagination)
+            links = pagination.get_links(objects, parsed_pagination, ('name',))
+        assert page == objects[:2]
+        assert links == {
+            'self': 'http://localhost/examples/?sort=name&page[size]=2',
+            'first': 'http://localhost/examples/?sort=name&page[size]=2',
+            'previous': None,
+            'next': 'http://localhost/examples/?sort=name&page[size]=2&page[after]={}'.format(
+                query_string.encode_cursor(['b', 2])),
+        }
+
+    def test_links_last_page(self, app):
+        cursor = query_string.encode_cursor([2])
+        objects = [Resource(id=3, name='c')]
+        with app.test_request_context('/examples/?page[size]=2&page[after]={}'.format(cursor)):
+            pagination = query_string.CursorPagination()
+            links = pagination.get_links(objects, pagination.parse(), ())
+        assert links == {
+            'self': 'http://localhost/examples/?page[size]=2&page[after]={}'.format(cursor),
+            'first': 'http://localhost/examples/?page[size]=2',
+            'previous': 'http://localhost/examples/?page[size]=2&page[before]={}'.format(
+                query_string.encode_cursor([3])),
+            'next': None,
+        }
+
+    def test_links_before(self, app):
+        cursor = query_string.encode_cursor([4])
+        objects = [Resource(id=1, name='a'), Resource(id=2, name='b'), Resource(id=3, name='c')]
+        with app.test_request_context('/examples/?page[size]=2&page[before]={}'.format(cursor)):
+            pagination = query_string.CursorPagination()
+            parsed_pagination = pagination.parse()
+            page = pagination.get_page(objects, parsed_pagination)
+            links = pagination.get_links(objects, parsed_pagination, ())
+        assert page == objects[1:]
+        assert links['previous'] == 'http://localhost/examples/?page[size]=2&page[before]={}'.format(
+            query_string.encode_cursor([2]))
+        assert links['next'] == 'http://localhost/examples/?page[size]=2&page[after]={}'.format(
+            query_string.encode_cursor([3]))
+
+
+class TestQueryStringTokens:
+    def test_parameter_families(self, app):
+        url = ('/?filter[name]=a&fields[article]=title&sort=-title&include=author&page[size]=10'
+               '&filter[name][ne]=b&sort=id&other=1&page[number]=2&fields[author]=name')
+        with app.test_request_context(url):
+            tokens = query_string.get_tokens()
+        assert tokens.filters == [('filter[name]', 'a'), ('filter[name][ne]', 'b')]
+        assert tokens.fields == [('fields[article]', 'title'), ('fields[author]', 'name')]
+        assert tokens.sort == '-title'
+        assert tokens.include == 'author'
+        assert tokens.page == {'size': '10', 'number': '2'}
+
+    def test_tokens_are_cached_per_request(self, app):
+        with app.test_request_context('/?sort=title'):
+            tokens = query_string.get_tokens()
+            assert query_string.get_tokens() is tokens
+        with app.test_request_context('/?sort=id'):
+            assert query_string.get_tokens().sort == 'id'
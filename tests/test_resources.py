@@ -1,14 +1,22 @@
 import collections
+import gzip
+import json
+import threading
 
 from unittest import mock
 
 import marshmallow_jsonapi
+import pytest
 
 from marshmallow_jsonapi import fields
 
+from flask_jsonapi import compression
+from flask_jsonapi import decorators
 from flask_jsonapi import filters_schema
+from flask_jsonapi import query_string
 from flask_jsonapi import resource_repository_views
 from flask_jsonapi import resources
+from flask_jsonapi import response
 from flask_jsonapi.resource_repositories import repositories
 
 
@@ -183,6 +191,27 @@ def test_integration_bad_content_type_header(api, test_client):
     }
 
 
+@pytest.mark.parametrize('content_type, accept, status_code', [
+    ('application/vnd.api+json', 'application/vnd.api+json', 201),
+    ('application/vnd.api+json; ext="https://jsonapi.org/ext/atomic"', 'application/vnd.api+json', 201),
+    ('application/vnd.api+json;ext="https://jsonapi.org/ext/atomic"', 'text/html, application/vnd.api+json', 201),
+    ('application/vnd.api+json; charset=utf-8', 'application/vnd.api+json', 415),
+    ('application/vnd.api+json; ext="https://example.com/ext/unknown"', 'application/vnd.api+json', 415),
+    ('application/json', 'application/vnd.api+json', 415),
+    ('application/vnd.api+json', 'application/vnd.api+json; ext="https://example.com/ext/unknown"', 406),
+    ('application/vnd.api+json', 'application/vnd.api+json; profile="https://example.com/profile"', 406),
+])
+def test_integration_media_type_parameters(app, test_client, content_type, accept, status_code):
+    @app.route('/examples/', methods=['POST'])
+    @decorators.check_headers
+    def create_example():
+        return '', 201
+
+    response = test_client.post('/examples/', headers={'Content-Type': content_type, 'Accept': accept})
+
+    assert response.status_code == status_code
+
+
 def test_integration_get_filtered_list(api, jsonapi_client):
     class ExampleFiltersSchema(filters_schema.FilterSchema):
         basic = filters_schema.FilterField()
@@ -628,3 +657,570 @@ class TestAllowedActions:
         assert len(result['errors']) == 1
         error = result['errors'][0]
         assert error['detail'] == 'Delete is not allowed for this resource'
+
+
+def test_integration_get_streamed_list_with_pagination(api, jsonapi_client):
+    class ExampleListView(resources.ResourceList):
+        schema = ExampleSchema
+        stream = True
+
+        def read_many(self, filters, sorting, pagination):
+            return [
+                resource_factory(id='f60717a3-7dc2-4f1a-bdf4-f2804c3127a4', body='heheh'),
+                resource_factory(id='f60717a3-7dc2-4f1a-bdf4-f2804c3127a5', body='hihi'),
+            ]
+
+        def get_count(self, filters):
+            return 5
+
+    api.route(ExampleListView, 'example_list', '/examples/')
+
+    response = jsonapi_client.get('/examples/?page[size]=2&page[number]=1')
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.get_json(force=True) == {
+        'data': [
+            {
+                'type': 'example',
+                'id': 'f60717a3-7dc2-4f1a-bdf4-f2804c3127a4',
+                'attributes': {
+                    'body': 'heheh'
+                }
+            },
+            {
+                'type': 'example',
+                'id': 'f60717a3-7dc2-4f1a-bdf4-f2804c3127a5',
+                'attributes': {
+                    'body': 'hihi'
+                }
+            }
+        ],
+        'links': {
+            'self': 'http://localhost/examples/?page[size]=2&page[number]=1',
+            'first': 'http://localhost/examples/?page[size]=2&page[number]=1',
+            'previous': None,
+            'next': 'http://localhost/examples/?page[size]=2&page[number]=2',
+            'last': 'http://localhost/examples/?page[size]=2&page[number]=3'
+        },
+        'meta': {
+            'count': 2
+        },
+        'jsonapi': {
+            'version': '1.0'
+        }
+    }
+
+
+def test_integration_get_streamed_list_with_invalid_sparse_fields(api, jsonapi_client):
+    class ExampleListView(resources.ResourceList):
+        schema = ExampleSchema
+        stream = True
+
+        def read_many(self, filters, sorting, pagination):
+            return [resource_factory(id='f60717a3-7dc2-4f1a-bdf4-f2804c3127a4', body='heheh')]
+
+    api.route(ExampleListView, 'example_list', '/examples/')
+
+    response = jsonapi_client.get('/examples/?fields[example]=unknown')
+
+    assert response.status_code == 500
+    assert response.get_json(force=True)['errors'][0]['source'] == {'component': 'schema'}
+
+
+def test_integration_create_resource_malformed_body(api, jsonapi_client):
+    class ExampleListView(resources.ResourceList):
+        schema = ExampleSchema
+
+    api.route(ExampleListView, 'example_list', '/examples/')
+
+    response = jsonapi_client.post('/examples/', data='{"data": ')
+
+    assert response.status_code == 400
+    assert response.get_json(force=True)['errors'][0]['detail'] == 'Request body is not a valid JSON document.'
+
+
+class TestConditionalGet:
+    class ExampleDetailView(resources.ResourceDetail):
+        schema = ExampleSchema
+        version = None
+        read_ids = []
+
+        def read(self, id):
+            self.read_ids.append(id)
+            return resource_factory(id=id, body='Gwynbelidd')
+
+        def get_version(self, id):
+            return self.version
+
+    class ExampleListView(resources.ResourceList):
+        schema = ExampleSchema
+
+        def read_many(self, filters, sorting, pagination):
+            pytest.fail('Objects should not be read when the version did not change.')
+
+        def get_version(self, filters):
+            return 7
+
+    def test_etag_is_computed_from_body(self, api, jsonapi_client):
+        api.route(self.ExampleDetailView, 'example_detail', '/examples/<id>/')
+
+        response = jsonapi_client.get('/examples/f60717a3-7dc2-4f1a-bdf4-f2804c3127a4/')
+
+        assert response.status_code == 200
+        etag, is_weak = response.get_etag()
+        assert etag is not None and not is_weak
+        not_modified_response = jsonapi_client.get(
+            '/examples/f60717a3-7dc2-4f1a-bdf4-f2804c3127a4/',
+            headers={'If-None-Match': response.headers['ETag']},
+        )
+        assert not_modified_response.status_code == 304
+        assert not_modified_response.data == b''
+
+    def test_etags_disabled(self, api, jsonapi_client):
+        api.route(self.ExampleDetailView, 'example_detail', '/examples/<id>/', view_kwargs={'use_etags': False})
+
+        response = jsonapi_client.get('/examples/f60717a3-7dc2-4f1a-bdf4-f2804c3127a4/')
+
+        assert response.status_code == 200
+        assert 'ETag' not in response.headers
+
+    def test_detail_not_modified_skips_reading(self, api, jsonapi_client, monkeypatch):
+        monkeypatch.setattr(self.ExampleDetailView, 'version', 3)
+        monkeypatch.setattr(self.ExampleDetailView, 'read_ids', [])
+        api.route(self.ExampleDetailView, 'example_detail', '/examples/<id>/')
+        response = jsonapi_client.get('/examples/f60717a3-7dc2-4f1a-bdf4-f2804c3127a4/')
+        assert response.status_code == 200
+
+        not_modified_response = jsonapi_client.get(
+            '/examples/f60717a3-7dc2-4f1a-bdf4-f2804c3127a4/',
+            headers={'If-None-Match': response.headers['ETag']},
+        )
+
+        assert not_modified_response.status_code == 304
+        assert not_modified_response.headers['ETag'] == response.headers['ETag']
+        assert self.ExampleDetailView.read_ids == ['f60717a3-7dc2-4f1a-bdf4-f2804c3127a4']
+
+    def test_list_not_modified_skips_reading(self, api, app, jsonapi_client):
+        api.route(self.ExampleListView, 'example_list', '/examples/')
+        with app.test_request_context('/examples/?sort=body'):
+            etag = self.ExampleListView(schema=ExampleSchema).make_version_etag(7)
+
+        response = jsonapi_client.get('/examples/?sort=body', headers={'If-None-Match': '"{}"'.format(etag)})
+
+        assert response.status_code == 304
+
+
+def test_integration_get_compressed(api, jsonapi_client):
+    class ExampleListView(resources.ResourceList):
+        schema = ExampleSchema
+        compressor = compression.Compressor(min_size=0)
+
+        def read_many(self, filters, sorting, pagination):
+            return [resource_factory(id='f60717a3-7dc2-4f1a-bdf4-f2804c3127a4', body='heheh')]
+
+    api.route(ExampleListView, 'example_list', '/examples/')
+
+    response = jsonapi_client.get('/examples/', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(response.data)) == {
+        'data': [
+            {
+                'id': 'f60717a3-7dc2-4f1a-bdf4-f2804c3127a4',
+                'type': 'example',
+                'attributes': {
+                    'body': 'heheh'
+                }
+            }
+        ],
+        'jsonapi': {
+            'version': '1.0'
+        },
+        'meta': {
+            'count': 1
+        }
+    }
+    not_modified_response = jsonapi_client.get(
+        '/examples/',
+        headers={'Accept-Encoding': 'gzip', 'If-None-Match': response.headers['ETag']},
+    )
+    assert not_modified_response.status_code == 304
+
+
+@pytest.mark.parametrize('compressor', [None, compression.Compressor(min_size=0)])
+def test_integration_custom_response_make_response(api, jsonapi_client, compressor):
+    class PlainTextResponse(response.BaseResponse):
+        def make_response(self):
+            flask_response = super().make_response()
+            flask_response.headers['Content-Type'] = 'text/plain'
+            return flask_response
+
+        def get_content(self):
+            return 'plain'
+
+    class ExampleDetailView(resources.ResourceDetail):
+        schema = ExampleSchema
+
+        def get(self, *args, **kwargs):
+            return PlainTextResponse()
+
+    api.route(ExampleDetailView, 'example_detail', '/examples/<id>/', view_kwargs={'compressor': compressor})
+
+    result = jsonapi_client.get('/examples/1/', headers={'Accept-Encoding': 'gzip'})
+
+    assert result.status_code == 200
+    assert result.headers['Content-Type'] == 'text/plain'
+    assert result.headers.get('Content-Encoding') == ('gzip' if compressor else None)
+
+
+class TestCountPolicy:
+    class ExampleListView(resources.ResourceList):
+        schema = ExampleSchema
+        count_calls = []
+
+        def read_many(self, filters, sorting, pagination):
+            return [
+                resource_factory(id='f60717a3-7dc2-4f1a-bdf4-f2804c3127a4', body='heheh'),
+                resource_factory(id='f60717a3-7dc2-4f1a-bdf4-f2804c3127a5', body='hihi'),
+            ]
+
+        def get_count(self, filters, limit=None):
+            self.count_calls.append(limit)
+            return min(50, limit or 50)
+
+    @pytest.fixture(autouse=True)
+    def reset_count_calls(self, monkeypatch):
+        monkeypatch.setattr(self.ExampleListView, 'count_calls', [])
+
+    def test_count_disabled_by_request(self, api, jsonapi_client):
+        api.route(self.ExampleListView, 'example_list', '/examples/')
+
+        response = jsonapi_client.get('/examples/?page[size]=2&page[number]=1&page[count]=false')
+
+        result = response.get_json(force=True)
+        assert result['links'] == {
+            'self': 'http://localhost/examples/?page[size]=2&page[count]=false&page[number]=1',
+            'first': 'http://localhost/examples/?page[size]=2&page[count]=false&page[number]=1',
+            'previous': None,
+            'next': 'http://localhost/examples/?page[size]=2&page[count]=false&page[number]=2',
+        }
+        assert result['meta'] == {'count': 2}
+        assert self.ExampleListView.count_calls == []
+
+    def test_count_disabled_by_view(self, api, jsonapi_client):
+        api.route(self.ExampleListView, 'example_list', '/examples/', view_kwargs={
+            'count_policy': query_string.CountPolicy.NONE,
+        })
+
+        response = jsonapi_client.get('/examples/?page[size]=2&page[number]=1&page[count]=true')
+
+        assert 'last' not in response.get_json(force=True)['links']
+        assert self.ExampleListView.count_calls == []
+
+    def test_capped_count_above_cap(self, api, jsonapi_client):
+        api.route(self.ExampleListView, 'example_list', '/examples/', view_kwargs={
+            'count_policy': query_string.CountPolicy.CAPPED,
+            'count_cap': 10,
+        })
+
+        response = jsonapi_client.get('/examples/?page[size]=2&page[number]=1')
+
+        result = response.get_json(force=True)
+        assert 'last' not in result['links']
+        assert result['meta'] == {'count': 2, 'total_count_more_than': 10}
+        assert self.ExampleListView.count_calls == [11]
+
+    def test_capped_count_below_cap(self, api, jsonapi_client):
+        api.route(self.ExampleListView, 'example_list', '/examples/', view_kwargs={
+            'count_policy': query_string.CountPolicy.CAPPED,
+            'count_cap': 100,
+        })
+
+        response = jsonapi_client.get('/examples/?page[size]=2&page[number]=1')
+
+        result = response.get_json(force=True)
+        assert result['links']['last'] == 'http://localhost/examples/?page[size]=2&page[number]=25'
+        assert result['meta'] == {'count': 2}
+
+    def test_invalid_count_parameter(self, api, jsonapi_client):
+        api.route(self.ExampleListView, 'example_list', '/examples/')
+
+        response = jsonapi_client.get('/examples/?page[size]=2&page[number]=1&page[count]=maybe')
+
+        assert response.status_code == 400
+
+
+def test_integration_pagination_with_overridden_pagination_links(api, jsonapi_client):
+    class ExampleListView(resources.ResourceList):
+        schema = ExampleSchema
+
+        def read_many(self, filters, sorting, pagination):
+            return [resource_factory(id='f60717a3-7dc2-4f1a-bdf4-f2804c3127a4', body='heheh')]
+
+        def get_pagination_links(self, parsed_pagination, parsed_filters):
+            return {'self': 'custom'}
+
+    api.route(ExampleListView, 'example_list', '/examples/')
+
+    response = jsonapi_client.get('/examples/?page[size]=1&page[number]=1')
+
+    assert response.get_json(force=True)['links'] == {'self': 'custom'}
+
+
+def test_integration_pagination_with_total_count_from_repository(api, jsonapi_client):
+    class ExampleListView(resources.ResourceList):
+        schema = ExampleSchema
+
+        def read_many(self, filters, sorting, pagination):
+            return repositories.CountedList([
+                resource_factory(id='f60717a3-7dc2-4f1a-bdf4-f2804c3127a4', body='heheh'),
+            ], total_count=7)
+
+        def get_count(self, filters, limit=None):
+            pytest.fail('Total count should be taken from the page.')
+
+    api.route(ExampleListView, 'example_list', '/examples/')
+
+    response = jsonapi_client.get('/examples/?page[size]=1&page[number]=1')
+
+    assert response.get_json(force=True)['links']['last'] == 'http://localhost/examples/?page[size]=1&page[number]=7'
+
+
+class TestViewReuse:
+    def test_view_is_created_once_per_route(self, api, jsonapi_client):
+        instances = []
+
+        class ExampleDetailView(resources.ResourceDetail):
+            schema = ExampleSchema
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                instances.append(self)
+
+            def read(self, id):
+                return resource_factory(id=self.kwargs['id'], body=str(id))
+
+        api.route(ExampleDetailView, 'example_detail', '/examples/<id>/')
+
+        bodies = [
+            jsonapi_client.get('/examples/{}/'.format(id)).get_json(force=True)['data']['attributes']['body']
+            for id in ('f60717a3-7dc2-4f1a-bdf4-f2804c3127a4', '0d6a7ee1-06fa-4e2a-8e87-b1dd7a1f8f2b')
+        ]
+
+        assert bodies == ['f60717a3-7dc2-4f1a-bdf4-f2804c3127a4', '0d6a7ee1-06fa-4e2a-8e87-b1dd7a1f8f2b']
+        assert len(instances) == 1
+        assert instances[0].context is None
+
+    def test_concurrent_requests_keep_their_own_context(self, api, app):
+        started = threading.Barrier(2)
+
+        class ExampleDetailView(resources.ResourceDetail):
+            schema = ExampleSchema
+
+            def read(self, id):
+                started.wait(timeout=5)
+                return resource_factory(id=self.resource_id, body='Gwynbelidd')
+
+        api.route(ExampleDetailView, 'example_detail', '/examples/<id>/')
+        ids = ['f60717a3-7dc2-4f1a-bdf4-f2804c3127a4', '0d6a7ee1-06fa-4e2a-8e87-b1dd7a1f8f2b']
+        results = {}
+
+        def get(id):
+            response = app.test_client().get(
+                '/examples/{}/'.format(id), headers={'Accept': 'application/vnd.api+json'})
+            results[id] = response.get_json(force=True)['data']['id']
+
+        threads = [threading.Thread(target=get, args=(id,)) for id in ids]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {id: id for id in ids}
+
+
+class TestAtomicOperations:
+    headers = {'Content-Type': response.ATOMIC_MEDIA_TYPE, 'Accept': response.ATOMIC_MEDIA_TYPE}
+
+    class ExampleListView(resources.ResourceList):
+        schema = ExampleSchema
+        atomic_operations = True
+
+        def create_many(self, data_list, **kwargs):
+            self.created.append(data_list)
+            return [resource_factory(**data) for data in data_list]
+
+    @pytest.fixture(autouse=True)
+    def reset_created(self, monkeypatch):
+        monkeypatch.setattr(self.ExampleListView, 'created', [], raising=False)
+
+    @staticmethod
+    def add_operation(id, body):
+        return {'op': 'add', 'data': {'type': 'example', 'id': id, 'attributes': {'body': body}}}
+
+    def test_add_operations(self, api, test_client):
+        api.route(self.ExampleListView, 'example_list', '/examples/')
+
+        result = test_client.post('/examples/', headers=self.headers, json={'atomic:operations': [
+            self.add_operation('f60717a3-7dc2-4f1a-bdf4-f2804c3127a4', 'first'),
+            self.add_operation('f60717a3-7dc2-4f1a-bdf4-f2804c3127a5', 'second'),
+        ]})
+
+        assert result.status_code == 200
+        assert response.ATOMIC_MEDIA_TYPE in result.headers.getlist('Content-Type')
+        assert result.get_json(force=True) == {
+            'atomic:results': [
+                {'data': {'type': 'example', 'id': 'f60717a3-7dc2-4f1a-bdf4-f2804c3127a4',
+                          'attributes': {'body': 'first'}}},
+                {'data': {'type': 'example', 'id': 'f60717a3-7dc2-4f1a-bdf4-f2804c3127a5',
+                          'attributes': {'body': 'second'}}},
+            ],
+            'jsonapi': {'version': '1.1', 'ext': [response.ATOMIC_EXTENSION]},
+        }
+        assert len(self.ExampleListView.created) == 1
+
+    def test_all_invalid_operations_are_reported(self, api, test_client):
+        api.route(self.ExampleListView, 'example_list', '/examples/')
+
+        result = test_client.post('/examples/', headers=self.headers, json={'atomic:operations': [
+            self.add_operation('f60717a3-7dc2-4f1a-bdf4-f2804c3127a4', 'first'),
+            self.add_operation('not-a-uuid', 'second'),
+            self.add_operation('also-not-a-uuid', 'third'),
+        ]})
+
+        assert result.status_code == 422
+        pointers = [error['source']['pointer'] for error in result.get_json(force=True)['errors']]
+        assert pointers == ['/atomic:operations/1/data/id', '/atomic:operations/2/data/id']
+        assert self.ExampleListView.created == []
+
+    @pytest.mark.parametrize('operation', [
+        {'op': 'remove', 'ref': {'type': 'example', 'id': 'f60717a3-7dc2-4f1a-bdf4-f2804c3127a4'}},
+        {'op': 'add', 'ref': {'type': 'example', 'id': '1', 'relationship': 'comments'}, 'data': []},
+        'add',
+    ])
+    def test_only_add_operations_are_supported(self, api, test_client, operation):
+        api.route(self.ExampleListView, 'example_list', '/examples/')
+
+        result = test_client.post('/examples/', headers=self.headers, json={'atomic:operations': [operation]})
+
+        assert result.status_code == 400
+        assert result.get_json(force=True)['errors'][0]['source'] == {'pointer': '/atomic:operations/0'}
+
+    @pytest.mark.parametrize('document', [{'atomic:operations': []}, {'data': {}}, []])
+    def test_operations_are_required(self, api, test_client, document):
+        api.route(self.ExampleListView, 'example_list', '/examples/')
+
+        result = test_client.post('/examples/', headers=self.headers, json=document)
+
+        assert result.status_code == 400
+        assert result.get_json(force=True)['errors'][0]['source'] == {'pointer': '/atomic:operations'}
+
+    def test_atomic_operations_are_opt_in(self, api, test_client):
+        api.route(self.ExampleListView, 'example_list', '/examples/', view_kwargs={'atomic_operations': False})
+
+        result = test_client.post('/examples/', headers=self.headers, json={'atomic:operations': [
+            self.add_operation('f60717a3-7dc2-4f1a-bdf4-f2804c3127a4', 'first'),
+        ]})
+
+        assert result.status_code == 415
+        assert self.ExampleListView.created == []
+
+    def test_repository_view_creates_in_bulk(self, api, test_client):
+        repository = mock.Mock()
+        repository.create_many.side_effect = lambda data_list: [resource_factory(**data) for data in data_list]
+        api.route(resource_repository_views.ResourceRepositoryListView, 'example_list', '/examples/', view_kwargs={
+            'schema': ExampleSchema, 'repository': repository, 'atomic_operations': True})
+
+        result = test_client.post('/examples/', headers=self.headers, json={'atomic:operations': [
+            self.add_operation('f60717a3-7dc2-4f1a-bdf4-f2804c3127a4', 'first'),
+            self.add_operation('f60717a3-7dc2-4f1a-bdf4-f2804c3127a5', 'second'),
+        ]})
+
+        assert result.status_code == 200
+        assert repository.create_many.call_count == 1
+        assert [data['body'] for data in repository.create_many.call_args.args[0]] == ['first', 'second']
+
+
+class TestBulkOperations:
+    class ExampleFiltersSchema(filters_schema.FilterSchema):
+        body = filters_schema.FilterField()
+
+    class ExampleListView(resources.AllowedActionsResourceListMixin, resources.ResourceList):
+        schema = ExampleSchema
+        bulk_operations = True
+        allowed_actions = (resources.Actions.update_many, resources.Actions.destroy_many)
+
+        def update_many(self, filters, data, **kwargs):
+            self.calls.append(('update', filters, data))
+            return 2
+
+        def destroy_many(self, filters):
+            self.calls.append(('delete', filters))
+            return 3
+
+    @pytest.fixture(autouse=True)
+    def register_view(self, api, monkeypatch):
+        monkeypatch.setattr(self.ExampleListView, 'calls', [], raising=False)
+        api.route(self.ExampleListView, 'example_list', '/examples/',
+                  view_kwargs={'filter_schema': self.ExampleFiltersSchema()})
+
+    def test_update(self, jsonapi_client):
+        response = jsonapi_client.patch('/examples/?filter[body]=old', json={
+            'data': {'type': 'example', 'attributes': {'body': 'new'}},
+        })
+
+        assert response.status_code == 200
+        assert response.get_json(force=True) == {'meta': {'count': 2}, 'jsonapi': {'version': '1.0'}}
+        assert self.ExampleListView.calls == [('update', {'body': 'old'}, {'body': 'new'})]
+
+    def test_delete(self, jsonapi_client):
+        response = jsonapi_client.delete('/examples/?filter[body]=old')
+
+        assert response.status_code == 200
+        assert response.get_json(force=True)['meta'] == {'count': 3}
+        assert self.ExampleListView.calls == [('delete', {'body': 'old'})]
+
+    @pytest.mark.parametrize('method', ['patch', 'delete'])
+    def test_filters_are_required(self, jsonapi_client, method):
+        response = getattr(jsonapi_client, method)('/examples/', json={
+            'data': {'type': 'example', 'attributes': {'body': 'new'}},
+        })
+
+        assert response.status_code == 400
+        assert response.get_json(force=True)['errors'][0]['source'] == {'parameter': 'filters'}
+        assert self.ExampleListView.calls == []
+
+    def test_ids_can_not_be_updated(self, jsonapi_client):
+        response = jsonapi_client.patch('/examples/?filter[body]=old', json={
+            'data': {'type': 'example', 'attributes': {'id': 'f60717a3-7dc2-4f1a-bdf4-f2804c3127a4'}},
+        })
+
+        assert response.status_code == 400
+        assert self.ExampleListView.calls == []
+
+    def test_invalid_data(self, jsonapi_client):
+        response = jsonapi_client.patch('/examples/?filter[body]=old', json={
+            'data': {'type': 'other', 'attributes': {'body': 'new'}},
+        })
+
+        assert response.status_code == 422
+        assert self.ExampleListView.calls == []
+
+    def test_bulk_operations_are_opt_in(self, api, jsonapi_client):
+        api.route(self.ExampleListView, 'other_list', '/others/', view_kwargs={
+            'filter_schema': self.ExampleFiltersSchema(), 'bulk_operations': False})
+
+        assert jsonapi_client.delete('/others/?filter[body]=old').status_code == 405
+        assert self.ExampleListView.calls == []
+
+    def test_action_is_not_allowed(self, api, jsonapi_client):
+        api.route(self.ExampleListView, 'other_list', '/others/', view_kwargs={
+            'filter_schema': self.ExampleFiltersSchema(), 'allowed_actions': (resources.Actions.update_many,)})
+
+        response = jsonapi_client.delete('/others/?filter[body]=old')
+
+        assert response.status_code == 405
+        assert response.get_json(force=True)['errors'][0]['detail'] == 'Delete list is not allowed for this resource'
+        assert self.ExampleListView.calls == []
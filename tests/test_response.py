@@ -30,3 +30,56 @@ def test_jsonapi_error_response(app):
                 }
             ]
         }
+
+
+def test_jsonapi_list_response_with_positional_headers(app):
+    with app.test_request_context('/examples/'):
+        list_response = response.JsonApiListResponse({'data': []}, {}, {'X-Example': 'yes'}).make_response()
+        assert list_response.headers['X-Example'] == 'yes'
+        assert json.loads(list_response.data)['meta'] == {'count': 0}
+
+
+def test_jsonapi_streaming_list_response(app):
+    included = {}
+
+    def generate_resource_objects():
+        yield {'type': 'example', 'id': '1'}
+        included[('author', '1')] = {'type': 'author', 'id': '1'}
+        yield {'type': 'example', 'id': '2'}
+
+    with app.test_request_context('/examples/'):
+        list_response = response.JsonApiStreamingListResponse(
+            {'data': generate_resource_objects(), 'included': included.values()},
+            count=2,
+            links={'self': 'http://localhost/examples/'},
+        ).make_response()
+        assert list_response.is_streamed
+        assert json.loads(list_response.get_data(as_text=True)) == {
+            'data': [
+                {'type': 'example', 'id': '1'},
+                {'type': 'example', 'id': '2'},
+            ],
+            'included': [
+                {'type': 'author', 'id': '1'},
+            ],
+            'links': {
+                'self': 'http://localhost/examples/'
+            },
+            'meta': {
+                'count': 2
+            },
+            'jsonapi': {
+                'version': '1.0'
+            }
+        }
+
+
+def test_jsonapi_streaming_list_response_uses_jsonapi_object(app):
+    class ExtendedStreamingListResponse(response.JsonApiStreamingListResponse):
+        jsonapi_object = {'version': '1.1', 'meta': {'build': 'example'}}
+
+    with app.test_request_context('/examples/'):
+        list_response = ExtendedStreamingListResponse({'data': iter([])}, count=0).make_response()
+        assert json.loads(list_response.get_data(as_text=True))['jsonapi'] == {
+            'version': '1.1', 'meta': {'build': 'example'},
+        }
@@ -0,0 +1,103 @@
+import collections
+
+import marshmallow_jsonapi
+
+from marshmallow_jsonapi import fields
+
+from flask_jsonapi import schema_cache
+
+Author = collections.namedtuple('Author', 'id name')
+Article = collections.namedtuple('Article', 'id title author')
+Category = collections.namedtuple('Category', 'id name parent')
+
+
+class AuthorSchema(marshmallow_jsonapi.Schema):
+    id = fields.Str()
+    name = fields.Str()
+
+    class Meta:
+        type_ = 'author'
+
+
+class ArticleSchema(marshmallow_jsonapi.Schema):
+    id = fields.Str()
+    title = fields.Str()
+    author = fields.Relationship(schema=AuthorSchema, type_='author')
+
+    class Meta:
+        type_ = 'article'
+
+
+class CategorySchema(marshmallow_jsonapi.Schema):
+    id = fields.Str()
+    name = fields.Str()
+    parent = fields.Relationship(schema='self', type_='category', allow_none=True)
+
+    class Meta:
+        type_ = 'category'
+
+
+class TestSchemaCache:
+    def test_reuses_instance_for_same_shape(self):
+        cache = schema_cache.SchemaCache()
+
+        with cache.get(ArticleSchema, many=True, only=('title', 'id')) as first:
+            pass
+        with cache.get(ArticleSchema, many=True, only=('id', 'title', 'id')) as second:
+            pass
+
+        assert first is second
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_different_shapes_are_cached_separately(self):
+        cache = schema_cache.SchemaCache()
+
+        with cache.get(ArticleSchema, many=True) as first:
+            pass
+        with cache.get(ArticleSchema, many=False) as second:
+            pass
+
+        assert first is not second
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_nested_checkouts_get_separate_instances(self):
+        cache = schema_cache.SchemaCache()
+
+        with cache.get(ArticleSchema) as first:
+            with cache.get(ArticleSchema) as second:
+                assert first is not second
+
+    def test_least_recently_used_shape_is_evicted(self):
+        cache = schema_cache.SchemaCache(maxsize=1)
+
+        with cache.get(ArticleSchema, many=True):
+            pass
+        with cache.get(ArticleSchema, many=False):
+            pass
+        with cache.get(ArticleSchema, many=True):
+            pass
+
+        assert (cache.hits, cache.misses) == (0, 3)
+
+    def test_included_data_does_not_leak_between_dumps(self):
+        cache = schema_cache.SchemaCache()
+        first_article = Article(id='1', title='First', author=Author(id='1', name='Anna'))
+        second_article = Article(id='2', title='Second', author=Author(id='2', name='Bob'))
+
+        with cache.get(ArticleSchema, include_data=('author',)) as schema:
+            schema.dump(first_article)
+        with cache.get(ArticleSchema, include_data=('author',)) as schema:
+            result = schema.dump(second_article)
+
+        assert [item['id'] for item in result['included']] == ['2']
+
+    def test_self_referential_relationship(self):
+        cache = schema_cache.SchemaCache()
+        root = Category(id='1', name='Root', parent=None)
+
+        for child in (Category(id='2', name='Child', parent=root), Category(id='3', name='Other', parent=root)):
+            with cache.get(CategorySchema, include_data=('parent',)) as schema:
+                result = schema.dump(child)
+
+        assert result['data']['relationships']['parent']['data'] == {'type': 'category', 'id': '1'}
+        assert [item['id'] for item in result['included']] == ['1']
@@ -0,0 +1,77 @@
+import marshmallow_jsonapi
+import pytest
+
+from marshmallow_jsonapi import fields
+
+from flask_jsonapi import schema_metadata
+
+
+class CompanySchema(marshmallow_jsonapi.Schema):
+    id = fields.Str()
+    name = fields.Str()
+
+    class Meta:
+        type_ = 'company'
+
+
+class PersonSchema(marshmallow_jsonapi.Schema):
+    id = fields.Str()
+    full_name = fields.Str(attribute='name')
+    company = fields.Relationship(schema=CompanySchema, type_='company', attribute='employer')
+    manager = fields.Relationship(schema='self', type_='person')
+    articles = fields.Relationship(schema='MetadataArticleSchema', type_='article', many=True)
+    unknown = fields.Relationship(type_='unknown')
+
+    class Meta:
+        type_ = 'person'
+
+
+class MetadataArticleSchema(marshmallow_jsonapi.Schema):
+    id = fields.Str()
+    author = fields.Relationship(schema=PersonSchema, type_='person')
+
+    class Meta:
+        type_ = 'article'
+
+
+class TestSchemaMetadata:
+    def test_metadata(self):
+        metadata = schema_metadata.get_metadata(PersonSchema)
+        assert metadata.type_ == 'person'
+        assert metadata.model_attributes['full_name'] == 'name'
+        assert metadata.model_attributes['company'] == 'employer'
+        assert set(metadata.relationships) == {'company', 'manager', 'articles', 'unknown'}
+        assert dict(metadata.sort_fields) == {'id': 'id', 'full_name': 'name'}
+
+    def test_metadata_is_built_once_per_schema(self):
+        assert schema_metadata.get_metadata(PersonSchema) is schema_metadata.get_metadata(PersonSchema)
+        assert schema_metadata.get_metadata(PersonSchema()) is schema_metadata.get_metadata(PersonSchema)
+
+    def test_metadata_is_read_only(self):
+        with pytest.raises(TypeError):
+            schema_metadata.get_metadata(PersonSchema).model_attributes['id'] = 'pk'
+
+    def test_related_schema(self):
+        metadata = schema_metadata.get_metadata(PersonSchema)
+        assert metadata.get_related_schema('company') is CompanySchema
+        assert metadata.get_related_schema('manager') is PersonSchema
+        assert metadata.get_related_schema('articles') is MetadataArticleSchema
+        assert metadata.get_related_schema('unknown') is None
+
+    @pytest.mark.parametrize('include_path', ['company', 'manager.company', 'articles.author.articles', ''])
+    def test_valid_include_path(self, include_path):
+        schema_metadata.get_metadata(PersonSchema).check_include_path(include_path)
+
+    @pytest.mark.parametrize('include_path', [
+        'employer',
+        'full_name',
+        'company.name',
+        'articles.writer',
+        'unknown.company',
+    ])
+    def test_invalid_include_path_matches_check_relations(self, include_path):
+        with pytest.raises(ValueError) as expected:
+            PersonSchema().check_relations([include_path])
+        with pytest.raises(ValueError) as error:
+            schema_metadata.get_metadata(PersonSchema).check_include_path(include_path)
+        assert str(error.value) == str(expected.value)